@@ -1,12 +1,21 @@
 # kai_klock.py  •  v2.4 “Step Resonance”  (KKS v1 grid parity)
 from __future__ import annotations
 
+import functools
 import math
+import os
+from bisect import bisect_right
 from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
 from typing import Dict, Optional, Union, List
-from decimal import Decimal, getcontext, ROUND_FLOOR
+from decimal import (
+    Context, Decimal, DivisionByZero, InvalidOperation, Overflow, ROUND_CEILING, ROUND_FLOOR, localcontext,
+)
 
-from kai_klock_models import KaiKlockResponse, ChakraStep
+from pydantic import BaseModel, create_model
+
+from kai_klock_format import compile_kai_format
+from kai_klock_models import KaiKlockResponse, KaiLite
 
 # ════════════════════════════════════════════════════════════════
 #  Kai-Klock Harmonic Timestamp System  •  v2.4 “Step Resonance”
@@ -20,17 +29,32 @@ from kai_klock_models import KaiKlockResponse, ChakraStep
 # ── Constants ───────────────────────────────────────────────────
 PHI = (1 + math.sqrt(5)) / 2  # compatibility
 
-getcontext().prec = 60
-getcontext().rounding = ROUND_FLOOR
+# Engine-owned arithmetic context. Decimal contexts are per-thread, so the
+# engine never relies on getcontext(): every Decimal operation runs under this
+# context (explicit context= or localcontext), identical in any thread/process.
+KAI_DECIMAL_CONTEXT = Context(
+    prec=60,
+    rounding=ROUND_FLOOR,
+    traps=[InvalidOperation, DivisionByZero, Overflow],
+)
+
+def _kai_decimal(fn):
+    """Run fn under a private copy of KAI_DECIMAL_CONTEXT."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with localcontext(KAI_DECIMAL_CONTEXT):
+            return fn(*args, **kwargs)
+    return wrapper
 
 # φ-exact breath (pulse duration) — 3 + √5
-KAI_PULSE_DURATION_DEC = Decimal(3) + Decimal(5).sqrt()
+KAI_PULSE_DURATION_DEC = KAI_DECIMAL_CONTEXT.add(Decimal(3), Decimal(5).sqrt(KAI_DECIMAL_CONTEXT))
 KAI_PULSE_DURATION = float(KAI_PULSE_DURATION_DEC)  # compatibility only
 
 # Sunrise anchor
 SOLAR_GENESIS_UTC_MS = 1715400806000  # 2024-05-11T04:13:26.000Z
 ETERNAL_GENESIS_PULSE = datetime(2024, 5, 10, 6, 45, 41, 888000, tzinfo=timezone.utc)  # 1715323541888 ms
 genesis_sunrise       = datetime(2024, 5, 11, 4, 13, 26, 0, tzinfo=timezone.utc)
+ETERNAL_GENESIS_UNIX_US = 1_715_323_541_888_000  # ETERNAL_GENESIS_PULSE as unix μs
 
 # ── μpulse canon (1 pulse = 1,000,000 μpulses) ──────────────────
 UPULSES_PER_PULSE = 1_000_000
@@ -51,9 +75,9 @@ UPULSES_PER_GRID_DAY  = GRID_PULSES_PER_DAY  * UPULSES_PER_PULSE
 HARMONIC_DAY_PULSES_DEC   = Decimal("17491.270421")
 HARMONIC_MONTH_DAYS       = 42
 HARMONIC_YEAR_DAYS        = 336
-HARMONIC_MONTH_PULSES_DEC = HARMONIC_DAY_PULSES_DEC * Decimal(HARMONIC_MONTH_DAYS)
-HARMONIC_YEAR_PULSES_DEC  = HARMONIC_MONTH_PULSES_DEC * Decimal(8)
-HARMONIC_WEEK_PULSES_DEC  = HARMONIC_DAY_PULSES_DEC * Decimal(6)
+HARMONIC_MONTH_PULSES_DEC = KAI_DECIMAL_CONTEXT.multiply(HARMONIC_DAY_PULSES_DEC, HARMONIC_MONTH_DAYS)
+HARMONIC_YEAR_PULSES_DEC  = KAI_DECIMAL_CONTEXT.multiply(HARMONIC_MONTH_PULSES_DEC, 8)
+HARMONIC_WEEK_PULSES_DEC  = KAI_DECIMAL_CONTEXT.multiply(HARMONIC_DAY_PULSES_DEC, 6)
 
 # Steps (grid truth)
 PULSES_PER_STEP = GRID_PULSES_PER_STEP    # 11
@@ -64,11 +88,13 @@ CHAKRA_BEATS_PER_DAY = GRID_BEATS_PER_DAY # 36
 def _ensure_utc(dt: datetime) -> datetime:
     return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
 
+@_kai_decimal
 def _dec_total_seconds(d: timedelta) -> Decimal:
     return (Decimal(d.days) * Decimal(86400)
             + Decimal(d.seconds)
             + (Decimal(d.microseconds) / Decimal(1_000_000)))
 
+@_kai_decimal
 def mu_since_genesis(at: datetime) -> int:
     """Exact Chronos→μpulses: floor((seconds / (3+√5)) * 1e6)."""
     at = _ensure_utc(at)
@@ -95,19 +121,127 @@ def solar_window_mu(now: datetime) -> tuple[int, int, int, int]:
     mu_next = mu_last + UPULSES_PER_DAY
     return mu_last, mu_next, mu_now, int(solar_day_index)
 
+# ── Integer engine (scaled-integer φ breath; Decimal path stays the reference) ──
+# KAI_PULSE_DURATION_DEC carries 60 significant digits, so as a scaled integer it
+# is exact: 3+√5 = KAI_PULSE_SCALED / KAI_PULSE_SCALE. The Decimal reference
+# truncates (ROUND_FLOOR) at 60 digits, far below the μpulse floor, and nested
+# floors compose, so floor(μs × SCALE / SCALED) is bit-identical to it.
+KAI_PULSE_SCALE  = 10 ** -KAI_PULSE_DURATION_DEC.as_tuple().exponent
+KAI_PULSE_SCALED = int(KAI_PULSE_DURATION_DEC.scaleb(-KAI_PULSE_DURATION_DEC.as_tuple().exponent, KAI_DECIMAL_CONTEXT))
+
+# Reciprocal R = floor(2^96 × SCALE / SCALED). For 0 <= a < 2^96 the estimate
+# (a × R) >> 96 undershoots the exact quotient by less than a / 2^96 < 1, so it
+# is either exact or one short, and one short is only possible when the low
+# 96 bits land within `a` of a carry. Any datetime spans |μs| < 2^59.
+_RECIP_SHIFT = 96
+_RECIP_MASK  = (1 << _RECIP_SHIFT) - 1
+_RECIP_PULSE = (KAI_PULSE_SCALE << _RECIP_SHIFT) // KAI_PULSE_SCALED
+
+_US = timedelta(microseconds=1)
+
+def _floor_us_to_mu(a: int) -> int:
+    """floor(a / (3+√5)) for 0 <= a < 2^96 (a in Chronos μs → μpulses)."""
+    t = a * _RECIP_PULSE
+    q = t >> _RECIP_SHIFT
+    if (t & _RECIP_MASK) >= _RECIP_MASK - a and (q + 1) * KAI_PULSE_SCALED <= a * KAI_PULSE_SCALE:
+        q += 1
+    return q
+
+def mu_from_us_since_genesis(us_since_genesis: int) -> int:
+    """Exact Chronos μs since genesis → μpulses using integers only."""
+    if us_since_genesis >= 0:
+        return _floor_us_to_mu(us_since_genesis)
+    a = -us_since_genesis
+    q = _floor_us_to_mu(a)
+    return -q if q * KAI_PULSE_SCALED == a * KAI_PULSE_SCALE else -q - 1
+
+def mu_since_genesis_int(at: datetime) -> int:
+    """Integer-only twin of mu_since_genesis (bit-identical results)."""
+    return mu_from_us_since_genesis((_ensure_utc(at) - ETERNAL_GENESIS_PULSE) // _US)
+
+def _trunc_mod(a: int, m: int) -> int:
+    """Remainder with the sign of the dividend (Decimal % semantics)."""
+    r = abs(a) % m
+    return -r if a < 0 else r
+
+def _fmt_micro(v: int) -> str:
+    """Fixed 6-place string for a value held in millionths (matches quantize(q))."""
+    return f"{v // 1_000_000}.{v % 1_000_000:06d}"
+
+MU_SUNRISE0 = mu_since_genesis_int(genesis_sunrise)
+
+# μpulse periods of the φ calendar (HARMONIC_*_PULSES_DEC × 10^6, exact)
+UPULSES_PER_WEEK  = UPULSES_PER_DAY * 6
+UPULSES_PER_MONTH = UPULSES_PER_DAY * HARMONIC_MONTH_DAYS
+UPULSES_PER_YEAR  = UPULSES_PER_DAY * HARMONIC_YEAR_DAYS
+
+# ── Inverse (Kai → Chronos): first instant a μpulse coordinate is reached ──
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_UNIT_US = {"ms": 1_000, "us": 1}
+
+def us_since_genesis_at_mu(mu: int) -> int:
+    """Smallest μs offset u with floor(u / (3+√5)) >= mu, i.e. ceil(mu × (3+√5))."""
+    return -((-mu * KAI_PULSE_SCALED) // KAI_PULSE_SCALE)
+
+def unix_at_mu(mu: int, unit: str = "ms") -> int:
+    """First unix ms/μs at which mu_since_genesis reaches `mu` (consistent with its floor)."""
+    try:
+        scale = _UNIT_US[unit]
+    except KeyError:
+        raise ValueError(f"unit must be one of {sorted(_UNIT_US)}, got {unit!r}") from None
+    us = ETERNAL_GENESIS_UNIX_US + us_since_genesis_at_mu(mu)
+    return -(-us // scale)
+
+def datetime_at_mu(mu: int) -> datetime:
+    """First UTC datetime (μs resolution) at which mu_since_genesis reaches `mu`."""
+    return ETERNAL_GENESIS_PULSE + timedelta(microseconds=us_since_genesis_at_mu(mu))
+
+def kai_day_index(year: int, month: int, day: int) -> int:
+    """Day count since genesis for calendar Y/M/D (Y 0-based as in seals, M 1..8, D 1..42)."""
+    if not 1 <= month <= 8:
+        raise ValueError(f"month must be 1..8, got {month}")
+    if not 1 <= day <= HARMONIC_MONTH_DAYS:
+        raise ValueError(f"day must be 1..{HARMONIC_MONTH_DAYS}, got {day}")
+    return year * HARMONIC_YEAR_DAYS + (month - 1) * HARMONIC_MONTH_DAYS + (day - 1)
+
+def mu_at_grid(day_index: int, beat: int = 0, step: int = 0, frame: str = "eternal") -> int:
+    """
+    First μpulse at which Beat:Step of φ-day `day_index` is reported.
+      • eternal — day_index counts from genesis; the calendar day (whole pulses)
+        must also have turned, so the later of both boundaries is returned.
+      • solar   — day_index counts sunrise-anchored days from genesis_sunrise.
+    """
+    if not 0 <= beat < GRID_BEATS_PER_DAY:
+        raise ValueError(f"beat must be 0..{GRID_BEATS_PER_DAY - 1}, got {beat}")
+    if not 0 <= step < GRID_STEPS_PER_BEAT:
+        raise ValueError(f"step must be 0..{GRID_STEPS_PER_BEAT - 1}, got {step}")
+    mu_grid = beat * UPULSES_PER_GRID_BEAT + step * UPULSES_PER_GRID_STEP
+    # smallest x with (x × GRID_DAY) // DAY >= mu_grid  (inverse of _mu_project_to_grid)
+    mu_offset = -((-mu_grid * UPULSES_PER_DAY) // UPULSES_PER_GRID_DAY)
+    if frame == "solar":
+        return MU_SUNRISE0 + day_index * UPULSES_PER_DAY + mu_offset
+    if frame != "eternal":
+        raise ValueError(f"frame must be 'eternal' or 'solar', got {frame!r}")
+    mu_calendar_day = -((-day_index * UPULSES_PER_DAY) // UPULSES_PER_PULSE) * UPULSES_PER_PULSE
+    return max(day_index * UPULSES_PER_DAY + mu_offset, mu_calendar_day)
+
 # ── Subdivisions (derived from φ breath) ────────────────────────
+SUBDIVISION_DIVISORS: Dict[str, int] = {
+    "halfPulse": 2,
+    "chakraSubpulse": 11,
+    "ternaryStep": 33,
+    "microStep": 55,
+    "nanoPulse": 89,
+    "nanoStep": 144,
+    "phiQuantum": 233,
+    "ekaru": 377,
+    "tzaphirimUnit": 610,
+    "kaiSingularity": 987,
+    "deepThread": 1597,
+}
 SUBDIVISIONS: dict[str, Decimal] = {
-    "halfPulse":      KAI_PULSE_DURATION_DEC / Decimal(2),
-    "chakraSubpulse": KAI_PULSE_DURATION_DEC / Decimal(11),
-    "ternaryStep":    KAI_PULSE_DURATION_DEC / Decimal(33),
-    "microStep":      KAI_PULSE_DURATION_DEC / Decimal(55),
-    "nanoPulse":      KAI_PULSE_DURATION_DEC / Decimal(89),
-    "nanoStep":       KAI_PULSE_DURATION_DEC / Decimal(144),
-    "phiQuantum":     KAI_PULSE_DURATION_DEC / Decimal(233),
-    "ekaru":          KAI_PULSE_DURATION_DEC / Decimal(377),
-    "tzaphirimUnit":  KAI_PULSE_DURATION_DEC / Decimal(610),
-    "kaiSingularity": KAI_PULSE_DURATION_DEC / Decimal(987),
-    "deepThread":     KAI_PULSE_DURATION_DEC / Decimal(1597),
+    name: KAI_DECIMAL_CONTEXT.divide(KAI_PULSE_DURATION_DEC, n)
+    for name, n in SUBDIVISION_DIVISORS.items()
 }
 RESONANT_NAMES = {
     "halfPulse": "Pulse Divider",
@@ -123,6 +257,29 @@ RESONANT_NAMES = {
     "deepThread": "Deep Thread",
 }
 
+# Pulse-independent part of each subdivision (duration, frequency, wavelengths)
+@_kai_decimal
+def _subdivision_constants() -> MappingProxyType:
+    table = {}
+    for name, duration_dec in SUBDIVISIONS.items():
+        freq = Decimal(1) / duration_dec
+        table[name] = MappingProxyType({
+            "duration": float(duration_dec),
+            "frequencyHz": float(freq),
+            "wavelengthSound_m": float(Decimal(343) / freq),
+            "wavelengthLight_m": float(Decimal(299_792_458) / freq),
+            "resonantName": RESONANT_NAMES[name],
+        })
+    return MappingProxyType(table)
+
+SUBDIVISION_CONSTANTS = _subdivision_constants()
+
+# count = pulses × 3+√5 s ÷ (3+√5 s / n). The 60-digit Decimal quotient is
+# within 1e-58 (relative) of the integer pulses × n, so its float is that
+# integer whenever |pulses × n| < 2^53; beyond that, fall back to Decimal.
+SUBDIVISION_COUNT_EXACT_LIMIT = 1 << 53
+
+@_kai_decimal
 def compute_subdivision_counts(kai_pulse_eternal: int) -> dict[str, dict[str, Decimal]]:
     seconds_elapsed = Decimal(kai_pulse_eternal) * KAI_PULSE_DURATION_DEC
     out: dict[str, dict[str, Decimal]] = {}
@@ -130,38 +287,51 @@ def compute_subdivision_counts(kai_pulse_eternal: int) -> dict[str, dict[str, De
         out[name] = {"duration": duration, "count": seconds_elapsed / duration}
     return out
 
+def subdivision_count_floats(kai_pulse_eternal: int) -> Dict[str, float]:
+    """float(count) of every subdivision at an eternal pulse (as in /kai)."""
+    pulse = int(kai_pulse_eternal)
+    if abs(pulse) * max(SUBDIVISION_DIVISORS.values()) < SUBDIVISION_COUNT_EXACT_LIMIT:
+        return {name: float(pulse * n) for name, n in SUBDIVISION_DIVISORS.items()}
+    return {name: float(c["count"]) for name, c in compute_subdivision_counts(pulse).items()}
+
 def build_subdivisions_live(kai_pulse_eternal: int) -> Dict[str, Dict[str, Union[float, str]]]:
-    seconds_elapsed = Decimal(kai_pulse_eternal) * KAI_PULSE_DURATION_DEC
-    out: Dict[str, Dict[str, Union[float, str]]] = {}
-    for name, duration_dec in SUBDIVISIONS.items():
-        freq = Decimal(1) / duration_dec
-        count = seconds_elapsed / duration_dec
-        wavelength_sound = Decimal(343) / freq
-        wavelength_light = Decimal(299_792_458) / freq
-        out[name] = {
-            "duration": float(duration_dec),
-            "count": float(count),
-            "frequencyHz": float(freq),
-            "wavelengthSound_m": float(wavelength_sound),
-            "wavelengthLight_m": float(wavelength_light),
-            "resonantName": RESONANT_NAMES[name],
-        }
-    return out
+    counts = subdivision_count_floats(kai_pulse_eternal)
+    return {
+        name: {"duration": const["duration"], "count": counts[name], **const}
+        for name, const in SUBDIVISION_CONSTANTS.items()
+    }
 
 # ── Epoch scaffolding ───────────────────────────────────────────
+# Spiral level L(n) = max k ≤ 512 with φ^k ≤ n, φ^k evaluated in the engine
+# context. For integer n that is φ^k ≤ n ⇔ ⌈φ^k⌉ ≤ n, so the powers are
+# reduced once to integer entry pulses and levels are looked up by bisect.
+PHI_SPIRAL_MAX_LEVEL = 512
+
+@functools.lru_cache(maxsize=None)
+@_kai_decimal
+def _phi_level_thresholds() -> tuple:
+    """⌈φ^k⌉ for k = 0..PHI_SPIRAL_MAX_LEVEL: the first pulse of spiral level k."""
+    phi_dec = (Decimal(1) + Decimal(5).sqrt()) / Decimal(2)
+    return tuple(
+        int((phi_dec ** Decimal(k)).to_integral_value(rounding=ROUND_CEILING))
+        for k in range(PHI_SPIRAL_MAX_LEVEL + 1)
+    )
+
 def _floor_log_phi(n: int) -> int:
     if n <= 1:
         return 0
-    phi_dec = (Decimal(1) + Decimal(5).sqrt()) / Decimal(2)
-    N = Decimal(n)
-    lo, hi = 0, 512
-    while lo < hi:
-        mid = (lo + hi + 1) // 2
-        if (phi_dec ** Decimal(mid)) <= N:
-            lo = mid
-        else:
-            hi = mid - 1
-    return lo
+    return bisect_right(_phi_level_thresholds(), n) - 1
+
+def phi_spiral_level_start(level: int) -> int:
+    """First eternal pulse at which the φ-spiral level is `level` (1..512)."""
+    if not 1 <= level <= PHI_SPIRAL_MAX_LEVEL:
+        raise ValueError(f"level must be in 1..{PHI_SPIRAL_MAX_LEVEL}, got {level}")
+    return _phi_level_thresholds()[level]
+
+def next_phi_spiral_pulse(kai_pulse_eternal: int) -> Optional[int]:
+    """Eternal pulse at which the next φ-spiral level begins (None past level 512)."""
+    level = _floor_log_phi(kai_pulse_eternal)
+    return None if level >= PHI_SPIRAL_MAX_LEVEL else phi_spiral_level_start(level + 1)
 
 EPOCHS_PHI = [
     (0, "Eternal Year", "The root of solar-aligned Kairos time (8 months × 7 weeks)"),
@@ -174,25 +344,32 @@ EPOCHS_PHI = [
     (21, "One Breath of Erah Voh", "Lightbody spiral completion and remembrance of divine origin"),
 ]
 
-def generate_phi_spiral_epochs(kai_pulse_eternal: int) -> List[Dict]:
-    powers = [0, 1, 2, 3, 5, 8, 13, 21]
-    labels = ["Eternal Year","Phi Epok","Phi Resonanse Epok","Tri-Spiral Gate",
-              "Great Harmonic Ring","Kai-Cycle of Return","Solar Spiral Era","One Breath of Erah Voh"]
-    descriptions = [e[2] for e in EPOCHS_PHI]
-    base = HARMONIC_YEAR_PULSES_DEC
+@functools.lru_cache(maxsize=None)
+@_kai_decimal
+def _phi_epoch_table() -> tuple:
+    """Constant part of each epoch: (name, power, pulses, pulses as Decimal, approxDays, description)."""
     phi_dec = (Decimal(1) + Decimal(5).sqrt()) / Decimal(2)
-    spiral_epochs: List[Dict] = []
-    for i, p in enumerate(powers):
-        pulses_dec = base * (phi_dec ** Decimal(p))
+    table = []
+    for p, name, description in EPOCHS_PHI:
+        pulses_dec = HARMONIC_YEAR_PULSES_DEC * (phi_dec ** Decimal(p))
         pulses_int = int(pulses_dec.to_integral_value(rounding=ROUND_FLOOR))
-        kai_until = max(pulses_int - int(kai_pulse_eternal), 0)
         approx_days = (Decimal(pulses_int) * KAI_PULSE_DURATION_DEC) / Decimal(86400)
+        table.append((name, p, pulses_int, Decimal(pulses_int), float(approx_days), description))
+    return tuple(table)
+
+@_kai_decimal
+def generate_phi_spiral_epochs(kai_pulse_eternal: int) -> List[Dict]:
+    pulse = int(kai_pulse_eternal)
+    pulse_dec = Decimal(kai_pulse_eternal)
+    spiral_epochs: List[Dict] = []
+    for name, p, pulses_int, pulses_dec, approx_days, description in _phi_epoch_table():
+        kai_until = max(pulses_int - pulse, 0)
         days_until = (Decimal(kai_until) * KAI_PULSE_DURATION_DEC) / Decimal(86400)
-        percent_until = (Decimal(kai_pulse_eternal) / Decimal(pulses_int)) * Decimal(100) if pulses_int else Decimal(0)
+        percent_until = (pulse_dec / pulses_dec) * Decimal(100) if pulses_int else Decimal(0)
         spiral_epochs.append({
-            "name": labels[i], "phiPower": p, "kaiPulses": pulses_int,
-            "approxDays": str(approx_days), "description": descriptions[i],
-            "kaiUntil": kai_until, "daysUntil": str(days_until), "percentUntil": str(percent_until),
+            "name": name, "phiPower": p, "kaiPulses": pulses_int,
+            "approxDays": approx_days, "description": description,
+            "kaiUntil": kai_until, "daysUntil": float(days_until), "percentUntil": float(percent_until),
         })
     return spiral_epochs
 
@@ -275,11 +452,12 @@ def _mu_project_to_grid(mu_in_phi_day: int) -> int:
     return (mu_in_phi_day * UPULSES_PER_GRID_DAY) // UPULSES_PER_DAY
 
 # ════════════════════════════════════════════════════════════════
-#  Main generator (KKS v1 grid parity for beats/steps)
+#  Numeric state engines (same keys; payload-ready values)
+#   • "decimal" — 60-digit ROUND_FLOOR reference
+#   • "int"     — Python ints only; bit-identical to the reference
 # ════════════════════════════════════════════════════════════════
-def get_eternal_klock(now: Optional[datetime] = None) -> KaiKlockResponse:
-    now = _ensure_utc(now or datetime.utcnow())
-
+@_kai_decimal
+def _kai_state_decimal(now: datetime) -> dict:
     # μpulse windowing
     mu_last, mu_next, mu_now, solar_day_index = solar_window_mu(now)
     mu_span = UPULSES_PER_DAY
@@ -315,29 +493,12 @@ def get_eternal_klock(now: Optional[datetime] = None) -> KaiKlockResponse:
 
     solar_grid_pulses_into_beat_dec = Decimal(mu_in_beat_solar) / Decimal(UPULSES_PER_PULSE)      # 0..484
     solar_percent_into_step_dec     = (Decimal(mu_in_step_solar) / Decimal(UPULSES_PER_GRID_STEP)) * Decimal(100)
-    solar_percent_of_beat_dec       = (Decimal(mu_in_beat_solar) / Decimal(UPULSES_PER_GRID_BEAT)) * Decimal(100)
 
     # Clamp + tidy percentages
     q = Decimal("0.000001")
     eternal_percent_into_step_dec = min(Decimal("99.999999"), max(Decimal(0), eternal_percent_into_step_dec)).quantize(q)
     eternal_percent_of_beat_dec   = min(Decimal("99.999999"), max(Decimal(0), eternal_percent_of_beat_dec)).quantize(q)
     solar_percent_into_step_dec   = min(Decimal("99.999999"), max(Decimal(0), solar_percent_into_step_dec)).quantize(q)
-    solar_percent_of_beat_dec     = min(Decimal("99.999999"), max(Decimal(0), solar_percent_of_beat_dec)).quantize(q)
-
-    # Strings / objects
-    chakra_step_str   = f"{eternal_beat_idx}:{eternal_step_idx:02d}"
-    solar_step_string = f"{solar_beat_idx}:{solar_step_idx:02d}"
-
-    chakra_step_obj = ChakraStep(
-        stepIndex=eternal_step_idx,
-        percentIntoStep=str(eternal_percent_into_step_dec),
-        stepsPerBeat=STEPS_PER_BEAT,
-    )
-    solar_step_payload = ChakraStep(
-        stepIndex=solar_step_idx,
-        percentIntoStep=str(solar_percent_into_step_dec),
-        stepsPerBeat=STEPS_PER_BEAT,
-    )
 
     # ── Calendrics (φ durations; independent of grid) ───────────
     harmonic_day_count_dec = Decimal(kai_pulse_eternal) / HARMONIC_DAY_PULSES_DEC
@@ -345,246 +506,714 @@ def get_eternal_klock(now: Optional[datetime] = None) -> KaiKlockResponse:
     harmonic_year_idx      = int((Decimal(kai_pulse_eternal) / HARMONIC_YEAR_PULSES_DEC).to_integral_value(rounding=ROUND_FLOOR))
     harmonic_month_raw     = int((Decimal(kai_pulse_eternal) / HARMONIC_MONTH_PULSES_DEC).to_integral_value(rounding=ROUND_FLOOR))
 
-    eternal_year_name = ("Year of Eternal Restoration" if harmonic_year_idx == 0
-                         else "Year of Harmonik Embodiment" if harmonic_year_idx == 1
-                         else f"Year {harmonic_year_idx + 1}")
-    kai_turah_phrase  = KAI_TURAH_PHRASES[harmonic_year_idx % len(KAI_TURAH_PHRASES)]
-
-    eternal_month_idx = (harmonic_month_raw % 8) + 1
-    eternal_month     = ETERNAL_MONTH_NAMES[eternal_month_idx - 1]
-    harmonic_day      = HARMONIC_DAYS[harmonic_day_count % len(HARMONIC_DAYS)]
-
     arc_div_dec = HARMONIC_DAY_PULSES_DEC / Decimal(6)
     arc_idx         = int((Decimal(kai_pulse_today)         / arc_div_dec).to_integral_value(rounding=ROUND_FLOOR))
     eternal_arc_idx = int((Decimal(eternal_kai_pulse_today) / arc_div_dec).to_integral_value(rounding=ROUND_FLOOR))
-    arc_idx = min(5, arc_idx); eternal_arc_idx = min(5, eternal_arc_idx)
-    chakra_arc        = CHAKRA_ARCS[arc_idx]
-    eternal_chakra_arc= CHAKRA_ARCS[eternal_arc_idx]
-    solar_chakra_arc  = chakra_arc
-
-    # Solar calendar pieces
-    solar_day_of_month      = (solar_day_index % HARMONIC_MONTH_DAYS) + 1
-    solar_month_index       = ((solar_day_index // HARMONIC_MONTH_DAYS) % 8) + 1
-    solar_month_name        = ETERNAL_MONTH_NAMES[solar_month_index - 1]
-    solar_day_name          = HARMONIC_DAYS[solar_day_index % len(HARMONIC_DAYS)]
-    solar_month_description = ETERNAL_MONTH_DESCRIPTIONS[solar_month_name]
-    solar_day_description   = HARMONIC_DAY_DESCRIPTIONS[solar_day_name]
-    solar_harmonic_day      = HARMONIC_DAYS[solar_day_index % len(HARMONIC_DAYS)]
-    solar_week_index        = ((solar_day_index // 6) % 7) + 1
-    solar_week_name         = ETERNAL_WEEK_NAMES[(solar_day_index // 6) % 7]
-    solar_week_description  = ETERNAL_WEEK_DESCRIPTIONS[solar_week_name]
-
-    # Phi spiral level
-    phi_spiral_lvl = _floor_log_phi(kai_pulse_eternal)
 
     # Month/day progress (φ durations)
     pulses_into_month_dec = Decimal(kai_pulse_eternal) % HARMONIC_MONTH_PULSES_DEC
     days_elapsed_dec = pulses_into_month_dec / HARMONIC_DAY_PULSES_DEC
     days_elapsed = int(days_elapsed_dec.to_integral_value(rounding=ROUND_FLOOR))
     has_partial_day = (pulses_into_month_dec % HARMONIC_DAY_PULSES_DEC) > 0
-    days_remaining = max(0, HARMONIC_MONTH_DAYS - days_elapsed - (1 if has_partial_day else 0))
     month_percent_dec = (pulses_into_month_dec / HARMONIC_MONTH_PULSES_DEC) * Decimal(100)
 
-    week_idx_raw = days_elapsed // 6
-    week_idx = week_idx_raw + 1
-    week_name = ETERNAL_WEEK_NAMES[week_idx_raw]
-    eternal_week_description = ETERNAL_WEEK_DESCRIPTIONS.get(week_name, "")
-    day_of_month = days_elapsed + 1
-
     pulses_into_week_dec = Decimal(kai_pulse_eternal) % HARMONIC_WEEK_PULSES_DEC
     week_day_idx = int((pulses_into_week_dec / HARMONIC_DAY_PULSES_DEC).to_integral_value(rounding=ROUND_FLOOR)) % len(HARMONIC_DAYS)
     week_day_percent_dec = ((pulses_into_week_dec / HARMONIC_WEEK_PULSES_DEC) * Decimal(100)).quantize(q)
 
     pulses_into_year_dec = Decimal(kai_pulse_eternal) % HARMONIC_YEAR_PULSES_DEC
     year_percent_dec     = (pulses_into_year_dec / HARMONIC_YEAR_PULSES_DEC) * Decimal(100)
-    days_into_year       = harmonic_day_count % HARMONIC_YEAR_DAYS
-
-    # Seals / strings (grid beats)
-    solar_seal = f"Solar Kairos (UTC-aligned): {solar_step_string}"
-    eternal_seal = (
-        "Eternal Seal: "
-        f"Kairos:{chakra_step_str}, {harmonic_day}, {eternal_chakra_arc} Ark • D{day_of_month}/M{eternal_month_idx} • "
-        f"Beat:{eternal_beat_idx}/36({str(eternal_percent_of_beat_dec)}%) Step:{eternal_step_idx}/44 "
-        f"Kai(Today):{eternal_kai_pulse_today} • "
-        f"Y{harmonic_year_idx} PS{phi_spiral_lvl} • {solar_seal} {solar_harmonic_day} "
-        f"D{solar_day_of_month}/M{solar_month_index}, {solar_chakra_arc} Ark  "
-        f"Beat:{solar_beat_idx}/36 Step:{solar_step_idx}/44 • "
-        f"Eternal Pulse:{kai_pulse_eternal}"
-    )
-    seal = f"Day Seal: {chakra_step_str} {str(eternal_percent_into_step_dec)}% • D{day_of_month}/M{eternal_month_idx}"
-    kairos = f"Kairos: {chakra_step_str}"
-
-    timestamp = (
-        f"↳{kairos}"
-        f"🕊️ {harmonic_day}(D{week_day_idx + 1}/6) • {eternal_month}(M{eternal_month_idx}/8) • "
-        f"{eternal_chakra_arc} Ark({eternal_arc_idx + 1}/6)\n • "
-        f"Day:{day_of_month}/42 • Week:({week_idx}/7)\n"
-        f" | Kai-Pulse (Today): {eternal_kai_pulse_today}\n"
-    )
 
-    narrative = (
-        f"In this moment of the Kai-Klock’s dual-day resonance, we are held within the sacred ark of {eternal_chakra_arc}, "
-        f"rooted through the harmonic foundation of {harmonic_day}.\n\n"
-        f"☀️ Solar Alignment: The living field synchronizes at Kai-Pulse {kai_pulse_today}, placing us in Spiral Beat {solar_beat_idx}, "
-        f"guided by Earth’s breath and solar koherense.\n\n"
-        f"🌕 Eternal Alignment: The timeless stream flows through Kai-Pulse {eternal_kai_pulse_today}, entering Spiral Beat {eternal_beat_idx}, "
-        f"{str(eternal_percent_of_beat_dec)}% complete — approaching the gateway of harmonic culmination.\n\n"
-        f"{eternal_seal}"
+    return {
+        "mu_now": mu_now,
+        "kai_pulse_eternal": kai_pulse_eternal,
+        "kai_pulse_today": kai_pulse_today,
+        "eternal_kai_pulse_today": eternal_kai_pulse_today,
+        "solar_day_index": solar_day_index,
+        "eternal_beat_idx": eternal_beat_idx,
+        "eternal_step_idx": eternal_step_idx,
+        "eternal_pulses_into_beat": str(eternal_grid_pulses_into_beat_dec),
+        "eternal_percent_into_step": str(eternal_percent_into_step_dec),
+        "eternal_percent_of_beat": str(eternal_percent_of_beat_dec),
+        "solar_beat_idx": solar_beat_idx,
+        "solar_step_idx": solar_step_idx,
+        "solar_pulses_into_beat": str(solar_grid_pulses_into_beat_dec),
+        "solar_percent_into_step": str(solar_percent_into_step_dec),
+        "harmonic_day_count": harmonic_day_count,
+        "harmonic_year_idx": harmonic_year_idx,
+        "harmonic_month_raw": harmonic_month_raw,
+        "arc_idx": min(5, arc_idx),
+        "eternal_arc_idx": min(5, eternal_arc_idx),
+        "days_elapsed": days_elapsed,
+        "has_partial_day": has_partial_day,
+        "month_percent": str(month_percent_dec),
+        "week_day_idx": week_day_idx,
+        "pulses_into_week": str(pulses_into_week_dec),
+        "week_day_percent": str(week_day_percent_dec),
+        "year_percent": str(year_percent_dec),
+        "arc_beat_percent": str((Decimal(kai_pulse_eternal % ARC_BEAT_PULSES) / Decimal(ARC_BEAT_PULSES)) * Decimal(100)),
+        "micro_cycle_percent": str((Decimal(kai_pulse_eternal % MICRO_CYCLE_PULSES) / Decimal(MICRO_CYCLE_PULSES)) * Decimal(100)),
+        "chakra_loop_percent": str((Decimal(kai_pulse_eternal % CHAKRA_LOOP_PULSES) / Decimal(CHAKRA_LOOP_PULSES)) * Decimal(100)),
+        "harmonic_day_percent": str((Decimal(eternal_kai_pulse_today) / HARMONIC_DAY_PULSES_DEC) * Decimal(100)),
+    }
+
+@functools.lru_cache(maxsize=256)
+def _pulse_state_int(kai_pulse_eternal: int) -> dict:
+    """Pulse layer of the int engine: φ-calendar fields fixed for the whole pulse."""
+    # Calendrics on whole pulses, scaled to μpulses so every period is an int
+    mu_whole = kai_pulse_eternal * UPULSES_PER_PULSE
+    mu_into_month = _trunc_mod(mu_whole, UPULSES_PER_MONTH)
+    mu_into_week  = _trunc_mod(mu_whole, UPULSES_PER_WEEK)
+    mu_into_year  = _trunc_mod(mu_whole, UPULSES_PER_YEAR)
+    return {
+        "kai_pulse_eternal": kai_pulse_eternal,
+        "harmonic_day_count": mu_whole // UPULSES_PER_DAY,
+        "harmonic_year_idx": mu_whole // UPULSES_PER_YEAR,
+        "harmonic_month_raw": mu_whole // UPULSES_PER_MONTH,
+        "days_elapsed": mu_into_month // UPULSES_PER_DAY,
+        "has_partial_day": _trunc_mod(mu_into_month, UPULSES_PER_DAY) > 0,
+        "month_percent": mu_into_month * 100 / UPULSES_PER_MONTH,
+        "week_day_idx": (mu_into_week // UPULSES_PER_DAY) % len(HARMONIC_DAYS),
+        "pulses_into_week": mu_into_week / UPULSES_PER_PULSE,
+        "week_day_percent": ((mu_into_week * 100_000_000) // UPULSES_PER_WEEK) / 1_000_000,
+        "year_percent": mu_into_year * 100 / UPULSES_PER_YEAR,
+        "arc_beat_percent": (kai_pulse_eternal % ARC_BEAT_PULSES) * 100 / ARC_BEAT_PULSES,
+        "micro_cycle_percent": (kai_pulse_eternal % MICRO_CYCLE_PULSES) * 100 / MICRO_CYCLE_PULSES,
+        "chakra_loop_percent": (kai_pulse_eternal % CHAKRA_LOOP_PULSES) * 100 / CHAKRA_LOOP_PULSES,
+    }
+
+def _eternal_state_int(mu_now: int) -> dict:
+    """μ layer of the int engine, eternal (genesis-anchored) day."""
+    mu_into_eternal_day = mu_now % UPULSES_PER_DAY
+    eternal_kai_pulse_today = mu_into_eternal_day // UPULSES_PER_PULSE
+    # Grid (KKS v1) — projection + indices are already exact integers
+    eternal_beat_idx, mu_in_beat_eternal = divmod(_mu_project_to_grid(mu_into_eternal_day), UPULSES_PER_GRID_BEAT)
+    eternal_step_idx, mu_in_step_eternal = divmod(mu_in_beat_eternal, UPULSES_PER_GRID_STEP)
+    # Percents in millionths (floor), clamped like the reference
+    eternal_step_ppm = min(99_999_999, (mu_in_step_eternal * 100_000_000) // UPULSES_PER_GRID_STEP)
+    eternal_beat_ppm = min(99_999_999, (mu_in_beat_eternal * 100_000_000) // UPULSES_PER_GRID_BEAT)
+    return {
+        "eternal_kai_pulse_today": eternal_kai_pulse_today,
+        "eternal_beat_idx": eternal_beat_idx,
+        "eternal_step_idx": eternal_step_idx,
+        "eternal_pulses_into_beat": mu_in_beat_eternal / UPULSES_PER_PULSE,
+        "eternal_percent_into_step": _fmt_micro(eternal_step_ppm),
+        "eternal_percent_of_beat": _fmt_micro(eternal_beat_ppm),
+        "eternal_arc_idx": min(5, (eternal_kai_pulse_today * 6 * UPULSES_PER_PULSE) // UPULSES_PER_DAY),
+        "harmonic_day_percent": (eternal_kai_pulse_today * 100 * UPULSES_PER_PULSE) / UPULSES_PER_DAY,
+    }
+
+def _solar_state_int(mu_now: int) -> dict:
+    """μ layer of the int engine, solar (sunrise-anchored) day."""
+    mu_since_sunrise  = mu_now - MU_SUNRISE0
+    solar_day_index   = mu_since_sunrise // UPULSES_PER_DAY
+    mu_into_solar_day = mu_since_sunrise - solar_day_index * UPULSES_PER_DAY
+    kai_pulse_today   = mu_into_solar_day // UPULSES_PER_PULSE
+    solar_beat_idx, mu_in_beat_solar = divmod(_mu_project_to_grid(mu_into_solar_day), UPULSES_PER_GRID_BEAT)
+    solar_step_idx, mu_in_step_solar = divmod(mu_in_beat_solar, UPULSES_PER_GRID_STEP)
+    solar_step_ppm = min(99_999_999, (mu_in_step_solar * 100_000_000) // UPULSES_PER_GRID_STEP)
+    return {
+        "kai_pulse_today": kai_pulse_today,
+        "solar_day_index": solar_day_index,
+        "solar_beat_idx": solar_beat_idx,
+        "solar_step_idx": solar_step_idx,
+        "solar_pulses_into_beat": mu_in_beat_solar / UPULSES_PER_PULSE,
+        "solar_percent_into_step": _fmt_micro(solar_step_ppm),
+        "arc_idx": min(5, (kai_pulse_today * 6 * UPULSES_PER_PULSE) // UPULSES_PER_DAY),
+    }
+
+# Int-engine state in independent parts, so a projection computes only the
+# parts its fields read (see _KaiMoment). Keys match _kai_state_decimal.
+_INT_STATE_PARTS = {
+    "pulse": lambda mu_now: _pulse_state_int(mu_now // UPULSES_PER_PULSE),
+    "eternal": _eternal_state_int,
+    "solar": _solar_state_int,
+}
+_INT_STATE_KEYS = {
+    key: part
+    for part, keys in (
+        ("pulse", ("kai_pulse_eternal", "harmonic_day_count", "harmonic_year_idx", "harmonic_month_raw",
+                   "days_elapsed", "has_partial_day", "month_percent", "week_day_idx", "pulses_into_week",
+                   "week_day_percent", "year_percent", "arc_beat_percent", "micro_cycle_percent",
+                   "chakra_loop_percent")),
+        ("eternal", ("eternal_kai_pulse_today", "eternal_beat_idx", "eternal_step_idx",
+                     "eternal_pulses_into_beat", "eternal_percent_into_step", "eternal_percent_of_beat",
+                     "eternal_arc_idx", "harmonic_day_percent")),
+        ("solar", ("kai_pulse_today", "solar_day_index", "solar_beat_idx", "solar_step_idx",
+                   "solar_pulses_into_beat", "solar_percent_into_step", "arc_idx")),
     )
+    for key in keys
+}
 
-    compressed_summary = (
-        f"{harmonic_day:<9} • Kairos:{eternal_beat_idx:02d}:{eternal_step_idx:02d} "
-        f"• D{day_of_month:>2}/M{eternal_month_idx} "
-        f"• Step {eternal_step_idx:>2}/44 – {str(eternal_percent_into_step_dec)}% "
-        f"• Y{harmonic_year_idx:<2} • Kai-Pulse {eternal_kai_pulse_today}"
-    )
+def _kai_state_int(now: datetime) -> dict:
+    # Floats below come from int / int, which CPython rounds correctly; the
+    # reference parses a 60-digit floor of the same ratio, and no ratio of
+    # these small denominators sits within 1e-58 of a binary64 tie, so both
+    # land on the same double. Quantized percents floor to millionths exactly.
+    mu_now = mu_since_genesis_int(now)
+    state = {"mu_now": mu_now}
+    for part in _INT_STATE_PARTS.values():
+        state.update(part(mu_now))
+    return state
 
-    harmonic_ts_desc = (
-        f"Today is {harmonic_day}, {HARMONIC_DAY_DESCRIPTIONS[harmonic_day]} "
-        f"It is the {day_of_month}{_ordinal(day_of_month)} Day of {eternal_month}, "
-        f"{ETERNAL_MONTH_DESCRIPTIONS[eternal_month]} We are in Week {week_idx}, "
-        f"{week_name}. {ETERNAL_WEEK_DESCRIPTIONS[week_name]} The Eternal Spiral Beat is {eternal_beat_idx} ("
-        f"{eternal_chakra_arc} ark) and we are {str(eternal_percent_of_beat_dec)}% through it. This korresponds "
-        f"to Step {eternal_step_idx} of 44 (~{str(eternal_percent_into_step_dec)}% into the step). "
-        f"This is the {eternal_year_name.lower()}, resonating at Phi Spiral Level {phi_spiral_lvl}. "
-        f"{eternal_seal}"
-    )
+KAI_ENGINES = {"decimal": _kai_state_decimal, "int": _kai_state_int}
+KAI_ENGINE  = os.getenv("KAI_KLOCK_ENGINE", "int")
 
-    kai_moment = (
-        f"↳ {seal} • Kai-Pulse {eternal_kai_pulse_today}, Beat {eternal_beat_idx}, Step {eternal_step_idx} "
-        f"{harmonic_day} Day, Month of {eternal_month}, Week of {week_name.split()[-1]}, Spiral Level {phi_spiral_lvl}."
-    )
+# ════════════════════════════════════════════════════════════════
+#  Layers — each is keyed by the index that turns at its exact μpulse
+#  boundary, so a cached layer is reused until that boundary and never after.
+#   • day   — eternal calendar names/descriptions (336-day cycle table)
+#   • year  — year name and Kai-Turah phrase (per harmonic year)
+#   • solar — sunrise-anchored calendar block (336-day cycle table)
+#   • pulse — spiral level, epochs, subdivisions (per eternal pulse)
+#   • μ     — beats/steps/percents + composite strings (per call)
+# ════════════════════════════════════════════════════════════════
+def _eternal_day_entry(days_elapsed: int, week_day_idx: int, eternal_month_idx: int,
+                       harmonic_day_idx: int, days_into_year: int) -> MappingProxyType:
+    eternal_month     = ETERNAL_MONTH_NAMES[eternal_month_idx - 1]
+    harmonic_day      = HARMONIC_DAYS[harmonic_day_idx]
+    week_idx_raw      = days_elapsed // 6
+    week_name         = ETERNAL_WEEK_NAMES[week_idx_raw]
+    day_of_month      = days_elapsed + 1
+    eternal_week_description = ETERNAL_WEEK_DESCRIPTIONS.get(week_name, "")
+    return MappingProxyType({
+        "eternal_month_idx": eternal_month_idx,
+        "eternal_month": eternal_month,
+        "eternal_month_description": ETERNAL_MONTH_DESCRIPTIONS[eternal_month],
+        "harmonic_day": harmonic_day,
+        "harmonic_day_description": HARMONIC_DAY_DESCRIPTIONS[harmonic_day],
+        "week_idx": week_idx_raw + 1,
+        "week_name": week_name,
+        "eternal_week_description": eternal_week_description,
+        "day_of_month": day_of_month,
+        "week_day": HARMONIC_DAYS[week_day_idx],
+        "days_into_year": days_into_year,
+        # day-constant opening of harmonicTimestampDescription
+        "timestamp_description": (
+            f"Today is {harmonic_day}, {HARMONIC_DAY_DESCRIPTIONS[harmonic_day]} "
+            f"It is the {day_of_month}{_ordinal(day_of_month)} Day of {eternal_month}, "
+            f"{ETERNAL_MONTH_DESCRIPTIONS[eternal_month]} We are in Week {week_idx_raw + 1}, "
+            f"{week_name}. {eternal_week_description}"
+        ),
+    })
+
+def _solar_day_entry(solar_day_index: int) -> MappingProxyType:
+    solar_month_index = ((solar_day_index // HARMONIC_MONTH_DAYS) % 8) + 1
+    solar_month_name  = ETERNAL_MONTH_NAMES[solar_month_index - 1]
+    solar_day_name    = HARMONIC_DAYS[solar_day_index % len(HARMONIC_DAYS)]
+    solar_week_name   = ETERNAL_WEEK_NAMES[(solar_day_index // 6) % 7]
+    return MappingProxyType({
+        "solar_day_of_month": (solar_day_index % HARMONIC_MONTH_DAYS) + 1,
+        "solar_month_index": solar_month_index,
+        "solar_month_name": solar_month_name,
+        "solar_month_description": ETERNAL_MONTH_DESCRIPTIONS[solar_month_name],
+        "solar_day_name": solar_day_name,
+        "solar_day_description": HARMONIC_DAY_DESCRIPTIONS[solar_day_name],
+        "solar_week_index": ((solar_day_index // 6) % 7) + 1,
+        "solar_week_name": solar_week_name,
+        "solar_week_description": ETERNAL_WEEK_DESCRIPTIONS[solar_week_name],
+    })
+
+class _LazyTable(dict):
+    """Constant table filled on first lookup of each key (import builds nothing)."""
+    def __init__(self, build):
+        super().__init__()
+        self.build = build
+
+    def __missing__(self, key):
+        value = self[key] = self.build(key)
+        return value
+
+# Every day-level calendar field repeats with the 336-day year (6 | 42 | 336),
+# so both calendars are one table lookup at day index mod 336.
+ETERNAL_YEAR_CYCLE = _LazyTable(lambda d: _eternal_day_entry(
+    d % HARMONIC_MONTH_DAYS, d % len(HARMONIC_DAYS), d // HARMONIC_MONTH_DAYS + 1, d % len(HARMONIC_DAYS), d
+))
+SOLAR_YEAR_CYCLE = _LazyTable(_solar_day_entry)
+
+@functools.lru_cache(maxsize=64)
+def _eternal_day_fallback(harmonic_day_count: int, harmonic_month_raw: int,
+                          days_elapsed: int, week_day_idx: int) -> MappingProxyType:
+    # Before genesis the calendar takes remainders with the sign of the
+    # dividend (Decimal % semantics), which the cycle table does not model.
+    return _eternal_day_entry(days_elapsed, week_day_idx, (harmonic_month_raw % 8) + 1,
+                              harmonic_day_count % len(HARMONIC_DAYS), harmonic_day_count % HARMONIC_YEAR_DAYS)
+
+@functools.lru_cache(maxsize=64)
+def _eternal_year_layer(harmonic_year_idx: int) -> dict:
+    return {
+        "eternal_year_name": ("Year of Eternal Restoration" if harmonic_year_idx == 0
+                              else "Year of Harmonik Embodiment" if harmonic_year_idx == 1
+                              else f"Year {harmonic_year_idx + 1}"),
+        "kai_turah_phrase": KAI_TURAH_PHRASES[harmonic_year_idx % len(KAI_TURAH_PHRASES)],
+    }
+
+# Per-pulse layers are shared between calls (never mutate them); field groups
+# hand out copies.
+@functools.lru_cache(maxsize=256)
+def _pulse_epochs(kai_pulse_eternal: int) -> List[Dict]:
+    return generate_phi_spiral_epochs(kai_pulse_eternal)
+
+@functools.lru_cache(maxsize=256)
+def _pulse_subdivisions(kai_pulse_eternal: int) -> Dict[str, Dict[str, Union[float, str]]]:
+    return build_subdivisions_live(kai_pulse_eternal)
 
-    # ── OUTPUT (grid beats for beat/step; φ for calendar) ───────
-    kairos_seal_day_month = f"{eternal_beat_idx:02d}:{eternal_step_idx:02d} • D{day_of_month:02d}/M{eternal_month_idx}"
-    kairos_seal_day_month_percent = f"{eternal_beat_idx:02d}:{eternal_step_idx:02d} - {str(eternal_percent_into_step_dec)}% • D{day_of_month:02d}/M{eternal_month_idx}"
-    kairos_seal = f"{eternal_beat_idx:02d}:{eternal_step_idx:02d}"
-    kairos_seal_solar = f"{solar_beat_idx:02d}:{solar_step_idx:02d}"
-    kairos_seal_solar_day_month = f"{solar_beat_idx:02d}:{solar_step_idx:02d} D{solar_day_of_month:02d}/M{solar_month_index}"
-    kairos_seal_solar_day_month_percent = f"{solar_beat_idx:02d}:{solar_step_idx:02d} - {str(solar_percent_into_step_dec)}% D{solar_day_of_month:02d}/M{solar_month_index}"
-    kairos_seal_percent_step_solar = f"{solar_beat_idx:02d}:{solar_step_idx:02d} - {str(solar_percent_into_step_dec)}%"
-    kairos_seal_percent_step = f"{eternal_beat_idx:02d}:{eternal_step_idx:02d} - {str(eternal_percent_into_step_dec)}%"
-
-    payload = KaiKlockResponse(
-        # 1) Seals & narrative
-        kairos_seal_day_month=kairos_seal_day_month,
-        kairos_seal_day_month_percent=kairos_seal_day_month_percent,
-        kairos_seal=kairos_seal,
-        kairos_seal_percent_step=kairos_seal_percent_step,
-        kairos_seal_percent_step_solar=kairos_seal_percent_step_solar,
-        kairos_seal_solar=kairos_seal_solar,
-        kairos_seal_solar_day_month=kairos_seal_solar_day_month,
-        kairos_seal_solar_day_month_percent=kairos_seal_solar_day_month_percent,
-        eternalSeal=eternal_seal,
-        seal=seal,
-        harmonicNarrative=narrative,
-
-        # 2) Eternal calendar (φ durations)
-        eternalMonth=eternal_month,
-        eternalMonthIndex=eternal_month_idx,
-        eternalMonthDescription=ETERNAL_MONTH_DESCRIPTIONS[eternal_month],
-        eternalChakraArc=eternal_chakra_arc,
-        eternalYearName=eternal_year_name,
-        eternalWeekDescription=eternal_week_description,
-        eternalKaiPulseToday=eternal_kai_pulse_today,
-        kaiPulseEternal=kai_pulse_eternal,
-        eternalMonthProgress={
-            "daysElapsed": days_elapsed,
-            "daysRemaining": days_remaining,
-            "percent": str(month_percent_dec),
-        },
+# ════════════════════════════════════════════════════════════════
+#  Main generator (KKS v1 grid parity for beats/steps)
+#  Response fields are built in groups that share inputs. A _KaiMoment
+#  computes engine state, layers and shared strings on first use, so a
+#  projection (get_kai_fields) runs only the groups of the fields asked
+#  for and only what those groups read (e.g. no solar state for eternal
+#  fields); get_eternal_klock runs every group.
+# ════════════════════════════════════════════════════════════════
+# Built-in seals as format templates (see kai_klock_format); keyed by the
+# response field each one renders.
+_DAY_SEAL = "Day Seal: %B:%02S %p% • D%d/M%m"
+KAI_FORMATS: Dict[str, str] = {
+    "chakraStepString": "%B:%02S",
+    "solarChakraStepString": "%b:%02s",
+    "kairos_seal": "%02B:%02S",
+    "kairos_seal_percent_step": "%02B:%02S - %p%",
+    "kairos_seal_percent_step_solar": "%02b:%02s - %q%",
+    "kairos_seal_solar": "%02b:%02s",
+    "kairos_seal_day_month": "%02B:%02S • D%02d/M%m",
+    "kairos_seal_day_month_percent": "%02B:%02S - %p% • D%02d/M%m",
+    "kairos_seal_solar_day_month": "%02b:%02s D%02D/M%M",
+    "kairos_seal_solar_day_month_percent": "%02b:%02s - %q% D%02D/M%M",
+    "seal": _DAY_SEAL,
+    "eternalSeal": (
+        "Eternal Seal: Kairos:%B:%02S, %N, %A Ark • D%d/M%m • Beat:%B/36(%P%) Step:%S/44 Kai(Today):%k • "
+        "Y%y PS%L • Solar Kairos (UTC-aligned): %b:%02s %n D%D/M%M, %a Ark  Beat:%b/36 Step:%s/44 • "
+        "Eternal Pulse:%K"
+    ),
+    "timestamp": (
+        "↳Kairos: %B:%02S🕊️ %N(D%u/6) • %O(M%m/8) • %A Ark(%e/6)\n • Day:%d/42 • Week:(%w/7)\n"
+        " | Kai-Pulse (Today): %k\n"
+    ),
+    "kaiMomentSummary": (
+        f"↳ {_DAY_SEAL} • Kai-Pulse %k, Beat %B, Step %S %N Day, Month of %O, Week of %V, Spiral Level %L."
+    ),
+    "compressed_summary": "%-9N • Kairos:%02B:%02S • D%2d/M%m • Step %2S/44 – %p% • Y%-2y • Kai-Pulse %k",
+}
+_SEAL = _LazyTable(lambda name: compile_kai_format(KAI_FORMATS[name]))
 
-        # 3) Solar calendar (φ durations)
-        kaiPulseToday=kai_pulse_today,
-        solarChakraArc=solar_chakra_arc,
-        solarDayOfMonth=solar_day_of_month,
-        solarMonthIndex=solar_month_index,
-        solarHarmonicDay=solar_harmonic_day,
-        solar_week_index=solar_week_index,
-        solar_week_name=solar_week_name,
-        solar_week_description=solar_week_description,
-        solar_month_name=solar_month_name,
-        solar_month_description=solar_month_description,
-        solar_day_name=solar_day_name,
-        solar_day_description=solar_day_description,
-
-        # 4) Harmonic day/week structure
-        harmonicDay=harmonic_day,
-        harmonicDayDescription=HARMONIC_DAY_DESCRIPTIONS[harmonic_day],
-        weekIndex=week_idx,
-        weekName=week_name,
-        dayOfMonth=day_of_month,
-        harmonicWeekProgress={
-            "weekDay": HARMONIC_DAYS[week_day_idx],
-            "weekDayIndex": week_day_idx,
-            "pulsesIntoWeek": str(pulses_into_week_dec),
-            "percent": str(week_day_percent_dec),
-        },
+class _lazy:
+    """functools.cached_property without its lock (every value here is pure)."""
+    def __init__(self, fn):
+        self.fn = fn
+        self.name = fn.__name__
 
-        # 5) Resonance structure (GRID beats/steps ONLY)
-        chakraArc=chakra_arc,
-        chakraArcDescription=CHAKRA_ARC_DESCRIPTIONS.get(CHAKRA_ARC_NAME_MAP.get(chakra_arc, ""), ""),
-        chakraBeat={
-            "beatIndex": solar_beat_idx,
-            "pulsesIntoBeat": str(solar_grid_pulses_into_beat_dec),  # 0..484 (grid pulses)
-            "beatPulseCount": str(GRID_PULSES_PER_BEAT),             # "484"
-            "totalBeats": CHAKRA_BEATS_PER_DAY,                      # 36
-        },
-        eternalChakraBeat={
-            "beatIndex": eternal_beat_idx,
-            "pulsesIntoBeat": str(eternal_grid_pulses_into_beat_dec),# 0..484 (grid pulses)
-            "percentToNext": str(eternal_percent_of_beat_dec),       # beat % on grid
-            "beatPulseCount": str(GRID_PULSES_PER_BEAT),             # "484"
-            "totalBeats": CHAKRA_BEATS_PER_DAY,                      # 36
-        },
-        chakraStep=chakra_step_obj,
-        chakraStepString=chakra_step_str,
-        solarChakraStep=solar_step_payload,
-        solarChakraStepString=solar_step_string,
-
-        # 6) Phi identity / spiral language
-        phiSpiralLevel=phi_spiral_lvl,
-        kaiTurahPhrase=kai_turah_phrase,
-        phiSpiralEpochs=generate_phi_spiral_epochs(kai_pulse_eternal),
-        subdivisions=build_subdivisions_live(kai_pulse_eternal),
-
-        # 7) Resonance cycles (φ day progress for these aggregates is fine)
-        harmonicLevels={
-            "subdivisions": compute_subdivision_counts(kai_pulse_eternal),
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.name] = self.fn(obj)
+        return value
+
+
+class _IntState(dict):
+    """Int-engine state that computes each part on first access to one of its keys."""
+    def __missing__(self, key: str):
+        self.update(_INT_STATE_PARTS[_INT_STATE_KEYS[key]](self["mu_now"]))
+        return self[key]
+
+
+class _KaiMoment:
+    def __init__(self, now: datetime, engine: str, lazy: bool = True):
+        if engine == "int" and lazy:
+            self.s = _IntState(mu_now=mu_since_genesis_int(now))
+        else:
+            self.s = KAI_ENGINES[engine](now)
+
+    @classmethod
+    def at_mu(cls, mu_now: int) -> "_KaiMoment":
+        """Int-engine moment at a μpulse count (no Chronos conversion)."""
+        moment = cls.__new__(cls)
+        moment.s = _IntState(mu_now=mu_now)
+        return moment
+
+    @_lazy
+    def day(self) -> MappingProxyType:
+        s = self.s
+        harmonic_day_count = s["harmonic_day_count"]
+        if harmonic_day_count >= 0:
+            return ETERNAL_YEAR_CYCLE[harmonic_day_count % HARMONIC_YEAR_DAYS]
+        return _eternal_day_fallback(harmonic_day_count, s["harmonic_month_raw"],
+                                     s["days_elapsed"], s["week_day_idx"])
+
+    @_lazy
+    def year(self) -> dict:
+        return _eternal_year_layer(self.s["harmonic_year_idx"])
+
+    @_lazy
+    def solar(self) -> MappingProxyType:
+        return SOLAR_YEAR_CYCLE[self.s["solar_day_index"] % HARMONIC_YEAR_DAYS]
+
+    @_lazy
+    def phi_spiral_lvl(self) -> int:
+        return _floor_log_phi(self.s["kai_pulse_eternal"])
+
+    @_lazy
+    def eternal_chakra_arc(self) -> str:
+        return CHAKRA_ARCS[self.s["eternal_arc_idx"]]
+
+    @_lazy
+    def chakra_arc(self) -> str:
+        return CHAKRA_ARCS[self.s["arc_idx"]]
+
+    @_lazy
+    def eternal_seal(self) -> str:
+        return _SEAL["eternalSeal"](self)
+
+
+# Field groups: each builder returns exactly the KaiKlockResponse fields it is
+# registered for, reading only what it needs from the moment. Groups marked
+# per_pulse depend on kaiPulseEternal alone, so they are equal at every
+# μpulse of a pulse (the /kai cache keeps them per pulse). Values are
+# already JSON-ready and of the model's field types (floats as float, nested
+# models as dicts in field order), so a payload serializes byte for byte like
+# the validated model without going through it.
+_FIELD_GROUPS: List = []
+_FIELD_GROUP_OF: Dict[str, object] = {}
+_PULSE_FIELD_GROUPS: set = set()
+
+def _kai_fields(*fields: str, per_pulse: bool = False):
+    def register(fn):
+        _FIELD_GROUPS.append(fn)
+        for f in fields:
+            _FIELD_GROUP_OF[f] = fn
+        if per_pulse:
+            _PULSE_FIELD_GROUPS.add(fn)
+        return fn
+    return register
+
+@_kai_fields("kaiPulseEternal", "phiSpiralLevel", per_pulse=True)
+def _pulse_fields(m: _KaiMoment) -> dict:
+    return {
+        "kaiPulseEternal": m.s["kai_pulse_eternal"],
+        "phiSpiralLevel": m.phi_spiral_lvl,
+    }
+
+@_kai_fields("harmonicLevels")
+def _harmonic_level_fields(m: _KaiMoment) -> dict:
+    s = m.s
+    kai_pulse_eternal = s["kai_pulse_eternal"]
+    return {
+        # Resonance cycles (φ day progress for these aggregates is fine)
+        "harmonicLevels": {
             "arcBeat": {
-                "pulseInCycle": kai_pulse_eternal % ARC_BEAT_PULSES,
-                "cycleLength": ARC_BEAT_PULSES,
-                "percent": str((Decimal(kai_pulse_eternal % ARC_BEAT_PULSES) / Decimal(ARC_BEAT_PULSES)) * Decimal(100)),
+                "pulseInCycle": float(kai_pulse_eternal % ARC_BEAT_PULSES),
+                "cycleLength": float(ARC_BEAT_PULSES),
+                "percent": float(s["arc_beat_percent"]),
             },
             "microCycle": {
-                "pulseInCycle": kai_pulse_eternal % MICRO_CYCLE_PULSES,
-                "cycleLength": MICRO_CYCLE_PULSES,
-                "percent": str((Decimal(kai_pulse_eternal % MICRO_CYCLE_PULSES) / Decimal(MICRO_CYCLE_PULSES)) * Decimal(100)),
+                "pulseInCycle": float(kai_pulse_eternal % MICRO_CYCLE_PULSES),
+                "cycleLength": float(MICRO_CYCLE_PULSES),
+                "percent": float(s["micro_cycle_percent"]),
             },
             "chakraLoop": {
-                "pulseInCycle": kai_pulse_eternal % CHAKRA_LOOP_PULSES,
-                "cycleLength": CHAKRA_LOOP_PULSES,
-                "percent": str((Decimal(kai_pulse_eternal % CHAKRA_LOOP_PULSES) / Decimal(CHAKRA_LOOP_PULSES)) * Decimal(100)),
+                "pulseInCycle": float(kai_pulse_eternal % CHAKRA_LOOP_PULSES),
+                "cycleLength": float(CHAKRA_LOOP_PULSES),
+                "percent": float(s["chakra_loop_percent"]),
             },
             "harmonicDay": {
-                "pulseInCycle": eternal_kai_pulse_today,
+                "pulseInCycle": float(s["eternal_kai_pulse_today"]),
                 "cycleLength": float(HARMONIC_DAY_PULSES_DEC),
-                "percent": str((Decimal(eternal_kai_pulse_today) / HARMONIC_DAY_PULSES_DEC) * Decimal(100)),
+                "percent": float(s["harmonic_day_percent"]),
             },
         },
-
-        # 8) Harmonic year progress
-        harmonicYearProgress={
+    }
+
+@_kai_fields("phiSpiralEpochs", per_pulse=True)
+def _epoch_fields(m: _KaiMoment) -> dict:
+    return {"phiSpiralEpochs": [dict(e) for e in _pulse_epochs(m.s["kai_pulse_eternal"])]}
+
+@_kai_fields("subdivisions", per_pulse=True)
+def _subdivision_fields(m: _KaiMoment) -> dict:
+    return {"subdivisions": {k: dict(v) for k, v in _pulse_subdivisions(m.s["kai_pulse_eternal"]).items()}}
+
+@_kai_fields("eternalKaiPulseToday", "eternalChakraArc", "eternalChakraBeat", "chakraStep", "chakraStepString",
+             "kairos_seal", "kairos_seal_percent_step")
+def _eternal_grid_fields(m: _KaiMoment) -> dict:
+    s = m.s
+    eternal_beat_idx, eternal_step_idx = s["eternal_beat_idx"], s["eternal_step_idx"]
+    return {
+        "eternalKaiPulseToday": s["eternal_kai_pulse_today"],
+        "eternalChakraArc": m.eternal_chakra_arc,
+        "eternalChakraBeat": {
+            "beatIndex": eternal_beat_idx,
+            "pulsesIntoBeat": float(s["eternal_pulses_into_beat"]),  # 0..484 (grid pulses)
+            "beatPulseCount": float(GRID_PULSES_PER_BEAT),           # 484.0
+            "totalBeats": CHAKRA_BEATS_PER_DAY,                      # 36
+            "percentToNext": float(s["eternal_percent_of_beat"]),    # beat % on grid
+        },
+        "chakraStep": {
+            "stepIndex": eternal_step_idx,
+            "percentIntoStep": float(s["eternal_percent_into_step"]),
+            "stepsPerBeat": STEPS_PER_BEAT,
+        },
+        "chakraStepString": _SEAL["chakraStepString"](m),
+        "kairos_seal": _SEAL["kairos_seal"](m),
+        "kairos_seal_percent_step": _SEAL["kairos_seal_percent_step"](m),
+    }
+
+@_kai_fields("eternalMonth", "eternalMonthIndex", "eternalMonthDescription", "eternalYearName",
+             "eternalWeekDescription", "eternalMonthProgress", "harmonicDay", "harmonicDayDescription",
+             "weekIndex", "weekName", "dayOfMonth", "harmonicWeekProgress", "kaiTurahPhrase",
+             "harmonicYearProgress", per_pulse=True)
+def _eternal_calendar_fields(m: _KaiMoment) -> dict:
+    s, day = m.s, m.day
+    days_elapsed = s["days_elapsed"]
+    days_into_year = day["days_into_year"]
+    return {
+        "eternalMonth": day["eternal_month"],
+        "eternalMonthIndex": day["eternal_month_idx"],
+        "eternalMonthDescription": day["eternal_month_description"],
+        "eternalYearName": m.year["eternal_year_name"],
+        "eternalWeekDescription": day["eternal_week_description"],
+        "eternalMonthProgress": {
+            "daysElapsed": days_elapsed,
+            "daysRemaining": max(0, HARMONIC_MONTH_DAYS - days_elapsed - (1 if s["has_partial_day"] else 0)),
+            "percent": float(s["month_percent"]),
+        },
+        "harmonicDay": day["harmonic_day"],
+        "harmonicDayDescription": day["harmonic_day_description"],
+        "weekIndex": day["week_idx"],
+        "weekName": day["week_name"],
+        "dayOfMonth": day["day_of_month"],
+        "harmonicWeekProgress": {
+            "weekDay": day["week_day"],
+            "weekDayIndex": s["week_day_idx"],
+            "pulsesIntoWeek": float(s["pulses_into_week"]),
+            "percent": float(s["week_day_percent"]),
+        },
+        "kaiTurahPhrase": m.year["kai_turah_phrase"],
+        "harmonicYearProgress": {
             "daysElapsed": days_into_year,
             "daysRemaining": HARMONIC_YEAR_DAYS - days_into_year,
-            "percent": str(year_percent_dec),
+            "percent": float(s["year_percent"]),
         },
-
-        # 9) Composite outputs (display)
-        timestamp=timestamp,
-        harmonicTimestampDescription=harmonic_ts_desc,
-        kaiMomentSummary=kai_moment,
-        compressed_summary=compressed_summary
+    }
+
+@_kai_fields("seal", "kairos_seal_day_month", "kairos_seal_day_month_percent", "timestamp",
+             "kaiMomentSummary", "compressed_summary")
+def _eternal_seal_fields(m: _KaiMoment) -> dict:
+    return {
+        "seal": _SEAL["seal"](m),
+        "kairos_seal_day_month": _SEAL["kairos_seal_day_month"](m),
+        "kairos_seal_day_month_percent": _SEAL["kairos_seal_day_month_percent"](m),
+        "timestamp": _SEAL["timestamp"](m),
+        "kaiMomentSummary": _SEAL["kaiMomentSummary"](m),
+        "compressed_summary": _SEAL["compressed_summary"](m),
+    }
+
+@_kai_fields("kaiPulseToday", "solarChakraArc", "chakraArc", "chakraArcDescription", "chakraBeat",
+             "solarChakraStep", "solarChakraStepString", "kairos_seal_solar", "kairos_seal_percent_step_solar")
+def _solar_grid_fields(m: _KaiMoment) -> dict:
+    s = m.s
+    solar_beat_idx, solar_step_idx = s["solar_beat_idx"], s["solar_step_idx"]
+    chakra_arc = m.chakra_arc
+    return {
+        "kaiPulseToday": s["kai_pulse_today"],
+        "solarChakraArc": chakra_arc,
+        "chakraArc": chakra_arc,
+        "chakraArcDescription": CHAKRA_ARC_DESCRIPTIONS.get(CHAKRA_ARC_NAME_MAP.get(chakra_arc, ""), ""),
+        "chakraBeat": {
+            "beatIndex": solar_beat_idx,
+            "pulsesIntoBeat": float(s["solar_pulses_into_beat"]),    # 0..484 (grid pulses)
+            "beatPulseCount": float(GRID_PULSES_PER_BEAT),           # 484.0
+            "totalBeats": CHAKRA_BEATS_PER_DAY,                      # 36
+        },
+        "solarChakraStep": {
+            "stepIndex": solar_step_idx,
+            "percentIntoStep": float(s["solar_percent_into_step"]),
+            "stepsPerBeat": STEPS_PER_BEAT,
+        },
+        "solarChakraStepString": _SEAL["solarChakraStepString"](m),
+        "kairos_seal_solar": _SEAL["kairos_seal_solar"](m),
+        "kairos_seal_percent_step_solar": _SEAL["kairos_seal_percent_step_solar"](m),
+    }
+
+@_kai_fields("solarDayOfMonth", "solarMonthIndex", "solarHarmonicDay", "solar_week_index", "solar_week_name",
+             "solar_week_description", "solar_month_name", "solar_month_description", "solar_day_name",
+             "solar_day_description", "kairos_seal_solar_day_month", "kairos_seal_solar_day_month_percent")
+def _solar_calendar_fields(m: _KaiMoment) -> dict:
+    solar = m.solar
+    solar_day_of_month, solar_month_index = solar["solar_day_of_month"], solar["solar_month_index"]
+    return {
+        "solarDayOfMonth": solar_day_of_month,
+        "solarMonthIndex": solar_month_index,
+        "solarHarmonicDay": solar["solar_day_name"],
+        "solar_week_index": solar["solar_week_index"],
+        "solar_week_name": solar["solar_week_name"],
+        "solar_week_description": solar["solar_week_description"],
+        "solar_month_name": solar["solar_month_name"],
+        "solar_month_description": solar["solar_month_description"],
+        "solar_day_name": solar["solar_day_name"],
+        "solar_day_description": solar["solar_day_description"],
+        "kairos_seal_solar_day_month": _SEAL["kairos_seal_solar_day_month"](m),
+        "kairos_seal_solar_day_month_percent": _SEAL["kairos_seal_solar_day_month_percent"](m),
+    }
+
+@_kai_fields("eternalSeal", "harmonicNarrative", "harmonicTimestampDescription")
+def _composite_fields(m: _KaiMoment) -> dict:
+    s, day = m.s, m.day
+    eternal_seal = m.eternal_seal
+    eternal_chakra_arc = m.eternal_chakra_arc
+    eternal_beat_idx, eternal_percent_of_beat = s["eternal_beat_idx"], s["eternal_percent_of_beat"]
+    harmonic_day = day["harmonic_day"]
+    return {
+        "eternalSeal": eternal_seal,
+        "harmonicNarrative": (
+            f"In this moment of the Kai-Klock’s dual-day resonance, we are held within the sacred ark of {eternal_chakra_arc}, "
+            f"rooted through the harmonic foundation of {harmonic_day}.\n\n"
+            f"☀️ Solar Alignment: The living field synchronizes at Kai-Pulse {s['kai_pulse_today']}, placing us in Spiral Beat {s['solar_beat_idx']}, "
+            f"guided by Earth’s breath and solar koherense.\n\n"
+            f"🌕 Eternal Alignment: The timeless stream flows through Kai-Pulse {s['eternal_kai_pulse_today']}, entering Spiral Beat {eternal_beat_idx}, "
+            f"{eternal_percent_of_beat}% complete — approaching the gateway of harmonic culmination.\n\n"
+            f"{eternal_seal}"
+        ),
+        "harmonicTimestampDescription": (
+            f"{day['timestamp_description']} The Eternal Spiral Beat is {eternal_beat_idx} ("
+            f"{eternal_chakra_arc} ark) and we are {eternal_percent_of_beat}% through it. This korresponds "
+            f"to Step {s['eternal_step_idx']} of 44 (~{s['eternal_percent_into_step']}% into the step). "
+            f"This is the {m.year['eternal_year_name'].lower()}, resonating at Phi Spiral Level {m.phi_spiral_lvl}. "
+            f"{eternal_seal}"
+        ),
+    }
+
+# ── Compact integer coordinates (/kai/lite) ─────────────────────
+KAI_LITE_VERSION = 1
+
+def _grid_ppm(mu_into_day: int) -> tuple:
+    """(beat, step, beat ppm, step ppm) on the 17,424-grid for μpulses into a φ-day."""
+    beat, mu_in_beat = divmod(_mu_project_to_grid(mu_into_day), UPULSES_PER_GRID_BEAT)
+    step, mu_in_step = divmod(mu_in_beat, UPULSES_PER_GRID_STEP)
+    return (beat, step, (mu_in_beat * 1_000_000) // UPULSES_PER_GRID_BEAT,
+            (mu_in_step * 1_000_000) // UPULSES_PER_GRID_STEP)
+
+def get_kai_lite(now: Optional[datetime] = None) -> KaiLite:
+    """Integer-only Kai coordinates (KaiLite schema v1); exact μpulse math, no text."""
+    return kai_lite_at_mu(mu_since_genesis_int(_ensure_utc(now or datetime.utcnow())))
+
+def kai_lite_at_mu(mu_now: int) -> KaiLite:
+    """KaiLite coordinates at μpulse `mu_now` since genesis."""
+    kai_pulse_eternal, mu_in_pulse = divmod(mu_now, UPULSES_PER_PULSE)
+    pulse = _pulse_state_int(kai_pulse_eternal)
+
+    mu_into_eternal_day = mu_now % UPULSES_PER_DAY
+    solar_day_index, mu_into_solar_day = divmod(mu_now - MU_SUNRISE0, UPULSES_PER_DAY)
+    eb, es, ebp, esp = _grid_ppm(mu_into_eternal_day)
+    sb, ss, _, ssp = _grid_ppm(mu_into_solar_day)
+    days_elapsed = pulse["days_elapsed"]
+    return KaiLite(
+        v=KAI_LITE_VERSION,
+        p=kai_pulse_eternal,
+        mu=mu_in_pulse,
+        eb=eb, es=es, ebp=ebp, esp=esp,
+        sb=sb, ss=ss, ssp=ssp,
+        d=days_elapsed + 1,
+        w=days_elapsed // 6 + 1,
+        wd=pulse["week_day_idx"],
+        m=pulse["harmonic_month_raw"] % 8 + 1,
+        y=pulse["harmonic_year_idx"],
+        sd=solar_day_index % HARMONIC_MONTH_DAYS + 1,
+        sw=(solar_day_index // 6) % 7 + 1,
+        swd=solar_day_index % len(HARMONIC_DAYS),
+        sm=(solar_day_index // HARMONIC_MONTH_DAYS) % 8 + 1,
+        ea=min(5, (mu_into_eternal_day // UPULSES_PER_PULSE * 6 * UPULSES_PER_PULSE) // UPULSES_PER_DAY),
+        sa=min(5, (mu_into_solar_day // UPULSES_PER_PULSE * 6 * UPULSES_PER_PULSE) // UPULSES_PER_DAY),
+        ps=_floor_log_phi(kai_pulse_eternal),
     )
 
-    return payload
+KAI_RESPONSE_FIELDS = tuple(KaiKlockResponse.model_fields)
+if set(_FIELD_GROUP_OF) != set(KAI_RESPONSE_FIELDS):
+    raise RuntimeError("Kai field groups out of sync with KaiKlockResponse")
+# Fields equal at every μpulse of a pulse, and the rest (response order)
+KAI_PULSE_FIELDS = tuple(f for f in KAI_RESPONSE_FIELDS if _FIELD_GROUP_OF[f] in _PULSE_FIELD_GROUPS)
+KAI_MU_FIELDS = tuple(f for f in KAI_RESPONSE_FIELDS if _FIELD_GROUP_OF[f] not in _PULSE_FIELD_GROUPS)
+
+def _kai_moment(now: Optional[datetime], engine: Optional[str], lazy: bool = True) -> _KaiMoment:
+    now = _ensure_utc(now or datetime.utcnow())
+    engine = engine or KAI_ENGINE
+    if engine not in KAI_ENGINES:
+        raise ValueError(f"Unknown Kai engine {engine!r}; expected one of {sorted(KAI_ENGINES)}")
+    return _KaiMoment(now, engine, lazy)
+
+def resolve_kai_fields(fields=None, exclude=None) -> tuple:
+    """
+    Normalize a field selection to KaiKlockResponse order. `fields` / `exclude`
+    are iterables of field names (None = all / none); unknown names or a
+    selection that leaves no field raise ValueError.
+    """
+    chosen = set(KAI_RESPONSE_FIELDS if fields is None else fields)
+    dropped = set(exclude or ())
+    unknown = (chosen | dropped) - set(KAI_RESPONSE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown KaiKlockResponse field(s): {', '.join(sorted(unknown))}")
+    selected = tuple(f for f in KAI_RESPONSE_FIELDS if f in chosen and f not in dropped)
+    if not selected:
+        raise ValueError("The field selection is empty; name at least one KaiKlockResponse field")
+    return selected
+
+@functools.lru_cache(maxsize=128)
+def kai_projection_model(fields: tuple) -> type:
+    """Pydantic model holding just `fields` of KaiKlockResponse (same types)."""
+    spec = KaiKlockResponse.model_fields
+    return create_model("KaiKlockProjection", **{f: (spec[f].annotation, spec[f]) for f in fields})
+
+def get_kai_fields(fields: tuple, now: Optional[datetime] = None, engine: Optional[str] = None) -> BaseModel:
+    """
+    Subset of the Kai-Klock payload (`fields` as from resolve_kai_fields).
+    Only the field groups involved are built; values equal get_eternal_klock's.
+    """
+    return _project(_kai_moment(now, engine), fields)
+
+def get_kai_fields_at_mu(fields: tuple, mu_now: int) -> BaseModel:
+    """get_kai_fields at μpulse `mu_now` (int engine)."""
+    return _project(_KaiMoment.at_mu(mu_now), fields)
+
+def get_kai_fields_data(fields: tuple, now: Optional[datetime] = None, engine: Optional[str] = None) -> dict:
+    """Equal to get_kai_fields(...).model_dump(mode="json"), built without validation."""
+    values = _group_values(_kai_moment(now, engine), fields)
+    return {f: values[f] for f in fields}
+
+def get_kai_fields_data_at_mu(fields: tuple, mu_now: int) -> dict:
+    """get_kai_fields_data at μpulse `mu_now` (int engine)."""
+    values = _group_values(_KaiMoment.at_mu(mu_now), fields)
+    return {f: values[f] for f in fields}
+
+def _group_values(moment: _KaiMoment, fields: tuple) -> dict:
+    values: dict = {}
+    for group in dict.fromkeys(_FIELD_GROUP_OF[f] for f in fields):
+        values.update(group(moment))
+    return values
+
+def _project(moment: _KaiMoment, fields: tuple) -> BaseModel:
+    values = _group_values(moment, fields)
+    return kai_projection_model(tuple(fields))(**{f: values[f] for f in fields})
+
+def format_kai(template: str, now: Optional[datetime] = None, engine: Optional[str] = None) -> str:
+    """
+    Render a format template (kai_klock_format), or a built-in seal by its
+    KAI_FORMATS name, at `now`. Only the directives used are computed.
+    """
+    render = compile_kai_format(KAI_FORMATS.get(template, template))
+    return render(_kai_moment(now, engine))
+
+def _eternal_values(now: Optional[datetime], engine: Optional[str]) -> dict:
+    moment = _kai_moment(now, engine, lazy=False)
+    values: dict = {}
+    for group in _FIELD_GROUPS:
+        values.update(group(moment))
+    return values
+
+def get_eternal_klock(now: Optional[datetime] = None, engine: Optional[str] = None) -> KaiKlockResponse:
+    return KaiKlockResponse(**_eternal_values(now, engine))
+
+def get_eternal_klock_data(now: Optional[datetime] = None, engine: Optional[str] = None) -> dict:
+    """
+    Equal to get_eternal_klock(...).model_dump(mode="json") and in field order,
+    so to_json() of it is the /kai body; a fresh dict the caller may keep.
+    """
+    values = _eternal_values(now, engine)
+    return {f: values[f] for f in KAI_RESPONSE_FIELDS}
@@ -0,0 +1,196 @@
+# kai_klock_batch.py  •  vectorized Chronos → Kai coordinates (KKS v1 grid parity)
+from __future__ import annotations
+
+import numpy as np
+
+from kai_klock import (
+    ETERNAL_GENESIS_UNIX_US, MU_SUNRISE0, mu_from_us_since_genesis,
+    KAI_PULSE_SCALE, KAI_PULSE_SCALED,
+    UPULSES_PER_PULSE, UPULSES_PER_DAY, UPULSES_PER_GRID_DAY,
+    UPULSES_PER_GRID_BEAT, UPULSES_PER_GRID_STEP,
+    UPULSES_PER_WEEK, UPULSES_PER_MONTH, UPULSES_PER_YEAR,
+    HARMONIC_MONTH_DAYS, HARMONIC_DAYS,
+    SUBDIVISION_DIVISORS, SUBDIVISION_COUNT_EXACT_LIMIT, subdivision_count_floats,
+)
+
+# ════════════════════════════════════════════════════════════════
+#  Batch conversion of int64 unix timestamps → Kai coordinates
+#  • Offline/analytics helper; numpy is not needed by the API itself and
+#    is only in requirements-dev.txt (the Vercel bundle stays small).
+#  • Same exact floors as mu_since_genesis / _mu_project_to_grid /
+#    solar_window_mu: every field equals the scalar get_eternal_klock value.
+#  • int64 only; products that would overflow are split (see below).
+# ════════════════════════════════════════════════════════════════
+
+_UNIT_TO_US = {"ms": 1_000, "us": 1}
+
+# Inputs must satisfy |μs since genesis| < 2^62 (≈146,000 years) so the
+# 32-bit limb arithmetic below never overflows uint64.
+_MAX_ABS_US = (1 << 62) - 1
+
+# 2^96 / (3+√5) as three 32-bit limbs — same reciprocal as the scalar engine
+_RECIP_SHIFT = 96
+_RECIP = (KAI_PULSE_SCALE << _RECIP_SHIFT) // KAI_PULSE_SCALED
+_R0, _R1, _R2 = (np.uint64((_RECIP >> s) & 0xFFFFFFFF) for s in (0, 32, 64))
+_M32 = np.uint64(0xFFFFFFFF)
+_S32 = np.uint64(32)
+
+# φ-day μ → grid μ without the 64-bit overflow of x × 17,424,000,000:
+#   x·G // D = x − ceil(x·(D − G) / D), and x·(D − G) < 2^61 for x < D
+_PHI_MINUS_GRID_MU = UPULSES_PER_DAY - UPULSES_PER_GRID_DAY   # 67,270,421
+
+KAI_BATCH_DTYPE = np.dtype([
+    ("mu", np.int64),
+    ("kaiPulseEternal", np.int64),
+    ("eternalKaiPulseToday", np.int64),
+    ("kaiPulseToday", np.int64),
+    ("eternalBeatIndex", np.int8),
+    ("eternalStepIndex", np.int8),
+    ("eternalPercentIntoStep", np.float64),
+    ("eternalPercentOfBeat", np.float64),
+    ("solarBeatIndex", np.int8),
+    ("solarStepIndex", np.int8),
+    ("solarPercentIntoStep", np.float64),
+    ("harmonicDayCount", np.int64),
+    ("weekDayIndex", np.int8),
+    ("dayOfMonth", np.int16),
+    ("weekIndex", np.int8),
+    ("eternalMonthIndex", np.int8),
+    ("harmonicYearIndex", np.int64),
+    ("solarDayIndex", np.int64),
+    ("solarDayOfMonth", np.int16),
+    ("solarWeekIndex", np.int8),
+    ("solarMonthIndex", np.int8),
+])
+
+
+def _floor_us_to_mu(a: np.ndarray) -> np.ndarray:
+    """floor(a / (3+√5)) for 0 <= a < 2^62 — vector twin of kai_klock._floor_us_to_mu."""
+    a0 = a & _M32
+    a1 = a >> _S32
+    # a × R as 32-bit columns; each partial product < 2^62, column sums < 2^35
+    p00, p01, p02 = a0 * _R0, a0 * _R1, a0 * _R2
+    p10, p11, p12 = a1 * _R0, a1 * _R1, a1 * _R2
+    c1 = (p00 >> _S32) + (p01 & _M32) + (p10 & _M32)
+    c2 = (p01 >> _S32) + (p10 >> _S32) + (p02 & _M32) + (p11 & _M32) + (c1 >> _S32)
+    c3 = (p02 >> _S32) + (p11 >> _S32) + (p12 & _M32) + (c2 >> _S32)
+    c4 = (p12 >> _S32) + (c3 >> _S32)
+    q = (c4 << _S32) | (c3 & _M32)
+    # Low 96 bits: top limb c2, then c1:p00. One short only near a carry.
+    low64 = ((c1 & _M32) << _S32) | (p00 & _M32)
+    maybe_short = ((c2 & _M32) == _M32) & (low64 >= ~a)
+    q = q.astype(np.int64)
+    if maybe_short.any():
+        idx = np.flatnonzero(maybe_short)
+        q[idx] = [mu_from_us_since_genesis(int(v)) for v in a[idx]]
+    return q
+
+
+def mu_since_genesis_batch(ts, unit: str = "ms") -> np.ndarray:
+    """
+    Vector Chronos→μpulses for int64 unix timestamps in `unit` ("ms" or "us").
+    Element-wise identical to mu_since_genesis(datetime).
+    """
+    try:
+        scale = _UNIT_TO_US[unit]
+    except KeyError:
+        raise ValueError(f"unit must be one of {sorted(_UNIT_TO_US)}, got {unit!r}") from None
+    ts = np.asarray(ts, dtype=np.int64)
+    if ts.size and (int(ts.max()) * scale - ETERNAL_GENESIS_UNIX_US > _MAX_ABS_US
+                    or int(ts.min()) * scale - ETERNAL_GENESIS_UNIX_US < -_MAX_ABS_US):
+        raise ValueError("timestamp outside the supported ±2^62 μs range around genesis")
+    us = ts * np.int64(scale) - np.int64(ETERNAL_GENESIS_UNIX_US)
+    neg = us < 0
+    q = _floor_us_to_mu(np.abs(us).astype(np.uint64))
+    # a / (3+√5) is never an integer for 0 < a < 2^62 (the reduced denominator
+    # of the 60-digit breath exceeds 2^64), so negatives floor to −q − 1.
+    return np.where(neg, -q - 1, q)
+
+
+def _mu_project_to_grid(mu_in_phi_day: np.ndarray) -> np.ndarray:
+    x = mu_in_phi_day
+    return x - (x * _PHI_MINUS_GRID_MU + (UPULSES_PER_DAY - 1)) // UPULSES_PER_DAY
+
+
+def _trunc_mod(a: np.ndarray, m: int) -> np.ndarray:
+    """Remainder with the sign of the dividend (Decimal % semantics)."""
+    return np.fmod(a, m)
+
+
+def _fill(out: np.ndarray, mu: np.ndarray) -> None:
+    mu_into_eternal_day = mu % UPULSES_PER_DAY
+    mu_since_sunrise = mu - MU_SUNRISE0
+    solar_day_index = mu_since_sunrise // UPULSES_PER_DAY
+    mu_into_solar_day = mu_since_sunrise - solar_day_index * UPULSES_PER_DAY
+
+    pulse = mu // UPULSES_PER_PULSE
+    out["mu"] = mu
+    out["kaiPulseEternal"] = pulse
+    out["eternalKaiPulseToday"] = mu_into_eternal_day // UPULSES_PER_PULSE
+    out["kaiPulseToday"] = mu_into_solar_day // UPULSES_PER_PULSE
+
+    # Grid beats/steps + quantized percents (floor to millionths, clamped)
+    for prefix, mu_in_day in (("eternal", mu_into_eternal_day), ("solar", mu_into_solar_day)):
+        beat, mu_in_beat = np.divmod(_mu_project_to_grid(mu_in_day), UPULSES_PER_GRID_BEAT)
+        step, mu_in_step = np.divmod(mu_in_beat, UPULSES_PER_GRID_STEP)
+        out[f"{prefix}BeatIndex"] = beat
+        out[f"{prefix}StepIndex"] = step
+        step_ppm = np.minimum((mu_in_step * 100_000_000) // UPULSES_PER_GRID_STEP, 99_999_999)
+        out[f"{prefix}PercentIntoStep"] = step_ppm / 1_000_000
+        if prefix == "eternal":
+            beat_ppm = np.minimum((mu_in_beat * 100_000_000) // UPULSES_PER_GRID_BEAT, 99_999_999)
+            out["eternalPercentOfBeat"] = beat_ppm / 1_000_000
+
+    # φ calendar on whole pulses (μ-scaled so each period is an integer)
+    mu_whole = pulse * UPULSES_PER_PULSE
+    days_elapsed = _trunc_mod(mu_whole, UPULSES_PER_MONTH) // UPULSES_PER_DAY
+    out["harmonicDayCount"] = mu_whole // UPULSES_PER_DAY
+    out["weekDayIndex"] = (_trunc_mod(mu_whole, UPULSES_PER_WEEK) // UPULSES_PER_DAY) % len(HARMONIC_DAYS)
+    out["dayOfMonth"] = days_elapsed + 1
+    out["weekIndex"] = days_elapsed // 6 + 1
+    out["eternalMonthIndex"] = (mu_whole // UPULSES_PER_MONTH) % 8 + 1
+    out["harmonicYearIndex"] = mu_whole // UPULSES_PER_YEAR
+
+    out["solarDayIndex"] = solar_day_index
+    out["solarDayOfMonth"] = solar_day_index % HARMONIC_MONTH_DAYS + 1
+    out["solarWeekIndex"] = (solar_day_index // 6) % 7 + 1
+    out["solarMonthIndex"] = (solar_day_index // HARMONIC_MONTH_DAYS) % 8 + 1
+
+
+def kai_coordinates_batch(ts, unit: str = "ms", chunk_size: int = 1 << 18) -> np.ndarray:
+    """
+    Convert an int64 array of unix timestamps (`unit` "ms" or "us") to a
+    structured array (KAI_BATCH_DTYPE) of Kai coordinates. Field names follow
+    KaiKlockResponse where one exists; percents are the exact quantized values
+    the scalar path returns. Work proceeds in chunks to bound temporaries.
+    """
+    ts = np.asarray(ts, dtype=np.int64)
+    flat = ts.ravel()
+    out = np.empty(flat.shape, dtype=KAI_BATCH_DTYPE)
+    for start in range(0, flat.size, chunk_size):
+        stop = start + chunk_size
+        _fill(out[start:stop], mu_since_genesis_batch(flat[start:stop], unit))
+    return out.reshape(ts.shape)
+
+
+SUBDIVISION_BATCH_DTYPE = np.dtype([(name, np.float64) for name in SUBDIVISION_DIVISORS])
+
+_MAX_DIVISOR = max(SUBDIVISION_DIVISORS.values())
+
+
+def subdivision_counts_batch(pulses) -> np.ndarray:
+    """
+    Subdivision `count` for an int64 array of eternal pulses, as a structured
+    array (SUBDIVISION_BATCH_DTYPE). Element-wise equal to the scalar counts in
+    build_subdivisions_live; rows with |pulse × n| >= 2^53 use the scalar path.
+    """
+    pulses = np.asarray(pulses, dtype=np.int64)
+    flat = pulses.ravel()
+    out = np.empty(flat.shape, dtype=SUBDIVISION_BATCH_DTYPE)
+    as_float = flat.astype(np.float64)
+    for name, n in SUBDIVISION_DIVISORS.items():
+        out[name] = as_float * n
+    large = np.flatnonzero(np.abs(flat) >= SUBDIVISION_COUNT_EXACT_LIMIT // _MAX_DIVISOR + 1)
+    for i in large:
+        out[i] = tuple(subdivision_count_floats(int(flat[i])).values())
+    return out.reshape(pulses.shape)
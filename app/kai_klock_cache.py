@@ -0,0 +1,215 @@
+# kai_klock_cache.py  •  /kai result cache (per-pulse layers, LRU + request coalescing)
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Dict, Optional
+
+from pydantic_core import to_json
+
+from kai_klock import (
+    KAI_MU_FIELDS, KAI_PULSE_FIELDS, KAI_RESPONSE_FIELDS, UPULSES_PER_PULSE,
+    get_eternal_klock_data, get_kai_fields_data, get_kai_fields_data_at_mu, mu_since_genesis_int, _ensure_utc,
+)
+from kai_klock_models import KaiKlockResponse
+
+_MU_FIELD_SET = frozenset(KAI_MU_FIELDS)
+
+# ════════════════════════════════════════════════════════════════
+#  Kai state is a pure function of the μpulse count. About a third of a
+#  payload (KAI_PULSE_FIELDS: eternal calendar, spiral epochs,
+#  subdivisions) depends on the eternal pulse alone; it is kept as a
+#  per-pulse layer, already in response field order. A payload is a copy
+#  of its pulse's layer overlaid with the μ-level fields (beats, steps,
+#  percents, day pulses, seals), so polling "now" costs a layer lookup
+#  plus the overlay.
+#  Instants are floored to `resolution_mu` μpulses (KAI_CACHE_RESOLUTION_MU;
+#  1 = exact). Whole payloads are kept in an LRU keyed by that floored μ:
+#  fixed moments (override_time, pulse) always, "now" only when the
+#  resolution is coarser than one μpulse (at 1 μ it never repeats).
+#  Concurrent misses on one key share a single computation.
+#  An entry holds the JSON-ready payload (typed like the model, in field
+#  order); its JSON bytes (for /kai) and the validated model are made on
+#  first use. Layer values are shared between entries: read-only.
+# ════════════════════════════════════════════════════════════════
+
+class KaiCacheEntry:
+    __slots__ = ("data", "_body", "_model")
+
+    def __init__(self, data: dict):
+        self.data = data
+        self._body: Optional[bytes] = None
+        self._model: Optional[KaiKlockResponse] = None
+
+    @property
+    def body(self) -> bytes:
+        """JSON bytes, identical to FastAPI's serialization of the model."""
+        if self._body is None:
+            self._body = to_json(self.data)
+        return self._body
+
+    @property
+    def model(self) -> KaiKlockResponse:
+        if self._model is None:
+            self._model = KaiKlockResponse(**self.data)
+        return self._model
+
+
+class KaiResponseCache:
+    def __init__(self, maxsize: int = 4096, resolution_mu: int = 1, layers: int = 64):
+        if resolution_mu < 1:
+            raise ValueError("resolution_mu must be >= 1")
+        self.maxsize = maxsize
+        self.resolution_mu = resolution_mu
+        self.layers = layers
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[int, KaiCacheEntry]" = OrderedDict()
+        self._layers: "OrderedDict[int, dict]" = OrderedDict()
+        self._inflight: Dict[int, Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.uncached = 0
+        self.layer_hits = 0
+        self.layer_misses = 0
+
+    def get(self, now: Optional[datetime] = None) -> KaiKlockResponse:
+        """Kai-Klock payload at `now` (UTC now when omitted)."""
+        return self.entry(now).model
+
+    def get_data(self, now: Optional[datetime] = None) -> dict:
+        """Equal to get(now).model_dump(mode="json"), shared with the cache (read-only)."""
+        return self.entry(now).data
+
+    def get_json(self, now: Optional[datetime] = None) -> bytes:
+        """get(now) as JSON bytes (the /kai response body)."""
+        return self.entry(now).body
+
+    def _key(self, now: Optional[datetime]) -> tuple:
+        """(μpulse `now` is served at, whether whole payloads at it are kept)."""
+        mu = mu_since_genesis_int(_ensure_utc(now or datetime.utcnow()))
+        return mu - mu % self.resolution_mu, now is not None or self.resolution_mu > 1
+
+    def _layer(self, kai_pulse_eternal: int) -> dict:
+        """Response-ordered dict with the pulse's KAI_PULSE_FIELDS (μ-level fields None)."""
+        with self._lock:
+            layer = self._layers.get(kai_pulse_eternal)
+            if layer is not None:
+                self._layers.move_to_end(kai_pulse_eternal)
+                self.layer_hits += 1
+                return layer
+            self.layer_misses += 1
+        # Pure and cheap next to a whole payload: a racing miss just builds it twice
+        layer = dict.fromkeys(KAI_RESPONSE_FIELDS)
+        layer.update(get_kai_fields_data_at_mu(KAI_PULSE_FIELDS, kai_pulse_eternal * UPULSES_PER_PULSE))
+        with self._lock:
+            self._layers[kai_pulse_eternal] = layer
+            while len(self._layers) > self.layers:
+                self._layers.popitem(last=False)
+        return layer
+
+    def _payload(self, mu: int) -> dict:
+        data = self._layer(mu // UPULSES_PER_PULSE).copy()
+        data.update(get_kai_fields_data_at_mu(KAI_MU_FIELDS, mu))
+        return data
+
+    def entry(self, now: Optional[datetime] = None) -> KaiCacheEntry:
+        """The payload at `now`; a kept moment is computed once (concurrent misses share it)."""
+        if self.maxsize <= 0:
+            with self._lock:
+                self.uncached += 1
+            return KaiCacheEntry(get_eternal_klock_data(now))
+        key, keep = self._key(now)
+        if not keep:
+            with self._lock:
+                self.uncached += 1
+            return KaiCacheEntry(self._payload(key))
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return hit
+            fut = self._inflight.get(key)
+            owner = fut is None
+            if owner:
+                fut = self._inflight[key] = Future()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+        if not owner:
+            return fut.result()
+
+        try:
+            value = KaiCacheEntry(self._payload(key))
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            fut.set_exception(exc)
+            raise
+        with self._lock:
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            del self._inflight[key]
+        fut.set_result(value)
+        return value
+
+    def get_fields(self, fields: tuple, now: Optional[datetime] = None) -> dict:
+        """
+        JSON-ready projection (`fields` as from resolve_kai_fields) at `now`. A
+        kept payload is sliced; otherwise per-pulse fields come from the layer
+        and only the requested μ-level fields are computed. Values may be shared
+        with the cache (read-only).
+        """
+        if self.maxsize <= 0:
+            with self._lock:
+                self.uncached += 1
+            return get_kai_fields_data(fields, now)
+        key, keep = self._key(now)
+        with self._lock:
+            hit = self._data.get(key) if keep else None
+            if hit is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+            else:
+                self.uncached += 1
+        if hit is not None:
+            return {f: hit.data[f] for f in fields}
+        mu_fields = tuple(f for f in fields if f in _MU_FIELD_SET)
+        values = get_kai_fields_data_at_mu(mu_fields, key) if mu_fields else {}
+        if len(mu_fields) < len(fields):
+            layer = self._layer(key // UPULSES_PER_PULSE)
+            return {f: values[f] if f in values else layer[f] for f in fields}
+        return values
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._layers.clear()
+            self.hits = self.misses = self.coalesced = self.uncached = 0
+            self.layer_hits = self.layer_misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "uncached": self.uncached,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "resolutionMu": self.resolution_mu,
+                "layerHits": self.layer_hits,
+                "layerMisses": self.layer_misses,
+                "layers": len(self._layers),
+            }
+
+# Process-wide cache used by /kai (KAI_CACHE_SIZE=0 disables it)
+kai_cache = KaiResponseCache(
+    maxsize=int(os.getenv("KAI_CACHE_SIZE", "4096")),
+    resolution_mu=int(os.getenv("KAI_CACHE_RESOLUTION_MU", "1")),
+)
@@ -0,0 +1,93 @@
+# kai_klock_format.py  •  Kai seal / format-template compiler
+from __future__ import annotations
+
+import functools
+import re
+from typing import Callable, Dict, Tuple
+
+# ════════════════════════════════════════════════════════════════
+#  Format language
+#   %X        value of directive X (table below)
+#   %0NX      zero-padded to width N      (e.g. %02B → "07", %010p → "048.212772";
+#                                         numbers and percents only, not names)
+#   %NX       right-aligned to width N    (e.g. %2d  → " 7")
+#   %-NX      left-aligned to width N     (e.g. %-9N → "Solhara  ")
+#   %%        a literal "%"; a "%" not followed by a directive is literal
+#  A template compiles once into (literal, getter, format spec) parts; the
+#  renderer calls only the getters of the directives used on a Kai moment
+#  (see kai_klock._KaiMoment).
+# ════════════════════════════════════════════════════════════════
+
+# directive → (getter over the moment, description)
+KAI_FORMAT_DIRECTIVES: Dict[str, Tuple[Callable, str]] = {
+    "B": (lambda m: m.s["eternal_beat_idx"], "eternal beat (0..35)"),
+    "S": (lambda m: m.s["eternal_step_idx"], "eternal step (0..43)"),
+    "p": (lambda m: m.s["eternal_percent_into_step"], "eternal percent into step"),
+    "P": (lambda m: m.s["eternal_percent_of_beat"], "eternal percent of beat"),
+    "b": (lambda m: m.s["solar_beat_idx"], "solar beat (0..35)"),
+    "s": (lambda m: m.s["solar_step_idx"], "solar step (0..43)"),
+    "q": (lambda m: m.s["solar_percent_into_step"], "solar percent into step"),
+    "K": (lambda m: m.s["kai_pulse_eternal"], "eternal Kai pulse"),
+    "k": (lambda m: m.s["eternal_kai_pulse_today"], "Kai pulse into the eternal day"),
+    "t": (lambda m: m.s["kai_pulse_today"], "Kai pulse into the solar day"),
+    "y": (lambda m: m.s["harmonic_year_idx"], "harmonic year index"),
+    "u": (lambda m: m.s["week_day_idx"] + 1, "eternal weekday (1..6)"),
+    "e": (lambda m: m.s["eternal_arc_idx"] + 1, "eternal ark (1..6)"),
+    "L": (lambda m: m.phi_spiral_lvl, "phi spiral level"),
+    "d": (lambda m: m.day["day_of_month"], "eternal day of month (1..42)"),
+    "m": (lambda m: m.day["eternal_month_idx"], "eternal month (1..8)"),
+    "w": (lambda m: m.day["week_idx"], "eternal week (1..7)"),
+    "N": (lambda m: m.day["harmonic_day"], "eternal weekday name"),
+    "O": (lambda m: m.day["eternal_month"], "eternal month name"),
+    "W": (lambda m: m.day["week_name"], "eternal week name"),
+    "V": (lambda m: m.day["week_name"].split()[-1], "eternal week name, last word"),
+    "A": (lambda m: m.eternal_chakra_arc, "eternal ark name"),
+    "D": (lambda m: m.solar["solar_day_of_month"], "solar day of month (1..42)"),
+    "M": (lambda m: m.solar["solar_month_index"], "solar month (1..8)"),
+    "n": (lambda m: m.solar["solar_day_name"], "solar weekday name"),
+    "a": (lambda m: m.chakra_arc, "solar ark name"),
+}
+
+_TOKEN = re.compile(r"%(?:(%)|(?P<flag>[-0])?(?P<width>\d{1,3})?(?P<directive>[A-Za-z]))")
+_ALIGN = {None: ">", "-": "<", "0": "0"}
+# Directives that render names; zero padding is rejected for them
+_TEXT_DIRECTIVES = frozenset("NOWVAna")
+# Percents held as fixed-point decimal strings; zero padding goes after the
+# sign like a number's (str.zfill), never after the digits
+_DECIMAL_TEXT_DIRECTIVES = frozenset("pPq")
+
+
+@functools.lru_cache(maxsize=256)
+def compile_kai_format(template: str) -> Callable:
+    """
+    Compile `template` into `render(moment) -> str`. Raises ValueError for an
+    unknown directive letter or a zero flag on a name directive.
+    """
+    parts = []
+    literal = ""
+    pos = 0
+    for match in _TOKEN.finditer(template):
+        literal += template[pos:match.start()]
+        pos = match.end()
+        if match.group(1):
+            literal += "%"
+            continue
+        directive, flag, width = match.group("directive", "flag", "width")
+        if directive not in KAI_FORMAT_DIRECTIVES:
+            raise ValueError(f"Unknown format directive %{directive} at position {match.start()}")
+        if flag == "0" and directive in _TEXT_DIRECTIVES:
+            raise ValueError(f"Zero padding does not apply to %{directive} (a name) at position {match.start()}; "
+                             f"use %{width or ''}{directive} or %-{width or ''}{directive}")
+        get = KAI_FORMAT_DIRECTIVES[directive][0]
+        spec = f"{_ALIGN[flag]}{width}" if width else ""
+        if flag == "0" and directive in _DECIMAL_TEXT_DIRECTIVES:
+            get, spec = (lambda m, get=get, width=int(width or 0): get(m).zfill(width)), ""
+        parts.append((literal, get, spec))
+        literal = ""
+    parts = tuple(parts)
+    tail = literal + template[pos:]
+
+    def render(m) -> str:
+        return "".join([text + format(get(m), spec) for text, get, spec in parts]) + tail
+
+    return render
@@ -159,4 +159,67 @@ class KaiKlockResponse(BaseModel):
     subdivisions: Dict[str, Subdivision]
 
 
-    
\ No newline at end of file
+    
+
+# ────────────────────────────────────────────────────────────────
+# ── Inverse Conversion (Kai → Chronos) ──────────────────────────
+# ────────────────────────────────────────────────────────────────
+
+class KaiChronosInstant(BaseModel):
+    mu: int               # target μpulse (first μpulse of the coordinate)
+    kaiPulseEternal: int  # whole pulse containing that μpulse
+    unix: int             # first unix instant (in `unit`) reaching `mu`
+    unit: str             # "ms" | "us"
+    utc: str              # ISO-8601 of `unix`
+
+
+class KaiSubdivisions(BaseModel):
+    kaiPulseEternal: int
+    subdivisions: Dict[str, Subdivision]
+
+
+# ────────────────────────────────────────────────────────────────
+# ── Compact Coordinates (/kai/lite) ─────────────────────────────
+# ────────────────────────────────────────────────────────────────
+
+class KaiLite(BaseModel):
+    """
+    Integer-only Kai coordinates, schema version `v`. Percents are ppm
+    (0..999,999, floored); names are codes: wd/swd index the six harmonic
+    days, ea/sa the six chakra arks (0-based); d/w/m are 1-based like
+    dayOfMonth / weekIndex / eternalMonthIndex.
+    """
+    v: int     # schema version
+    p: int     # kaiPulseEternal
+    mu: int    # μpulses into the pulse (0..999,999)
+    eb: int    # eternal beat (0..35)
+    es: int    # eternal step (0..43)
+    ebp: int   # eternal percent of beat, ppm
+    esp: int   # eternal percent into step, ppm
+    sb: int    # solar beat (0..35)
+    ss: int    # solar step (0..43)
+    ssp: int   # solar percent into step, ppm
+    d: int     # eternal day of month (1..42)
+    w: int     # eternal week (1..7)
+    wd: int    # eternal weekday code (0..5)
+    m: int     # eternal month (1..8)
+    y: int     # harmonic year index
+    sd: int    # solar day of month (1..42)
+    sw: int    # solar week (1..7)
+    swd: int   # solar weekday code (0..5)
+    sm: int    # solar month (1..8)
+    ea: int    # eternal ark code (0..5)
+    sa: int    # solar ark code (0..5)
+    ps: int    # phi spiral level
+
+
+# ────────────────────────────────────────────────────────────────
+# ── Boundary Schedule (/kai/boundaries) ─────────────────────────
+# ────────────────────────────────────────────────────────────────
+
+class KaiBoundary(BaseModel):
+    unit: str     # step | beat | arc | day | month | year | spiral
+    frame: str    # eternal | solar
+    mu: int       # first μpulse of the new value
+    unixMs: int   # first unix ms at which it is reported
+    utc: str      # ISO-8601 (μs) of the first instant reaching `mu`
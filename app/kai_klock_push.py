@@ -0,0 +1,131 @@
+# kai_klock_push.py  •  shared-ticker push of Kai state (/kai/ws, /kai/stream)
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from datetime import datetime, timezone
+from typing import Dict, Optional, Set, Tuple
+
+from kai_klock import mu_since_genesis_int, datetime_at_mu, unix_at_mu, kai_lite_at_mu
+from kai_klock_range import kai_lattice
+
+# ════════════════════════════════════════════════════════════════
+#  One ticker per (unit, frame) sleeps until the next lattice boundary,
+#  computes that state once and fans the serialized message out to every
+#  subscriber. Each subscriber owns a bounded queue; when it is full the
+#  oldest message is dropped, so a slow client always catches up to the
+#  latest state instead of stalling the ticker. Tickers start with their
+#  first subscriber and stop with their last.
+# ════════════════════════════════════════════════════════════════
+
+KAI_PUSH_UNITS = ("pulse", "step", "beat")
+
+
+def _kai_message(mu: int) -> str:
+    """Push payload: the /kai/range sample (unixMs + KaiLite) at μpulse `mu`."""
+    return json.dumps({"unixMs": unix_at_mu(mu), **kai_lite_at_mu(mu).model_dump()}, separators=(",", ":"))
+
+
+def _mu_now() -> int:
+    return mu_since_genesis_int(datetime.now(timezone.utc))
+
+
+class KaiSubscription:
+    def __init__(self, ticker: "KaiTicker", maxsize: int):
+        self.ticker = ticker
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def offer(self, message: str) -> None:
+        """Enqueue without blocking; drop the oldest message when full."""
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+    async def get(self) -> str:
+        return await self.queue.get()
+
+    def close(self) -> None:
+        self.ticker.unsubscribe(self)
+
+
+class KaiTicker:
+    def __init__(self, hub: "KaiPushHub", every: str, frame: str):
+        self.hub = hub
+        self.every = every
+        self.frame = frame
+        self.subscribers: Set[KaiSubscription] = set()
+        self.latest = _kai_message(_mu_now())
+        self.ticks = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, maxsize: int) -> KaiSubscription:
+        sub = KaiSubscription(self, maxsize)
+        sub.offer(self.latest)
+        self.subscribers.add(sub)
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return sub
+
+    def unsubscribe(self, sub: KaiSubscription) -> None:
+        self.subscribers.discard(sub)
+        if not self.subscribers:
+            if self._task is not None:
+                self._task.cancel()
+                self._task = None
+            self.hub._tickers.pop((self.every, self.frame), None)
+
+    def _next_boundary(self, mu_now: int) -> int:
+        return next(kai_lattice(mu_now + 1, None, self.every, self.frame))
+
+    async def _run(self) -> None:
+        boundary = self._next_boundary(_mu_now())
+        while self.subscribers:
+            delay = (datetime_at_mu(boundary) - datetime.now(timezone.utc)).total_seconds()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            # Reached (or overslept past) boundaries: publish only the latest one.
+            mu_now = _mu_now()
+            for later in kai_lattice(boundary + 1, mu_now + 1, self.every, self.frame):
+                boundary = later
+            self.latest = _kai_message(boundary)
+            self.ticks += 1
+            for sub in self.subscribers:
+                sub.offer(self.latest)
+            boundary = self._next_boundary(mu_now)
+
+
+class KaiPushHub:
+    def __init__(self, queue_size: int = 8):
+        if queue_size < 1:
+            raise ValueError("queue_size must be >= 1")
+        self.queue_size = queue_size
+        self._tickers: Dict[Tuple[str, str], KaiTicker] = {}
+
+    def subscribe(self, every: str = "step", frame: str = "eternal") -> KaiSubscription:
+        """Subscribe to state at each `every` boundary; call from the event loop."""
+        if every not in KAI_PUSH_UNITS:
+            raise ValueError(f"every must be one of {KAI_PUSH_UNITS}, got {every!r}")
+        if frame not in ("eternal", "solar"):
+            raise ValueError(f"frame must be 'eternal' or 'solar', got {frame!r}")
+        ticker = self._tickers.get((every, frame))
+        if ticker is None:
+            ticker = self._tickers[(every, frame)] = KaiTicker(self, every, frame)
+        return ticker.subscribe(self.queue_size)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            f"{every}/{frame}": {
+                "subscribers": len(t.subscribers),
+                "ticks": t.ticks,
+                "dropped": sum(s.dropped for s in t.subscribers),
+            }
+            for (every, frame), t in self._tickers.items()
+        }
+
+
+# Process-wide hub used by /kai/ws and /kai/stream
+kai_push = KaiPushHub(queue_size=int(os.getenv("KAI_PUSH_QUEUE_SIZE", "8")))
@@ -0,0 +1,176 @@
+# kai_klock_range.py  •  Kai timeline over a Chronos range (μpulse lattice walk)
+from __future__ import annotations
+
+import functools
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from kai_klock import (
+    ETERNAL_GENESIS_UNIX_US, MU_SUNRISE0, UPULSES_PER_PULSE, UPULSES_PER_DAY,
+    UPULSES_PER_MONTH, UPULSES_PER_YEAR, GRID_BEATS_PER_DAY, GRID_STEPS_PER_BEAT, PHI_SPIRAL_MAX_LEVEL,
+    mu_at_grid, mu_from_us_since_genesis, mu_since_genesis_int, unix_at_mu, datetime_at_mu,
+    kai_lite_at_mu, get_kai_fields_at_mu, phi_spiral_level_start, _floor_log_phi,
+    _ensure_utc, UNIX_EPOCH,
+)
+
+# ════════════════════════════════════════════════════════════════
+#  A timeline is a walk along one lattice of μpulse boundaries:
+#   • pulse — every whole pulse (μ multiple of 1,000,000)
+#   • step / beat — the first μpulse of each grid Step / Beat, eternal or
+#     sunrise-anchored solar frame
+#   • arc — the first μpulse of each of the six arks of a φ-day (the ark
+#     turns on whole pulses into the day)
+#   • day — the first μpulse of each φ-day (as mu_at_grid: eternal days turn
+#     with the calendar, on a whole pulse)
+#  Points are generated from fixed in-day offsets plus integer day deltas,
+#  and each sample is built directly from its μpulse count, so nothing is
+#  recomputed from a Chronos instant and memory stays flat.
+# ════════════════════════════════════════════════════════════════
+
+KAI_RANGE_UNITS = ("pulse", "step", "beat", "arc", "day")
+
+
+@functools.lru_cache(maxsize=None)
+def _day_offsets(every: str) -> tuple:
+    """μ offsets of each boundary from the start of a φ-day."""
+    if every == "day":
+        return (0,)
+    if every == "arc":
+        # ark k begins at the first whole pulse t into the day with t × 6 ≥ k × φ-day
+        return tuple(-(-k * UPULSES_PER_DAY // (6 * UPULSES_PER_PULSE)) * UPULSES_PER_PULSE for k in range(6))
+    if every == "beat":
+        return tuple(mu_at_grid(0, beat) for beat in range(GRID_BEATS_PER_DAY))
+    return tuple(
+        mu_at_grid(0, beat, step)
+        for beat in range(GRID_BEATS_PER_DAY)
+        for step in range(GRID_STEPS_PER_BEAT)
+    )
+
+
+def kai_lattice(start_mu: int, end_mu: Optional[int], every: str = "step", frame: str = "eternal") -> Iterator[int]:
+    """Lattice μpulses in [start_mu, end_mu), ascending (end_mu=None: unbounded)."""
+    if every not in KAI_RANGE_UNITS:
+        raise ValueError(f"every must be one of {KAI_RANGE_UNITS}, got {every!r}")
+    if frame not in ("eternal", "solar"):
+        raise ValueError(f"frame must be 'eternal' or 'solar', got {frame!r}")
+    if end_mu is None:
+        end_mu = float("inf")
+    if every == "pulse":
+        mu = -(-start_mu // UPULSES_PER_PULSE) * UPULSES_PER_PULSE
+        while mu < end_mu:
+            yield mu
+            mu += UPULSES_PER_PULSE
+        return
+
+    offsets = _day_offsets(every)
+    origin = MU_SUNRISE0 if frame == "solar" else 0
+    day = (start_mu - origin) // UPULSES_PER_DAY
+    day_mu = origin + day * UPULSES_PER_DAY
+    while day_mu < end_mu:
+        for offset in offsets:
+            mu = day_mu + offset
+            if every == "day" and frame == "eternal":
+                mu = mu_at_grid(day)  # the calendar day turns on a whole pulse
+            if mu >= end_mu:
+                return
+            if mu >= start_mu:
+                yield mu
+        day += 1
+        day_mu += UPULSES_PER_DAY
+
+
+def mu_window(start: datetime, end: datetime) -> tuple:
+    """
+    [start_mu, end_mu) holding exactly the μpulses whose first instant
+    (unix_at_mu, μs) lies in [start, end).
+    """
+    def us(at: datetime) -> int:
+        delta = _ensure_utc(at) - UNIX_EPOCH
+        return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds - ETERNAL_GENESIS_UNIX_US
+    return (mu_from_us_since_genesis(us(start) - 1) + 1,
+            mu_from_us_since_genesis(us(end) - 1) + 1)
+
+
+def kai_range(
+    start: datetime,
+    end: datetime,
+    every: str = "step",
+    frame: str = "eternal",
+    fields: Optional[tuple] = None,
+) -> Iterator[dict]:
+    """
+    Kai samples at each `every` boundary starting in [start, end).
+    Each sample is {"unixMs": first unix ms of the boundary, **state}, where
+    state is KaiLite (default) or the KaiKlockResponse `fields` projection.
+    """
+    start_mu, end_mu = mu_window(start, end)
+    for mu in kai_lattice(start_mu, end_mu, every, frame):
+        if fields is None:
+            state = kai_lite_at_mu(mu).model_dump()
+        else:
+            state = get_kai_fields_at_mu(fields, mu).model_dump(mode="json")
+        yield {"unixMs": unix_at_mu(mu), **state}
+
+
+# ════════════════════════════════════════════════════════════════
+#  Boundary schedule — the next transitions after an instant, from the
+#  exact μpulse periods (no sampling):
+#   • step / beat / arc / day — lattice above (eternal or solar frame)
+#   • month / year — eternal: the calendar turns on the first whole pulse
+#     reaching k × UPULSES_PER_MONTH / _YEAR; solar: every 42 / 336
+#     sunrise-anchored φ-days from genesis_sunrise
+#   • spiral — first pulse of the next φ-spiral levels (frame-independent)
+# ════════════════════════════════════════════════════════════════
+
+KAI_BOUNDARY_UNITS = ("step", "beat", "arc", "day", "month", "year", "spiral")
+
+_CALENDAR_PERIOD_MU = {"month": UPULSES_PER_MONTH, "year": UPULSES_PER_YEAR}
+
+
+def _boundaries_after(mu_now: int, unit: str, frame: str) -> Iterator[int]:
+    if unit in ("step", "beat", "arc", "day"):
+        yield from kai_lattice(mu_now + 1, None, unit, frame)
+    elif unit in _CALENDAR_PERIOD_MU:
+        period = _CALENDAR_PERIOD_MU[unit]
+        if frame == "solar":
+            k = (mu_now - MU_SUNRISE0) // period + 1
+            while True:
+                yield MU_SUNRISE0 + k * period
+                k += 1
+        whole_mu = (mu_now // UPULSES_PER_PULSE) * UPULSES_PER_PULSE
+        k = whole_mu // period + 1
+        while True:
+            yield -(-k * period // UPULSES_PER_PULSE) * UPULSES_PER_PULSE
+            k += 1
+    elif unit == "spiral":
+        for level in range(_floor_log_phi(mu_now // UPULSES_PER_PULSE) + 1, PHI_SPIRAL_MAX_LEVEL + 1):
+            yield phi_spiral_level_start(level) * UPULSES_PER_PULSE
+    else:
+        raise ValueError(f"unit must be one of {KAI_BOUNDARY_UNITS}, got {unit!r}")
+
+
+def next_kai_boundaries(
+    unit: str, count: int = 1, now: Optional[datetime] = None, frame: str = "eternal"
+) -> List[Dict]:
+    """
+    The next `count` instants after `now` at which `unit` turns, as
+    {"unit", "frame", "mu", "unixMs", "utc"}; unixMs / utc are the first
+    millisecond / μs instant at which the new value is reported.
+    """
+    if frame not in ("eternal", "solar"):
+        raise ValueError(f"frame must be 'eternal' or 'solar', got {frame!r}")
+    if count < 0:
+        raise ValueError(f"count must be >= 0, got {count}")
+    mu_now = mu_since_genesis_int(_ensure_utc(now or datetime.utcnow()))
+    out: List[Dict] = []
+    for mu in _boundaries_after(mu_now, unit, frame):
+        if len(out) >= count:
+            break
+        out.append({
+            "unit": unit,
+            "frame": frame,
+            "mu": mu,
+            "unixMs": unix_at_mu(mu),
+            "utc": datetime_at_mu(mu).isoformat(timespec="microseconds").replace("+00:00", "Z"),
+        })
+    return out
@@ -0,0 +1,59 @@
+# kai_klock_static.py  •  documents rendered once per process, served as bytes
+from __future__ import annotations
+
+import gzip
+import hashlib
+from typing import Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+# A StaticDocument is encoded and gzip-compressed once; every request is then
+# a header check plus a bytes response:
+#   • ETag — content hash ("-gz" suffix for the compressed representation)
+#   • If-None-Match → 304 without a body
+#   • Accept-Encoding: gzip → the pre-compressed bytes
+STATIC_CACHE_CONTROL = "public, no-cache"   # cache, but revalidate (new deploy → new ETag)
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() in ("gzip", "*"):
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match evaluation (weak comparison, as RFC 9110 requires for it)."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    etag = etag.removeprefix("W/")
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+class StaticDocument:
+    def __init__(self, body: bytes, media_type: str, cache_control: str = STATIC_CACHE_CONTROL):
+        digest = hashlib.sha256(body).hexdigest()[:20]
+        self.media_type = media_type
+        self.cache_control = cache_control
+        self.body = body
+        self.etag = f'"{digest}"'
+        self.gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+        self.gzip_etag = f'"{digest}-gz"'
+
+    def respond(self, request: Request) -> Response:
+        compressed = _accepts_gzip(request.headers.get("accept-encoding"))
+        etag = self.gzip_etag if compressed else self.etag
+        headers: Dict[str, str] = {
+            "ETag": etag,
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        if compressed:
+            headers["Content-Encoding"] = "gzip"
+            return Response(self.gzip_body, media_type=self.media_type, headers=headers)
+        return Response(self.body, media_type=self.media_type, headers=headers)
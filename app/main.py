@@ -2,20 +2,35 @@
 # main.py  •  Kai-Klock API entry (KKS v1 grid parity, φ-klosure kalendar)
 from __future__ import annotations
 
+import asyncio
+import functools
+import importlib
+import json
 import os
 import sys
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta
+from html import escape
+from typing import List, Optional
 
-from fastapi import FastAPI, Query
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
 
 # make sure local imports work on Vercel / similar
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from kai_klock import get_eternal_klock
-from kai_klock_models import KaiKlockResponse  # ← single source of truth
+from kai_klock import (
+    kai_day_index, mu_at_grid, unix_at_mu, UNIX_EPOCH, UPULSES_PER_PULSE,
+    build_subdivisions_live, mu_since_genesis_int, _ensure_utc, resolve_kai_fields, get_kai_lite,
+    format_kai,
+)
+from kai_klock_models import (  # ← single source of truth
+    KaiKlockResponse, KaiChronosInstant, KaiSubdivisions, KaiLite, KaiBoundary,
+)
+from kai_klock_cache import kai_cache
+from kai_klock_range import kai_range, next_kai_boundaries, KAI_RANGE_UNITS, KAI_BOUNDARY_UNITS
+from kai_klock_push import kai_push, KAI_PUSH_UNITS
+from kai_klock_static import StaticDocument
 
 
 app = FastAPI(
@@ -236,16 +251,17 @@ Chronos duration: `≈ 5,877,066.861 × (3+√5) / 86,400 ≈ 356.166 chronos da
 The service computes spiral level **without floats**:
 
 ```python
-# Pure-Decimal floor(log_phi(n)): see service code (_floor_log_phi)
+# floor(log_phi(n)) by bisect over precomputed integer φ^k entry pulses
 phi_spiral_lvl = _floor_log_phi(kai_pulse_eternal)
+next_level_at  = next_phi_spiral_pulse(kai_pulse_eternal)
 ````
 
-**Thresholds (pulses to enter a level)** are `⌊Φ^n⌋`. For reference:
+**Thresholds (pulses to enter a level)** are `⌈Φ^n⌉` (`phi_spiral_level_start(n)`). For reference:
 
-* L32 → **4,870,846**
-* L33 → **7,881,196**
-* L34 → **12,752,042**
-* L35 → **20,633,239**
+* L32 → **4,870,847**
+* L33 → **7,881,197**
+* L34 → **12,752,043**
+* L35 → **20,633,240**
 * L36 → **33,385,282**
 
 ---
@@ -263,10 +279,15 @@ Primary fields (not exhaustive):
 
 ---
 
-### 🧪 Query Parameter
+### 🧪 Query Parameters
 
 * `override_time` (optional, ISO 8601):
   e.g. `'2024-05-10T06:45:40Z'` to reproduce a specific Kai moment.
+* `fields` / `exclude` (optional, comma-separated or repeated):
+  e.g. `fields=kaiPulseEternal,chakraStepString,eternalChakraBeat` returns only those
+  fields, and only their inputs are computed.
+* `format` (optional): a template such as `%B:%02S D%d/M%m %p%`, or a built-in seal
+  name (`eternalSeal`, `kairos_seal_day_month`, …); returns just that string as text.
 
 ---
 
@@ -362,11 +383,11 @@ It maintains **KKS v1 grid parity** for beats/steps and **φ-klosure** for kalen
       "name": "string",
       "phiPower": 0,
       "kaiPulses": 0,
-      "approxDays": "0",
+      "approxDays": 0.0,
       "description": "string",
       "kaiUntil": 0,
-      "daysUntil": "0",
-      "percentUntil": "0"
+      "daysUntil": 0.0,
+      "percentUntil": 0.0
     }
   ],
   "harmonicLevels": {
@@ -436,6 +457,48 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+# Sigil routes (Pillow, the render pool, the remote Kai client) are mounted by
+# the first request that can reach them — a /sigil path, or the OpenAPI
+# document / homepage that list them — so a cold start pays only for the Kai
+# time API. Mounting for "/" is deliberate: the homepage cards are built from
+# the full OpenAPI schema, and mounting imports only the route modules (about
+# 70 ms, once); Pillow, httpx and requests still load on first render / fetch.
+SIGIL_ROUTE_MODULES = (
+    "routes.kairos_sigil", "routes.sigil_stamp", "routes.sigil_batch", "routes.sigil_pool",
+    "routes.sigil_api", "routes.sigil_data_api", "routes.kai_upstream",
+)
+
+
+class MountOnFirstUse:
+    """ASGI middleware: include `modules`' routers into `target` on first use."""
+    def __init__(self, app, target: FastAPI, prefix: str, paths, modules) -> None:
+        self.app = app
+        self.target = target
+        self.prefix = prefix
+        self.paths = frozenset(paths)
+        self.modules = modules
+        self.mounted = False
+
+    def mount(self) -> None:
+        routers = [importlib.import_module(name).router for name in self.modules]
+        for router in routers:
+            self.target.include_router(router)
+        self.target.openapi_schema = None
+        self.mounted = True
+
+    async def __call__(self, scope, receive, send) -> None:
+        if not self.mounted and scope["type"] in ("http", "websocket") and (
+            scope["path"].startswith(self.prefix) or scope["path"] in self.paths
+        ):
+            self.mount()
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(
+    MountOnFirstUse, target=app, prefix="/sigil", paths=(app.openapi_url, "/"), modules=SIGIL_ROUTE_MODULES,
+)
+
 # ── /kai endpoint ───────────────────────────────────────────────
 @app.get(
     "/kai",
@@ -451,6 +514,21 @@ def read_kai_klock(
             "to override 'now' for deterministic output."
         ),
     ),
+    fields: Optional[List[str]] = Query(
+        None,
+        description="Only these top-level fields (comma-separated or repeated), e.g. 'kaiPulseEternal,chakraStepString'.",
+    ),
+    exclude: Optional[List[str]] = Query(
+        None, description="Top-level fields to leave out (comma-separated or repeated)."
+    ),
+    template: Optional[str] = Query(
+        None,
+        alias="format",
+        description=(
+            "Return only this format template as text/plain, e.g. '%B:%02S D%d/M%m %p%', "
+            "or a built-in seal name such as 'eternalSeal' or 'kairos_seal_day_month'."
+        ),
+    ),
 ) -> KaiKlockResponse:
     """
     🜂 **The Eternal Kai-Klok** — *Harmonik Kairos of Divine Order*
@@ -462,6 +540,20 @@ def read_kai_klock(
     **Calendar** (day/month/year/epochs) uses the **φ-klosure** day 17,491.270421 pulses.
 
     - `override_time`: ISO-8601 to reproduce a specific Kai moment (UTC assumed).
+
+    - `fields` / `exclude`: return only a subset of the fields below; only the
+      work those fields depend on is done (e.g. no solar calendar for eternal fields).
+    - `format`: return one rendered string (text/plain). Directives: `%B`/`%S` eternal
+      beat/step, `%b`/`%s` solar beat/step, `%p`/`%P` eternal % into step / of beat,
+      `%q` solar % into step, `%d`/`%m`/`%w`/`%y` day/month/week/year, `%D`/`%M` solar
+      day/month, `%K` eternal pulse, `%k`/`%t` pulse into eternal/solar day, `%L` spiral
+      level, `%N`/`%O`/`%W` day/month/week names, `%A`/`%a` eternal/solar ark;
+      `%02B` zero-pads, `%-9N` left-aligns, `%%` is a literal percent.
+
+    Every field is exact for the requested instant. Fields that only change
+    with the pulse are cached per pulse, and payloads for a fixed
+    `override_time` are cached whole (see `/kai/cache`, `KAI_CACHE_SIZE`,
+    and `KAI_CACHE_RESOLUTION_MU` to floor instants to a coarser step).
     """
     try:
         now = datetime.fromisoformat(override_time) if override_time else None
@@ -470,12 +562,270 @@ def read_kai_klock(
             "Invalid datetime format. Use ISO-8601 like '2024-05-10T06:45:40Z'"
         ) from exc
 
-    return get_eternal_klock(now)
+    if template is not None:
+        if fields is not None or exclude is not None:
+            raise HTTPException(status_code=400, detail="`format` cannot be combined with `fields`/`exclude`.")
+        try:
+            return PlainTextResponse(format_kai(template, now))
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    if fields is None and exclude is None:
+        # The bytes response_model serialization would produce, kept with a cached moment
+        return Response(kai_cache.get_json(now), media_type="application/json")
+    try:
+        selected = resolve_kai_fields(_split_fields(fields), _split_fields(exclude))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return JSONResponse(kai_cache.get_fields(selected, now))
+
 
+def _split_fields(values: Optional[List[str]]) -> Optional[List[str]]:
+    if values is None:
+        return None
+    return [name.strip() for value in values for name in value.split(",") if name.strip()]
 
-@app.get("/", response_class=HTMLResponse, tags=["Home"])
-def read_root():
-    html_content = r"""<!DOCTYPE html>
+
+# ── /kai/lite endpoint (compact integer coordinates) ───────────
+@app.get("/kai/lite", response_model=KaiLite, tags=["Kai Time"])
+def read_kai_lite(
+    override_time: Optional[str] = Query(
+        None, description="Optional ISO-8601 datetime to override 'now'."
+    ),
+) -> KaiLite:
+    """
+    Compact, versioned (`v`) Kai coordinates for bandwidth-sensitive clients:
+    integers only (percents in ppm, names as codes), under 300 bytes.
+    See the `KaiLite` schema for the key legend.
+    """
+    try:
+        now = datetime.fromisoformat(override_time) if override_time else None
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=400, detail="Invalid datetime format. Use ISO-8601 like '2024-05-10T06:45:40Z'"
+        ) from exc
+    return get_kai_lite(now)
+
+
+# ── /kai/range endpoint (NDJSON timeline) ──────────────────────
+@app.get("/kai/range", tags=["Kai Time"], response_class=StreamingResponse)
+def read_kai_range(
+    start: str = Query(..., description="ISO-8601 start (inclusive), e.g. '2025-01-01T00:00:00Z'."),
+    end: str = Query(..., description="ISO-8601 end (exclusive)."),
+    every: str = Query("step", pattern=f"^({'|'.join(KAI_RANGE_UNITS)})$"),
+    frame: str = Query("eternal", pattern="^(eternal|solar)$"),
+    fields: Optional[List[str]] = Query(
+        None, description="KaiKlockResponse fields per sample (comma-separated or repeated); default: KaiLite."
+    ),
+) -> StreamingResponse:
+    """
+    Streams one NDJSON line per `every` boundary (pulse, grid step/beat, or φ-day)
+    that begins in [`start`, `end`), walking the μpulse lattice directly.
+    Each line is `{"unixMs": ..., ...}` with KaiLite coordinates, or the
+    requested `fields` of `/kai`.
+    """
+    try:
+        start_at = datetime.fromisoformat(start)
+        end_at = datetime.fromisoformat(end)
+        selected = resolve_kai_fields(_split_fields(fields)) if fields is not None else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    def lines():
+        chunk = []
+        for sample in kai_range(start_at, end_at, every, frame, selected):
+            chunk.append(json.dumps(sample, ensure_ascii=False, separators=(",", ":")))
+            if len(chunk) == 256:
+                yield "\n".join(chunk) + "\n"
+                chunk = []
+        if chunk:
+            yield "\n".join(chunk) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+# ── /kai/boundaries endpoint (upcoming transitions) ────────────
+@app.get("/kai/boundaries", response_model=List[KaiBoundary], tags=["Kai Time"])
+def read_kai_boundaries(
+    unit: List[str] = Query(
+        ..., description=f"One or more of {', '.join(KAI_BOUNDARY_UNITS)} (repeat for several)."
+    ),
+    count: int = Query(1, ge=1, le=1000),
+    frame: str = Query("eternal", pattern="^(eternal|solar)$"),
+    override_time: Optional[str] = Query(None, description="ISO-8601 instant to look ahead from (default: now)."),
+) -> List[KaiBoundary]:
+    """
+    The next `count` transitions of each `unit` after now (or `override_time`),
+    computed exactly from the μpulse periods — schedule a timer instead of polling.
+    `frame=solar` uses sunrise-anchored days; `spiral` is the same in both frames.
+    """
+    try:
+        now = datetime.fromisoformat(override_time) if override_time else None
+        return [b for u in unit for b in next_kai_boundaries(u, count, now, frame)]
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+# ── /kai/ws + /kai/stream (push at each boundary) ──────────────
+@app.websocket("/kai/ws")
+async def kai_websocket(
+    websocket: WebSocket,
+    every: str = Query("step", pattern=f"^({'|'.join(KAI_PUSH_UNITS)})$"),
+    frame: str = Query("eternal", pattern="^(eternal|solar)$"),
+) -> None:
+    """
+    Sends the current state on connect, then one text message per `every`
+    boundary (pulse, grid step or beat): the `/kai/range` sample
+    `{"unixMs": ..., ...KaiLite}`. A slow client skips to the latest state.
+    """
+    await websocket.accept()
+    sub = kai_push.subscribe(every, frame)
+    try:
+        async def send():
+            while True:
+                await websocket.send_text(await sub.get())
+
+        async def drain():  # returns when the client disconnects
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+
+        tasks = [asyncio.ensure_future(send()), asyncio.ensure_future(drain())]
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in tasks:
+            task.cancel()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sub.close()
+
+
+@app.get("/kai/stream", tags=["Kai Time"], response_class=StreamingResponse)
+async def read_kai_stream(
+    every: str = Query("step", pattern=f"^({'|'.join(KAI_PUSH_UNITS)})$"),
+    frame: str = Query("eternal", pattern="^(eternal|solar)$"),
+) -> StreamingResponse:
+    """
+    Server-Sent Events: the current state, then one `data:` event per `every`
+    boundary with the same payload as `/kai/ws`. A comment line is sent every
+    15 s while waiting so proxies keep the connection open.
+    """
+    async def events():
+        sub = kai_push.subscribe(every, frame)
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(sub.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"data: {message}\n\n"
+        finally:
+            sub.close()
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"}
+    )
+
+
+@app.get("/kai/push", tags=["Kai Time"])
+def read_kai_push_stats() -> dict:
+    """Subscribers, ticks and dropped messages of each active `/kai/ws` · `/kai/stream` ticker."""
+    return kai_push.stats()
+
+
+@app.get("/kai/cache", tags=["Kai Time"])
+def read_kai_cache_stats() -> dict:
+    """Hit / miss / coalesced / uncached and per-pulse layer counters of the `/kai` result cache."""
+    return kai_cache.stats()
+
+
+# ── /kai/chronos endpoint (inverse: Kai → Chronos) ─────────────
+@app.get(
+    "/kai/chronos",
+    response_model=List[KaiChronosInstant],
+    tags=["Kai Time"],
+)
+def read_kai_chronos(
+    mu: Optional[List[int]] = Query(None, description="μpulse(s) since genesis; repeat for batch."),
+    pulse: Optional[List[int]] = Query(None, description="Eternal Kai pulse(s); repeat for batch."),
+    year: Optional[int] = Query(None, description="Harmonik year (0-based, as in `Y0`)."),
+    month: Optional[int] = Query(None, ge=1, le=8),
+    day: Optional[int] = Query(None, ge=1, le=42, description="Day of month."),
+    day_index: Optional[int] = Query(None, description="φ-day count since genesis (instead of Y/M/D)."),
+    beat: int = Query(0, ge=0, le=35),
+    step: int = Query(0, ge=0, le=43),
+    frame: str = Query("eternal", pattern="^(eternal|solar)$"),
+    unit: str = Query("ms", pattern="^(ms|us)$"),
+) -> List[KaiChronosInstant]:
+    """
+    Returns the **first UTC instant** at which a Kai coordinate begins — the exact
+    inverse of `/kai`, floor-consistent with the μpulse count.
+
+    - `mu` / `pulse`: one or more eternal positions (repeat the parameter for batch).
+    - `year`+`month`+`day` (or `day_index`) with `beat`/`step`: start of that grid
+      Beat:Step on that φ-day, in the `eternal` or sunrise-anchored `solar` frame.
+    - `unit`: `ms` (default) or `us` resolution of the returned `unix` value.
+    """
+    targets: List[int] = list(mu or []) + [p * UPULSES_PER_PULSE for p in (pulse or [])]
+    try:
+        if day_index is None and None not in (year, month, day):
+            day_index = kai_day_index(year, month, day)
+        if day_index is not None:
+            targets.append(mu_at_grid(day_index, beat, step, frame))
+        if not targets:
+            raise ValueError("Provide `mu`, `pulse`, or a `year`/`month`/`day` (or `day_index`) coordinate.")
+        out: List[KaiChronosInstant] = []
+        for target in targets:
+            unix = unix_at_mu(target, unit)
+            at = UNIX_EPOCH + timedelta(milliseconds=unix) if unit == "ms" else UNIX_EPOCH + timedelta(microseconds=unix)
+            out.append(KaiChronosInstant(
+                mu=target,
+                kaiPulseEternal=target // UPULSES_PER_PULSE,
+                unix=unix,
+                unit=unit,
+                utc=at.isoformat(timespec="microseconds" if unit == "us" else "milliseconds").replace("+00:00", "Z"),
+            ))
+        return out
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except OverflowError as exc:
+        raise HTTPException(status_code=400, detail="Coordinate lies outside the representable UTC range.") from exc
+
+
+# ── /kai/subdivisions endpoint ──────────────────────────────────
+@app.get(
+    "/kai/subdivisions",
+    response_model=List[KaiSubdivisions],
+    tags=["Kai Time"],
+)
+def read_kai_subdivisions(
+    pulse: Optional[List[int]] = Query(None, description="Eternal Kai pulse(s); repeat for batch."),
+    override_time: Optional[str] = Query(
+        None, description="ISO-8601 instant used when no `pulse` is given (default: now)."
+    ),
+) -> List[KaiSubdivisions]:
+    """
+    Returns only the **harmonic subdivisions** block of `/kai` (same values),
+    without building the full Kai-Klok response.
+
+    - `pulse`: one or more eternal pulses (repeat the parameter for batch).
+    - `override_time`: instant to use when `pulse` is omitted.
+    """
+    try:
+        if not pulse:
+            now = _ensure_utc(datetime.fromisoformat(override_time) if override_time else datetime.utcnow())
+            pulse = [mu_since_genesis_int(now) // UPULSES_PER_PULSE]
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=400, detail="Invalid datetime format. Use ISO-8601 like '2024-05-10T06:45:40Z'"
+        ) from exc
+    return [KaiSubdivisions(kaiPulseEternal=p, subdivisions=build_subdivisions_live(p)) for p in pulse]
+
+
+# ── Homepage & OpenAPI document ───────────────────────────────
+# Both are rendered once per process (after the sigil routes are mounted, see
+# MountOnFirstUse) and served as pre-encoded, pre-compressed bytes with ETags.
+# The homepage lists the endpoints itself, so it needs no /openapi.json call.
+_HOME_TEMPLATE = r"""<!DOCTYPE html>
 <html lang="en">
 <head>
 <meta charset="utf-8"/>
@@ -660,16 +1010,6 @@ main{overflow-y:auto;padding-right:.6rem}
 .ep-body{max-height:0;opacity:0;overflow:hidden;transition:max-height .45s,opacity .45s}
 .open .ep-body{max-height:660px;opacity:1;margin-top:var(--xs)}
 
-.spinner{
-  width:48px;height:48px;margin:var(--m) auto;
-  border:5px solid rgba(255,255,255,.12);
-  border-top:5px solid var(--teal-light);
-  border-radius:50%;
-  animation:spin 1s linear infinite;
-}
-@keyframes spin{to{transform:rotate(360deg)}}
-#error{display:none;text-align:center;color:#ff8a8a;margin-top:var(--xs)}
-
 /* ═══════════════════════════════
    6.  Scrollbar tint – WebKit only
 ════════════════════════════════ */
@@ -763,8 +1103,9 @@ footer{
     <section class="section">
       <h3>Kai-Klok Endpoints — Interfaces of Harmonik Time</h3>
       <input id="search" class="search" placeholder="Search Kai Interfaces…" aria-label="Search endpoints">
-      <div id="list"><div id="spin" class="spinner" aria-live="polite"></div></div>
-      <p id="error">Koherence breach detected. Rejalibrate to re-enter Kai Time.</p>
+      <div id="list">
+      <!-- endpoints -->
+      </div>
     </section>
   </main>
 </div>
@@ -815,32 +1156,11 @@ const setPct=v=>document.documentElement.style.setProperty('--pct',v);
 const hueTick=()=>document.documentElement.style.setProperty('--hue',200+60*new Date().getHours()/24);
 hueTick();setInterval(hueTick,60_000);
 
-/* 3 ▸ endpoint loader */
-(async()=>{
-  try{
-    const r=await fetch('/openapi.json');const d=await r.json();
-    $('#list').innerHTML='';
-    Object.entries(d.paths).forEach(([path,ops])=>{
-      Object.entries(ops).forEach(([method,ep])=>{
-        const card=document.createElement('div');card.className='endpoint glass';
-        card.innerHTML=`
-          <div class="ep-head" tabindex="0">
-            <span><strong>${method.toUpperCase()} ${path}</strong><br><em>${ep.summary||''}</em></span>
-            <span aria-hidden="true">＋</span>
-          </div>
-          <div class="ep-body">
-            <p><strong>Tags:</strong> ${ep.tags?.join(', ')||'–'}</p>
-            <p>${ep.description||'No description.'}</p>
-          </div>`;
-        card.firstElementChild.addEventListener('click',()=>card.classList.toggle('open'));
-        card.firstElementChild.addEventListener('keypress',e=>['Enter',' '].includes(e.key)&&card.classList.toggle('open'));
-        $('#list').append(card);
-      });
-    });
-  }catch{
-    $('#spin').remove();$('#error').style.display='block';
-  }
-})();
+/* 3 ▸ endpoint cards (rendered by the server) */
+all('.endpoint').forEach(card=>{
+  card.firstElementChild.addEventListener('click',()=>card.classList.toggle('open'));
+  card.firstElementChild.addEventListener('keypress',e=>['Enter',' '].includes(e.key)&&card.classList.toggle('open'));
+});
 
 /* 4 ▸ search filter */
 $('#search').addEventListener('input',e=>{
@@ -882,4 +1202,46 @@ rocket.onclick=()=>scrollTo({top:0,behavior:'smooth'});
 </body>
 </html>
 """
-    return HTMLResponse(html_content)
+
+
+def _endpoint_cards(schema: dict) -> str:
+    cards = []
+    for path, ops in schema["paths"].items():
+        for method, ep in ops.items():
+            cards.append(f"""<div class="endpoint glass">
+        <div class="ep-head" tabindex="0">
+          <span><strong>{method.upper()} {escape(path)}</strong><br><em>{escape(ep.get("summary") or "")}</em></span>
+          <span aria-hidden="true">＋</span>
+        </div>
+        <div class="ep-body">
+          <p><strong>Tags:</strong> {escape(", ".join(ep.get("tags") or []) or "–")}</p>
+          <p>{escape(ep.get("description") or "No description.")}</p>
+        </div>
+      </div>""")
+    return "\n      ".join(cards)
+
+
+@functools.lru_cache(maxsize=None)
+def _openapi_document() -> StaticDocument:
+    # Same bytes FastAPI's own /openapi.json route would send
+    return StaticDocument(JSONResponse(app.openapi()).body, "application/json")
+
+
+@functools.lru_cache(maxsize=None)
+def _home_document() -> StaticDocument:
+    html = _HOME_TEMPLATE.replace("<!-- endpoints -->", _endpoint_cards(app.openapi()))
+    return StaticDocument(html.encode("utf-8"), "text/html; charset=utf-8")
+
+
+# Replace FastAPI's per-request /openapi.json route (/docs and /redoc read it)
+app.router.routes[:] = [route for route in app.router.routes if getattr(route, "path", None) != app.openapi_url]
+
+
+@app.get(app.openapi_url, include_in_schema=False)
+def read_openapi(request: Request) -> Response:
+    return _openapi_document().respond(request)
+
+
+@app.get("/", response_class=HTMLResponse, tags=["Home"])
+def read_root(request: Request) -> Response:
+    return _home_document().respond(request)
@@ -0,0 +1,67 @@
+# routes/kai_source.py
+
+import os
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from kai_klock import datetime_at_mu, UPULSES_PER_PULSE
+from kai_klock_cache import kai_cache
+
+# Where the sigil routes get Kai state:
+#   "local"  — computed in-process (the same payload as /kai)
+#   "remote" — fetched from the public Kai-Klock API (opt-in)
+KAI_SIGIL_SOURCE = os.getenv("KAI_SIGIL_SOURCE", "local")
+KLOCK_API = os.getenv("KAI_KLOCK_API", "https://klock.kaiturah.com/kai")
+KLOCK_API_TIMEOUT = 6
+
+
+def kai_instant(override_time: Optional[str] = None, pulse: Optional[int] = None) -> Optional[datetime]:
+    """
+    The moment to render: an ISO-8601 `override_time`, or the first instant of
+    eternal `pulse`; None means now. Raises ValueError for bad or conflicting input.
+    """
+    if override_time and pulse is not None:
+        raise ValueError("Pass either override_time or pulse, not both")
+    if pulse is not None:
+        return datetime_at_mu(pulse * UPULSES_PER_PULSE)
+    if override_time:
+        return datetime.fromisoformat(override_time)
+    return None
+
+
+def _remote_params(override_time: Optional[str], pulse: Optional[int]) -> Dict[str, str]:
+    at = kai_instant(override_time, pulse)
+    return {"override_time": at.isoformat()} if at is not None else {}
+
+
+def get_kai_state(override_time: Optional[str] = None, pulse: Optional[int] = None) -> Dict[str, Any]:
+    """
+    `/kai` payload (JSON-ready dict) for now, `override_time` or `pulse`.
+    Raises ValueError for bad input and RuntimeError if the remote source fails.
+    """
+    if KAI_SIGIL_SOURCE != "remote":
+        return kai_cache.get_data(kai_instant(override_time, pulse))
+
+    import requests  # remote source only
+
+    params = _remote_params(override_time, pulse)
+    try:
+        res = requests.get(KLOCK_API, params=params, timeout=KLOCK_API_TIMEOUT)
+        res.raise_for_status()
+        return res.json()
+    except Exception as e:
+        raise RuntimeError(f"Failed to fetch Kairos data: {e}")
+
+
+async def get_kai_state_async(override_time: Optional[str] = None, pulse: Optional[int] = None) -> Dict[str, Any]:
+    """
+    get_kai_state for async handlers: the remote source goes through the
+    shared non-blocking upstream client (pooled, single-flight, stale-while-
+    revalidate; see kai_upstream).
+    """
+    if KAI_SIGIL_SOURCE != "remote":
+        return get_kai_state(override_time, pulse)
+
+    from .kai_upstream import kai_upstream
+
+    return await kai_upstream.get(override_time, pulse)
@@ -0,0 +1,143 @@
+# routes/kai_upstream.py
+
+import asyncio
+import os
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple, Union, TYPE_CHECKING
+
+from fastapi import APIRouter
+
+from kai_klock import mu_since_genesis_int, _ensure_utc, UPULSES_PER_PULSE
+
+from .kai_source import kai_instant, KLOCK_API, KLOCK_API_TIMEOUT
+
+if TYPE_CHECKING:
+    import httpx
+
+router = APIRouter()
+
+# Shared client for a remote Kai-Klok (KAI_SIGIL_SOURCE=remote):
+#   • one pooled httpx.AsyncClient per event loop (httpx loads on first fetch)
+#   • single flight — concurrent callers for the same moment (exact μpulse)
+#     await one fetch
+#   • stale-while-revalidate — "now" is served from the last payload while it
+#     is at most KAI_UPSTREAM_MAX_STALE_PULSES pulses old, refreshing in the
+#     background; a fixed moment (override_time / pulse) never goes stale
+KAI_UPSTREAM_MAX_STALE_PULSES = int(os.getenv("KAI_UPSTREAM_MAX_STALE_PULSES", "12"))
+KAI_UPSTREAM_CONNECTIONS = int(os.getenv("KAI_UPSTREAM_CONNECTIONS", "10"))
+
+_Key = Union[str, int]
+
+
+class KaiUpstream:
+    def __init__(self, url: str = KLOCK_API, timeout: float = KLOCK_API_TIMEOUT,
+                 max_stale_pulses: int = KAI_UPSTREAM_MAX_STALE_PULSES,
+                 connections: int = KAI_UPSTREAM_CONNECTIONS, maxsize: int = 256,
+                 transport: Optional["httpx.AsyncBaseTransport"] = None):
+        self.url = url
+        self.timeout = timeout
+        self.max_stale_pulses = max_stale_pulses
+        self.connections = connections
+        self.maxsize = maxsize
+        self.transport = transport
+        self._client: Optional["httpx.AsyncClient"] = None
+        self._loop = None
+        self._inflight: Dict[_Key, asyncio.Task] = {}
+        self._cache: "OrderedDict[_Key, Tuple[int, Dict[str, Any]]]" = OrderedDict()
+        self.fetches = 0
+        self.hits = 0
+        self.stale = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def _http(self) -> "httpx.AsyncClient":
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.connections,
+                                    max_keepalive_connections=self.connections),
+                transport=self.transport,
+            )
+            self._loop = loop
+        return self._client
+
+    async def _fetch(self, key: _Key, params: Dict[str, str]) -> Dict[str, Any]:
+        try:
+            self.fetches += 1
+            res = await self._http().get(self.url, params=params)
+            res.raise_for_status()
+            data = res.json()
+            if not isinstance(data, dict) or type(data.get("kaiPulseEternal")) is not int:
+                raise ValueError("response is not a Kai-Klock payload (no integer kaiPulseEternal)")
+        except Exception as e:
+            self.errors += 1
+            raise RuntimeError(f"Failed to fetch Kairos data: {e}") from e
+        finally:
+            del self._inflight[key]
+        self._cache[key] = (data["kaiPulseEternal"], data)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return data
+
+    def _flight(self, key: _Key, params: Dict[str, str]) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return task
+        task = self._inflight[key] = asyncio.ensure_future(self._fetch(key, params))
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())  # never "unretrieved"
+        return task
+
+    async def get(self, override_time: Optional[str] = None, pulse: Optional[int] = None) -> Dict[str, Any]:
+        """
+        `/kai` payload from the upstream for now, `override_time` or `pulse`.
+        Raises ValueError for bad input, RuntimeError when the upstream fails
+        and no payload within the staleness bound is cached.
+        """
+        at = kai_instant(override_time, pulse)
+        mu = mu_since_genesis_int(_ensure_utc(at or datetime.utcnow()))
+        want = mu // UPULSES_PER_PULSE
+        key: _Key = mu if at is not None else "now"
+        params = {"override_time": at.isoformat()} if at is not None else {}
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            age = want - cached[0] if at is None else 0
+            if age <= 0:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return cached[1]
+            if age <= self.max_stale_pulses:
+                self.stale += 1
+                self._flight(key, params)   # revalidate in the background
+                return cached[1]
+        # shield: a caller that disconnects does not cancel the shared fetch
+        return await asyncio.shield(self._flight(key, params))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "fetches": self.fetches,
+            "hits": self.hits,
+            "stale": self.stale,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "inflight": len(self._inflight),
+            "size": len(self._cache),
+            "maxStalePulses": self.max_stale_pulses,
+        }
+
+
+# Process-wide upstream used by kai_source when KAI_SIGIL_SOURCE=remote
+kai_upstream = KaiUpstream()
+
+
+@router.get("/sigil/upstream", tags=["Sigil"])
+def read_kai_upstream_stats() -> dict:
+    """Fetch / hit / stale / coalesced counters of the remote Kai-Klok client."""
+    return kai_upstream.stats()
@@ -1,95 +1,146 @@
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
-from uuid import uuid4
-from PIL import Image, ImageDraw, ImageFont
-import requests
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
+from typing import Optional, TYPE_CHECKING
+import functools
 import io
 import math
 import os
 
+from kai_klock import UPULSES_PER_PULSE
+from kai_klock_static import etag_matches
+from .kai_source import get_kai_state_async
+from .sigil_palette import IMG_SIZE, CENTER
+from .sigil_http import requested_mu, sigil_headers
+from .sigil_pool import sigil_pool, SigilPoolFull
+from .sigil_svg import render_sigil_svg
+
+if TYPE_CHECKING:
+    from PIL import Image
+
 router = APIRouter()
 
 # Constants
-KLOCK_API = "https://klock.kaiturah.com/kai"
-IMG_SIZE = 1080
-CENTER = IMG_SIZE // 2
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 FONT_PATH = os.path.join(BASE_DIR, "../assets/DejaVuSans-Bold.ttf")  # Adjust if needed
 
-def fetch_kairos_data():
+# Fonts and the static base layer are built once per process; each render
+# copies the base and draws only the text. Pillow is imported by the renderer
+# (normally inside a sigil pool worker), never when the routes are mounted.
+@functools.lru_cache(maxsize=None)
+def sigil_fonts():
+    from PIL import ImageFont  # no Pillow: the ImportError reaches the caller
+
     try:
-        resp = requests.get(KLOCK_API, timeout=6)
-        resp.raise_for_status()
-        return resp.json()
-    except Exception as e:
-        raise HTTPException(status_code=502, detail=f"Failed to fetch Kairos data: {e}")
+        return ImageFont.truetype(FONT_PATH, 60), ImageFont.truetype(FONT_PATH, 34)
+    except OSError:  # font file missing or unreadable
+        default = ImageFont.load_default()
+    except ImportError:  # Pillow without FreeType: only the bitmap font loads
+        default = getattr(ImageFont, "load_default_imagefont", ImageFont.load_default)()
+    return default, default
+
+@functools.lru_cache(maxsize=None)
+def sigil_base_layer() -> "Image.Image":
+    from PIL import Image, ImageDraw
+
+    img = Image.new("RGBA", (IMG_SIZE, IMG_SIZE), (8, 12, 32))
+    draw = ImageDraw.Draw(img)
+
+    # 🌟 Sacred Triquetra
+    for angle in [0, 120, 240]:
+        x = CENTER + 180 * math.cos(math.radians(angle))
+        y = CENTER + 180 * math.sin(math.radians(angle))
+        draw.ellipse([(x - 80, y - 80), (x + 80, y + 80)], outline=(255, 255, 0), width=4)
+    return img
+
+async def fetch_kairos_data(override_time: Optional[str] = None, pulse: Optional[int] = None):
+    try:
+        return await get_kai_state_async(override_time, pulse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+def render_sigil_png(data: dict) -> bytes:
+    """PNG bytes of the eternal sigil for a /kai payload (runs in the sigil pool)."""
+    from PIL import ImageDraw
+
+    # 🌐 Real fields from your JSON
+    pulse        = data["kaiPulseEternal"]
+    eternal_seal = data["eternalSeal"]
+    kairos       = data["chakraStepString"]       # e.g. "3:38"
+    day_name     = data["harmonicDay"].upper()    # e.g. "SONARI"
+    month_name   = data["eternalMonth"].upper()   # e.g. "AETHON"
+    arc_name     = data["eternalChakraArc"].upper()  # e.g. "IGNITE"
+    week_name    = data["weekName"].upper()       # e.g. "CROWNED LIGHT"
+    year_name    = data["eternalYearName"].upper() # e.g. "YEAR OF HARMONIC EMBODIMENT"
+    spiral       = data["phiSpiralLevel"]
+    beat_idx     = data["eternalChakraBeat"]["beatIndex"]
+    step_idx     = data["chakraStep"]["stepIndex"]
+
+    # 🌀 Text blocks
+    meta_top    = f"{day_name} • KAIROS {kairos} • ARC: {arc_name}"
+    meta_bottom = f"{month_name} • BEAT {beat_idx}/36 • STEP {step_idx}/44 • {week_name}"
+    center_text = f"ETERNAL PULSE\n{pulse}"
+    inner_title = f"{year_name} ∴ PHI SPIRAL {spiral}"
+
+    # 🎨 Canvas: cached background + triquetra
+    img = sigil_base_layer().copy()
+    draw = ImageDraw.Draw(img)
+    font_large, font_small = sigil_fonts()
+
+    # ✨ Center Pulse
+    draw.multiline_text((CENTER, CENTER - 100), center_text, fill=(255, 255, 255), font=font_large, anchor="mm", spacing=12)
+
+    # 💠 Inner Spiral Year
+    draw.text((CENTER, CENTER + 110), inner_title, fill=(173, 216, 230), font=font_small, anchor="mm")
+
+    # 🧭 Top + Bottom Metadata
+    draw.text((CENTER, 70), meta_top, fill=(135, 206, 250), font=font_small, anchor="mm")
+    draw.text((CENTER, IMG_SIZE - 70), meta_bottom, fill=(135, 206, 250), font=font_small, anchor="mm")
+
+    # 📜 Eternal Seal (small)
+    draw.text((CENTER, IMG_SIZE - 30), eternal_seal, fill=(220, 220, 220), font=font_small, anchor="mm")
+
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
 
 @router.get("/sigil")
-def generate_sigil():
-    data = fetch_kairos_data()
-
+async def generate_sigil(
+    request: Request,
+    override_time: Optional[str] = Query(None, description="ISO-8601 moment to render (default: now)."),
+    pulse: Optional[int] = Query(None, description="Eternal Kai pulse to render instead of a moment."),
+    image_format: str = Query("png", alias="format", pattern="^(png|svg)$",
+                              description="png (rendered in the sigil pool) or svg (vector, no rasterizing)."),
+):
     try:
-        # 🌐 Real fields from your JSON
-        pulse        = data["kaiPulseEternal"]
-        eternal_seal = data["eternalSeal"]
-        kairos       = data["chakraStepString"]       # e.g. "3:38"
-        day_name     = data["harmonicDay"].upper()    # e.g. "SONARI"
-        month_name   = data["eternalMonth"].upper()   # e.g. "AETHON"
-        arc_name     = data["eternalChakraArc"].upper()  # e.g. "IGNITE"
-        week_name    = data["weekName"].upper()       # e.g. "CROWNED LIGHT"
-        year_name    = data["eternalYearName"].upper() # e.g. "YEAR OF HARMONIC EMBODIMENT"
-        spiral       = data["phiSpiralLevel"]
-        beat_idx     = data["eternalChakraBeat"]["beatIndex"]
-        step_idx     = data["chakraStep"]["stepIndex"]
-
-        # 🌀 Text blocks
-        meta_top    = f"{day_name} • KAIROS {kairos} • ARC: {arc_name}"
-        meta_bottom = f"{month_name} • BEAT {beat_idx}/36 • STEP {step_idx}/44 • {week_name}"
-        center_text = f"ETERNAL PULSE\n{pulse}"
-        inner_title = f"{year_name} ∴ PHI SPIRAL {spiral}"
-
-        # 🎨 Create image
-        img = Image.new("RGBA", (IMG_SIZE, IMG_SIZE), (8, 12, 32))
-        draw = ImageDraw.Draw(img)
-
-        # 🖋 Font
+        mu, fixed = requested_mu(override_time, pulse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    headers = sigil_headers("sigil", image_format, mu, fixed)
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    data = await fetch_kairos_data(override_time, pulse)
+    if data["kaiPulseEternal"] != mu // UPULSES_PER_PULSE:  # remote source across a pulse boundary
+        headers = sigil_headers("sigil", image_format, data["kaiPulseEternal"] * UPULSES_PER_PULSE, fixed)
+    headers["Content-Disposition"] = f"attachment; filename=eternal_sigil_{data['kaiPulseEternal']}.{image_format}"
+
+    if image_format == "svg":
         try:
-            font_large = ImageFont.truetype(FONT_PATH, 60)
-            font_small = ImageFont.truetype(FONT_PATH, 34)
-        except:
-            font_large = ImageFont.load_default()
-            font_small = ImageFont.load_default()
-
-        # 🌟 Sacred Triquetra
-        for angle in [0, 120, 240]:
-            x = CENTER + 180 * math.cos(math.radians(angle))
-            y = CENTER + 180 * math.sin(math.radians(angle))
-            draw.ellipse([(x - 80, y - 80), (x + 80, y + 80)], outline=(255, 255, 0), width=4)
-
-        # ✨ Center Pulse
-        draw.multiline_text((CENTER, CENTER - 100), center_text, fill=(255, 255, 255), font=font_large, anchor="mm", spacing=12)
-
-        # 💠 Inner Spiral Year
-        draw.text((CENTER, CENTER + 110), inner_title, fill=(173, 216, 230), font=font_small, anchor="mm")
-
-        # 🧭 Top + Bottom Metadata
-        draw.text((CENTER, 70), meta_top, fill=(135, 206, 250), font=font_small, anchor="mm")
-        draw.text((CENTER, IMG_SIZE - 70), meta_bottom, fill=(135, 206, 250), font=font_small, anchor="mm")
-
-        # 📜 Eternal Seal (small)
-        draw.text((CENTER, IMG_SIZE - 30), eternal_seal, fill=(220, 220, 220), font=font_small, anchor="mm")
-
-        # 📤 Send as file download
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
-
-        filename = f"eternal_sigil_{pulse}.png"
-        return StreamingResponse(buffer, media_type="image/png", headers={
-            "Content-Disposition": f"attachment; filename={filename}"
-        })
+            svg = render_sigil_svg(data)
+        except KeyError as e:
+            raise HTTPException(status_code=500, detail=f"Missing Kairos field: {e}")
+        return Response(svg, media_type="image/svg+xml", headers=headers)
 
+    try:
+        png = await sigil_pool.render(render_sigil_png, data)
+    except SigilPoolFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
     except KeyError as e:
         raise HTTPException(status_code=500, detail=f"Missing Kairos field: {e}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating sigil: {e}")
+
+    # 📤 Send as file download
+    return Response(png, media_type="image/png", headers=headers)
@@ -1,21 +1,26 @@
 # routes/klock_utils.py
 
-import requests
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 
+from .kai_source import get_kai_state, get_kai_state_async
 
-def get_kairos_data_for_sigil() -> Dict[str, Any]:
+
+def get_kairos_data_for_sigil(override_time: Optional[str] = None, pulse: Optional[int] = None) -> Dict[str, Any]:
     """
-    Fetches live Kairos data and extracts sigil-relevant components.
+    Fetches Kairos data (now, `override_time` or `pulse`) and extracts
+    sigil-relevant components.
     """
-    try:
-        res = requests.get("https://klock.kaiturah.com/kai", timeout=5)
-        res.raise_for_status()
-        data = res.json()
-    except Exception as e:
-        raise RuntimeError(f"Failed to fetch Kairos data: {e}")
+    return _sigil_components(get_kai_state(override_time, pulse))
+
+
+async def get_kairos_data_for_sigil_async(override_time: Optional[str] = None,
+                                          pulse: Optional[int] = None) -> Dict[str, Any]:
+    """get_kairos_data_for_sigil for async handlers (never blocks the event loop)."""
+    return _sigil_components(await get_kai_state_async(override_time, pulse))
+
 
+def _sigil_components(data: Dict[str, Any]) -> Dict[str, Any]:
     # Extract relevant harmonic fields
     return {
         "kairos_time": data.get("kairosTime", "—"),
@@ -1,21 +1,31 @@
 # routes/sigil_api.py
 
-from fastapi import APIRouter
+from typing import Optional
+
+from fastapi import APIRouter, Query
 from fastapi.responses import JSONResponse
-from app.routes.klock_utils import get_kairos_data_for_sigil
+from .klock_utils import get_kairos_data_for_sigil_async
 
 
 router = APIRouter()
 
 
 @router.get("/sigil/live", summary="Generate live sigil metadata", tags=["Sigil"])
-async def generate_live_sigil():
+async def generate_live_sigil(
+    override_time: Optional[str] = Query(None, description="ISO-8601 moment (default: now)."),
+    pulse: Optional[int] = Query(None, description="Eternal Kai pulse instead of a moment."),
+):
     """
     Endpoint that returns harmonic Kairos data for live sigil generation.
     """
     try:
-        sigil_data = get_kairos_data_for_sigil()
+        sigil_data = await get_kairos_data_for_sigil_async(override_time, pulse)
         return JSONResponse(content={"success": True, "data": sigil_data})
+    except ValueError as e:
+        return JSONResponse(
+            content={"success": False, "error": str(e)},
+            status_code=400
+        )
     except Exception as e:
         return JSONResponse(
             content={"success": False, "error": str(e)},
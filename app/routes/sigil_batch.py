@@ -0,0 +1,123 @@
+# routes/sigil_batch.py
+
+import os
+import zipfile
+from collections import deque
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from kai_klock import datetime_at_mu, get_kai_fields_at_mu, resolve_kai_fields
+from kai_klock_range import kai_lattice, mu_window, KAI_RANGE_UNITS
+
+from .kairos_sigil import render_sigil_png
+from .sigil_pool import sigil_pool, SigilPoolFull
+from .sigil_stamp import render_stamp_png
+from .sigil_svg import render_sigil_svg, render_stamp_svg
+
+router = APIRouter()
+
+# One sigil per lattice boundary in [start, end), each rendered from the exact
+# Kai state at that μpulse (computed here, never fetched). PNG renders run in
+# the sigil pool a few at a time and every finished file is written straight
+# into a ZIP stream, so memory holds only the renders in flight.
+SIGIL_BATCH_MAX = int(os.getenv("KAI_SIGIL_BATCH_MAX", "2000"))
+
+# The /kai fields the sigil and stamp renderers read
+SIGIL_FIELDS = resolve_kai_fields([
+    "kaiPulseEternal", "eternalSeal", "chakraStepString", "harmonicDay", "eternalMonth",
+    "eternalChakraArc", "weekName", "eternalYearName", "phiSpiralLevel", "eternalChakraBeat", "chakraStep",
+])
+
+_ZIP_DATES = ((1980, 1, 1, 0, 0, 0), (2107, 12, 31, 23, 59, 58))   # DOS date range
+
+
+class _ZipSink:
+    """Write-only, unseekable file for zipfile: bytes are collected until taken."""
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _zip_entry(name: str, mu: int, image_format: str) -> zipfile.ZipInfo:
+    at = datetime_at_mu(mu)
+    info = zipfile.ZipInfo(name, date_time=min(max(_ZIP_DATES[0], at.timetuple()[:6]), _ZIP_DATES[1]))
+    # PNG is already deflated; SVG text compresses well
+    info.compress_type = zipfile.ZIP_STORED if image_format == "png" else zipfile.ZIP_DEFLATED
+    return info
+
+
+@router.get("/sigil/batch", response_class=StreamingResponse, tags=["Sigil"])
+async def generate_sigil_batch(
+    start: str = Query(..., description="ISO-8601 start (inclusive), e.g. '2025-01-01T00:00:00Z'."),
+    end: str = Query(..., description="ISO-8601 end (exclusive)."),
+    every: str = Query("step", pattern=f"^({'|'.join(KAI_RANGE_UNITS)})$"),
+    kind: str = Query("stamp", pattern="^(stamp|sigil)$", description="Renderer: /sigil/stamp or /sigil."),
+    image_format: str = Query("png", alias="format", pattern="^(png|svg)$"),
+):
+    """
+    ZIP of one `kind` sigil per eternal `every` boundary starting in
+    [`start`, `end`), streamed while rendering (at most KAI_SIGIL_BATCH_MAX).
+    """
+    try:
+        start_mu, end_mu = mu_window(datetime.fromisoformat(start), datetime.fromisoformat(end))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    mus = []
+    for mu in kai_lattice(start_mu, end_mu, every):
+        if len(mus) == SIGIL_BATCH_MAX:
+            raise HTTPException(status_code=400, detail=f"Range holds more than {SIGIL_BATCH_MAX} sigils")
+        mus.append(mu)
+    if image_format == "png":
+        try:
+            sigil_pool.check_capacity()
+        except SigilPoolFull as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+    def states():
+        for mu in mus:
+            yield mu, get_kai_fields_at_mu(SIGIL_FIELDS, mu).model_dump(mode="json")
+
+    async def rendered():
+        if image_format == "svg":
+            render = render_sigil_svg if kind == "sigil" else render_stamp_svg
+            for mu, data in states():
+                yield mu, data, render(data).encode()
+            return
+        render = render_sigil_png if kind == "sigil" else render_stamp_png
+        pending = deque()   # (mu, data) in submission order, matched to render_ordered output
+
+        def args():
+            for mu, data in states():
+                pending.append((mu, data))
+                yield (data,)
+
+        async for png in sigil_pool.render_ordered(render, args()):
+            mu, data = pending.popleft()
+            yield mu, data, png
+
+    async def archive():
+        sink = _ZipSink()
+        with zipfile.ZipFile(sink, "w") as zf:
+            async for mu, data, blob in rendered():
+                name = f"eternal_{kind}_{data['kaiPulseEternal']}.{image_format}"
+                zf.writestr(_zip_entry(name, mu, image_format), blob)
+                yield sink.take()
+        yield sink.take()
+
+    filename = f"eternal_{kind}s_{every}_{len(mus)}.zip"
+    return StreamingResponse(archive(), media_type="application/zip", headers={
+        "Content-Disposition": f"attachment; filename={filename}"
+    })
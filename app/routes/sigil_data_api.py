@@ -1,12 +1,13 @@
 # app/routes/sigil_data_api.py
 
-import httpx
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
-router = APIRouter()
+from .kai_source import get_kai_state_async
 
-KAI_KLOCK_API = "https://klock.kaiturah.com/kai"
+router = APIRouter()
 
 class SigilDataResponse(BaseModel):
     kai_pulse: int
@@ -28,14 +29,16 @@ class SigilDataResponse(BaseModel):
     kai_turah: str
 
 @router.get("/sigil/data", response_model=SigilDataResponse)
-async def get_sigil_data():
+async def get_sigil_data(
+    override_time: Optional[str] = Query(None, description="ISO-8601 moment (default: now)."),
+    pulse: Optional[int] = Query(None, description="Eternal Kai pulse instead of a moment."),
+):
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(KAI_KLOCK_API)
-            response.raise_for_status()
-            klock = response.json()
-    except Exception as e:
-        raise HTTPException(status_code=503, detail=f"Failed to fetch Kai-Klock data: {e}")
+        klock = await get_kai_state_async(override_time, pulse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
     try:
         return SigilDataResponse(
@@ -0,0 +1,47 @@
+# routes/sigil_http.py
+
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from kai_klock import mu_since_genesis_int, datetime_at_mu, kai_lite_at_mu, _ensure_utc, UPULSES_PER_PULSE
+from kai_klock_range import kai_lattice
+
+from .kai_source import kai_instant
+
+# A sigil is a pure function of its μpulse and render parameters, so its
+# validators are computed before any state is fetched or pixel drawn:
+#   • ETag — a fixed moment (override_time / pulse) gets a strong tag,
+#     "<kind>-<format>-v<SIGIL_RENDER_VERSION>-<pulse>" with ".<μ into the
+#     pulse>" appended unless it starts the pulse. "Now" gets the weak tag
+#     W/"…-<pulse>-<beat>.<step>-<solar beat>.<solar step>": the seal's
+#     percents move within a step, but a step boundary (eternal or solar)
+#     can fall inside a pulse and changes the rendered Beat:Step.
+#   • Cache-Control — for "now", until the next pulse or the next step
+#     boundary of either frame, whichever comes first; a fixed moment never
+#     changes and is immutable
+SIGIL_RENDER_VERSION = 1   # bump whenever a renderer's output changes
+IMMUTABLE_MAX_AGE = 31_536_000
+
+
+def requested_mu(override_time: Optional[str] = None, pulse: Optional[int] = None) -> Tuple[int, bool]:
+    """(μpulse to render, whether the moment is fixed). Raises ValueError for bad input."""
+    at = kai_instant(override_time, pulse)
+    if pulse is not None:
+        return pulse * UPULSES_PER_PULSE, True
+    return mu_since_genesis_int(_ensure_utc(at or datetime.utcnow())), at is not None
+
+
+def sigil_headers(kind: str, image_format: str, mu: int, fixed: bool) -> Dict[str, str]:
+    kai_pulse, mu_in_pulse = divmod(mu, UPULSES_PER_PULSE)
+    tag = f"{kind}-{image_format}-v{SIGIL_RENDER_VERSION}-{kai_pulse}"
+    if fixed:
+        cache_control = f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+        etag = f'"{tag}.{mu_in_pulse:06d}"' if mu_in_pulse else f'"{tag}"'
+    else:
+        lite = kai_lite_at_mu(mu)
+        turns = min((kai_pulse + 1) * UPULSES_PER_PULSE,
+                    *(next(kai_lattice(mu + 1, None, "step", frame)) for frame in ("eternal", "solar")))
+        remaining = datetime_at_mu(turns) - datetime_at_mu(mu)
+        cache_control = f"public, max-age={max(0, int(remaining.total_seconds()))}"
+        etag = f'W/"{tag}-{lite.eb}.{lite.es}-{lite.sb}.{lite.ss}"'
+    return {"ETag": etag, "Cache-Control": cache_control}
@@ -0,0 +1,33 @@
+# routes/sigil_palette.py
+
+# Canvas geometry and colors shared by the PNG (Pillow) and SVG sigil renderers;
+# nothing here imports Pillow.
+
+IMG_SIZE = 1080
+CENTER = IMG_SIZE // 2
+
+# Chakra arc color encoding (outline)
+def chakra_color_map(arc: str):
+    arc = arc.strip().lower()
+    return {
+        "ignite": (255, 82, 82),       # Red
+        "integrate": (255, 172, 51),   # Orange
+        "harmonize": (255, 230, 0),    # Yellow
+        "reflect": (102, 255, 204),    # Aqua
+        "purify": (102, 153, 255),     # Blue
+        "dream": (204, 153, 255)       # Violet
+    }.get(arc, (200, 200, 200))
+
+# Month background harmonics (canvas color)
+def chakra_background(month: str):
+    month = month.strip().lower()
+    return {
+        "aethon": (18, 2, 6),
+        "virelai": (5, 15, 28),
+        "solari": (20, 10, 2),
+        "amarin": (2, 20, 14),
+        "kaelus": (4, 4, 25),
+        "umbriel": (15, 6, 36),
+        "noctura": (12, 0, 20),
+        "liora": (0, 18, 18),
+    }.get(month, (10, 8, 36))
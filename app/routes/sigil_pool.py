@@ -0,0 +1,222 @@
+# routes/sigil_pool.py
+
+import asyncio
+import math
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterable, Optional
+
+from fastapi import APIRouter
+
+router = APIRouter()
+
+# Sigil rendering (Pillow drawing + PNG encoding) runs in its own pool so it
+# never competes with /kai for the request thread pool or the GIL:
+#   KAI_SIGIL_WORKERS  worker processes (0: a dedicated thread). Defaults to
+#                      2, or 0 on Vercel (VERCEL is set), whose functions
+#                      often lack /dev/shm for multiprocessing.
+#   KAI_SIGIL_QUEUE    renders allowed to wait for a worker; past that a
+#                      request fails fast with 503 + Retry-After
+# Wherever worker processes can't start, the pool falls back to the thread
+# and reports why under `fallback` in /sigil/pool. A pool whose workers
+# died is dropped and started again on the next render.
+_SLOT_WAIT_S = 0.05   # batch poll interval while the pool is full of other renders
+
+
+class SigilPoolFull(Exception):
+    def __init__(self, retry_after: int):
+        super().__init__("Sigil renderer is busy, retry shortly")
+        self.retry_after = retry_after
+
+
+def _timed(fn: Callable, *args):
+    start = time.perf_counter()
+    return fn(*args), time.perf_counter() - start
+
+
+class SigilRenderPool:
+    def __init__(self, workers: int = 2, queue: int = 8, samples: int = 256):
+        if workers < 0 or queue < 0:
+            raise ValueError("workers and queue must be >= 0")
+        self.workers = workers
+        self.queue = queue
+        self.capacity = max(workers, 1) + queue
+        self._lock = threading.Lock()
+        self._executor = None
+        self.fallback: Optional[str] = None
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._render_s: deque = deque(maxlen=samples)
+        self._latency_s: deque = deque(maxlen=samples)
+
+    def _pool(self):
+        """The executor, started on first use (call with the lock held)."""
+        if self._executor is None:
+            if self.workers and self.fallback is None:
+                try:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                    )
+                except (OSError, NotImplementedError, ImportError) as exc:  # e.g. no /dev/shm
+                    self.fallback = f"{type(exc).__name__}: {exc}"
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sigil")
+        return self._executor
+
+    def _discard(self, executor, fallback: Optional[str] = None) -> None:
+        """Drop a broken executor so the next render starts a new one."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+            if fallback is not None:
+                self.fallback = fallback
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, fn: Callable, args: tuple) -> tuple:
+        """Submit a render that holds a pending slot; the slot is released if submitting fails."""
+        retried = False
+        try:
+            while True:
+                with self._lock:
+                    executor = self._pool()
+                try:
+                    fut = executor.submit(_timed, fn, *args)
+                except BrokenExecutor:
+                    self._discard(executor)
+                    if retried:
+                        raise
+                    retried = True
+                except OSError as exc:
+                    if not isinstance(executor, ProcessPoolExecutor):
+                        raise
+                    # worker processes could not be spawned
+                    self._discard(executor, fallback=f"{type(exc).__name__}: {exc}")
+                else:
+                    return time.perf_counter(), executor, asyncio.wrap_future(fut)
+        except BaseException:
+            with self._lock:
+                self.pending -= 1
+                self.failed += 1
+            raise
+
+    def _take_slot(self) -> bool:
+        with self._lock:
+            if self.pending >= self.capacity:
+                return False
+            self.pending += 1
+            return True
+
+    def _retry_after(self) -> int:
+        """Seconds until the current backlog should have drained (>= 1)."""
+        if not self._render_s:
+            return 1
+        mean = sum(self._render_s) / len(self._render_s)
+        return max(1, math.ceil(mean * self.pending / max(self.workers, 1)))
+
+    async def render(self, fn: Callable, *args):
+        """Run picklable `fn(*args)` in the pool; raises SigilPoolFull when saturated."""
+        with self._lock:
+            if self.pending >= self.capacity:
+                self.rejected += 1
+                raise SigilPoolFull(self._retry_after())
+            self.pending += 1
+        return await self._settle(self._submit(fn, args))
+
+    def check_capacity(self) -> None:
+        """Raise SigilPoolFull if a render would be rejected now (e.g. before a batch starts streaming)."""
+        with self._lock:
+            if self.pending >= self.capacity:
+                self.rejected += 1
+                raise SigilPoolFull(self._retry_after())
+
+    async def render_ordered(self, fn: Callable, args_iter: Iterable[tuple],
+                             window: Optional[int] = None) -> AsyncIterator:
+        """
+        Yield fn(*args) for each args in order, keeping at most `window`
+        (default: two per worker) renders in flight. Batch renders count
+        toward `pending` and never take it past the pool's capacity: when
+        the pool is full they wait for a slot instead of being rejected.
+        """
+        window = min(window or 2 * max(self.workers, 1), self.capacity)
+        inflight: deque = deque()
+        try:
+            for args in args_iter:
+                while not self._take_slot():
+                    if inflight:
+                        yield await self._settle(inflight.popleft())
+                    else:
+                        await asyncio.sleep(_SLOT_WAIT_S)
+                inflight.append(self._submit(fn, args))
+                if len(inflight) >= window:
+                    yield await self._settle(inflight.popleft())
+            while inflight:
+                yield await self._settle(inflight.popleft())
+        finally:
+            for _, _, fut in inflight:
+                fut.cancel()
+            with self._lock:
+                self.pending -= len(inflight)
+
+    async def _settle(self, entry: tuple):
+        """Await one submitted render and record its outcome (pending was counted at submit)."""
+        start, executor, fut = entry
+        try:
+            result, render_s = await fut
+        except BaseException as exc:
+            with self._lock:
+                self.failed += 1
+            if isinstance(exc, BrokenExecutor):
+                self._discard(executor)
+            raise
+        finally:
+            with self._lock:
+                self.pending -= 1
+        with self._lock:
+            self.completed += 1
+            self._render_s.append(render_s)
+            self._latency_s.append(time.perf_counter() - start)
+        return result
+
+    def stats(self) -> Dict[str, object]:
+        def summary(samples: deque) -> Dict[str, float]:
+            if not samples:
+                return {"mean": 0.0, "p95": 0.0, "max": 0.0}
+            ordered = sorted(samples)
+            return {
+                "mean": round(sum(ordered) / len(ordered) * 1000, 2),
+                "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 2),
+                "max": round(ordered[-1] * 1000, 2),
+            }
+
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue": self.queue,
+                "fallback": self.fallback,
+                "pending": self.pending,
+                "queued": max(0, self.pending - max(self.workers, 1)),
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "renderMs": summary(self._render_s),
+                "latencyMs": summary(self._latency_s),
+            }
+
+
+# Process-wide pool used by /sigil, /sigil/stamp and /sigil/batch
+sigil_pool = SigilRenderPool(
+    workers=int(os.getenv("KAI_SIGIL_WORKERS", "0" if os.getenv("VERCEL") else "2")),
+    queue=int(os.getenv("KAI_SIGIL_QUEUE", "8")),
+)
+
+
+@router.get("/sigil/pool", tags=["Sigil"])
+def read_sigil_pool_stats() -> dict:
+    """Queue depth, rejections and render / end-to-end latency (ms) of the sigil render pool."""
+    return sigil_pool.stats()
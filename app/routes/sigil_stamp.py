@@ -1,126 +1,148 @@
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
-from PIL import Image, ImageDraw, ImageFont
-from uuid import uuid4
-import requests
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response
+from typing import Optional, TYPE_CHECKING
+import functools
 import io
 import math
-import os
 
-router = APIRouter()
+from kai_klock import UPULSES_PER_PULSE
+from kai_klock_static import etag_matches
+from .kai_source import get_kai_state_async
+from .sigil_palette import IMG_SIZE, CENTER, chakra_color_map, chakra_background
+from .sigil_http import requested_mu, sigil_headers
+from .sigil_pool import sigil_pool, SigilPoolFull
+from .sigil_svg import render_stamp_svg
 
-# Live harmonic Kairos source
-KLOCK_API = "https://klock.kaiturah.com/kai"
-IMG_SIZE = 1080
-CENTER = IMG_SIZE // 2
-
-# Chakra arc color encoding (outline)
-def chakra_color_map(arc: str):
-    arc = arc.strip().lower()
-    return {
-        "ignite": (255, 82, 82),       # Red
-        "integrate": (255, 172, 51),   # Orange
-        "harmonize": (255, 230, 0),    # Yellow
-        "reflect": (102, 255, 204),    # Aqua
-        "purify": (102, 153, 255),     # Blue
-        "dream": (204, 153, 255)       # Violet
-    }.get(arc, (200, 200, 200))
-
-# Month background harmonics (canvas color)
-def chakra_background(month: str):
-    month = month.strip().lower()
-    return {
-        "aethon": (18, 2, 6),
-        "virelai": (5, 15, 28),
-        "solari": (20, 10, 2),
-        "amarin": (2, 20, 14),
-        "kaelus": (4, 4, 25),
-        "umbriel": (15, 6, 36),
-        "noctura": (12, 0, 20),
-        "liora": (0, 18, 18),
-    }.get(month, (10, 8, 36))
-
-# Pull latest Kairos harmonic state
-def fetch_kairos_data():
-    try:
-        res = requests.get(KLOCK_API, timeout=5)
-        res.raise_for_status()
-        return res.json()
-    except Exception as e:
-        raise HTTPException(status_code=502, detail=f"Failed to fetch Kai data: {e}")
+if TYPE_CHECKING:
+    from PIL import Image
 
-@router.get("/sigil/stamp", response_class=StreamingResponse)
-def generate_sigil_stamp():
-    data = fetch_kairos_data()
+router = APIRouter()
 
+# Static layers depend only on (month background, arc outline): 8 × 6 at most,
+# so each is drawn once and copied per render; the font loads once. Pillow is
+# imported on first render, not when the routes are mounted.
+@functools.lru_cache(maxsize=None)
+def stamp_font():
+    from PIL import ImageFont
+
+    return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=64)
+def stamp_base_layer(background: tuple, outline: tuple) -> "Image.Image":
+    from PIL import Image, ImageDraw
+
+    img = Image.new("RGBA", (IMG_SIZE, IMG_SIZE), background)
+    draw = ImageDraw.Draw(img)
+
+    # Sacred triquetra geometry
+    for i in range(3):
+        angle = i * 120
+        x = CENTER + math.cos(math.radians(angle)) * 160
+        y = CENTER + math.sin(math.radians(angle)) * 160
+        draw.ellipse([(x - 100, y - 100), (x + 100, y + 100)],
+                     outline=outline, width=4)
+
+    # Central resonance vortex
+    draw.ellipse([(CENTER - 40, CENTER - 40), (CENTER + 40, CENTER + 40)],
+                 outline=(255, 255, 255), width=3)
+
+    # Step ticks (radial)
+    for i in range(44):
+        angle = (360 / 44) * i
+        rad = math.radians(angle)
+        x1 = CENTER + 190 * math.cos(rad)
+        y1 = CENTER + 210 * math.sin(rad)
+        draw.line((CENTER + 190 * math.cos(rad), CENTER + 190 * math.sin(rad), x1, y1),
+                  fill=(180, 180, 180), width=2)
+    return img
+
+# Kairos harmonic state (local by default, see kai_source)
+async def fetch_kairos_data(override_time: Optional[str] = None, pulse: Optional[int] = None):
     try:
-        # Live field values
-        pulse = data["kaiPulseEternal"]
-        kairos = data["chakraStepString"]
-        beat = data["eternalChakraBeat"]["beatIndex"]
-        step = data["chakraStep"]["stepIndex"]
-        day = data["harmonicDay"].upper()
-        arc = data["eternalChakraArc"].upper()
-        month = data["eternalMonth"]
-        year = data["eternalYearName"]
-        spiral = data["phiSpiralLevel"]
-        week = data["weekName"].upper()
-
-        # Initialize image
-        img = Image.new("RGBA", (IMG_SIZE, IMG_SIZE), chakra_background(month))
-        draw = ImageDraw.Draw(img)
-
-        # Load fallback default font
-        font_main = ImageFont.load_default()
-
-        # Sacred triquetra geometry
-        for i in range(3):
-            angle = i * 120
-            x = CENTER + math.cos(math.radians(angle)) * 160
-            y = CENTER + math.sin(math.radians(angle)) * 160
-            draw.ellipse([(x - 100, y - 100), (x + 100, y + 100)],
-                         outline=chakra_color_map(arc), width=4)
-
-        # Central resonance vortex
-        draw.ellipse([(CENTER - 40, CENTER - 40), (CENTER + 40, CENTER + 40)],
-                     outline=(255, 255, 255), width=3)
-
-        # Step ticks (radial)
-        for i in range(44):
-            angle = (360 / 44) * i
-            rad = math.radians(angle)
-            x1 = CENTER + 190 * math.cos(rad)
-            y1 = CENTER + 210 * math.sin(rad)
-            draw.line((CENTER + 190 * math.cos(rad), CENTER + 190 * math.sin(rad), x1, y1),
-                      fill=(180, 180, 180), width=2)
-
-        # Top metadata
-        draw.text((CENTER, 60), f"{day} • KAIROS {kairos} • ARC: {arc}",
-                  fill=(135, 206, 250), anchor="mm", font=font_main)
-
-        # Central pulse
-        draw.text((CENTER, CENTER - 20), "ETERNAL PULSE", fill=(255, 255, 255),
-                  anchor="mm", font=font_main)
-        draw.text((CENTER, CENTER + 10), str(pulse), fill=(255, 255, 255),
-                  anchor="mm", font=font_main)
-
-        # Middle title
-        draw.text((CENTER, CENTER + 60), f"{year} ∴ PHI SPIRAL {spiral}",
-                  fill=(173, 216, 230), anchor="mm", font=font_main)
-
-        # Footer harmonic line
-        draw.text((CENTER, IMG_SIZE - 60),
-                  f"{month.upper()} • BEAT {beat}/36 • STEP {step}/44 • {week}",
-                  fill=(135, 206, 250), anchor="mm", font=font_main)
-
-        # Convert to stream
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
-
-        return StreamingResponse(buffer, media_type="image/png", headers={
-            "Content-Disposition": f"attachment; filename=eternal_stamp_{pulse}.png"
-        })
+        return await get_kai_state_async(override_time, pulse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+def render_stamp_png(data: dict) -> bytes:
+    """PNG bytes of the eternal stamp for a /kai payload (runs in the sigil pool)."""
+    from PIL import ImageDraw
+
+    # Live field values
+    pulse = data["kaiPulseEternal"]
+    kairos = data["chakraStepString"]
+    beat = data["eternalChakraBeat"]["beatIndex"]
+    step = data["chakraStep"]["stepIndex"]
+    day = data["harmonicDay"].upper()
+    arc = data["eternalChakraArc"].upper()
+    month = data["eternalMonth"]
+    year = data["eternalYearName"]
+    spiral = data["phiSpiralLevel"]
+    week = data["weekName"].upper()
+
+    # Canvas: cached background, triquetra, vortex and step ticks
+    img = stamp_base_layer(chakra_background(month), chakra_color_map(arc)).copy()
+    draw = ImageDraw.Draw(img)
+    font_main = stamp_font()
+
+    # Top metadata
+    draw.text((CENTER, 60), f"{day} • KAIROS {kairos} • ARC: {arc}",
+              fill=(135, 206, 250), anchor="mm", font=font_main)
+
+    # Central pulse
+    draw.text((CENTER, CENTER - 20), "ETERNAL PULSE", fill=(255, 255, 255),
+              anchor="mm", font=font_main)
+    draw.text((CENTER, CENTER + 10), str(pulse), fill=(255, 255, 255),
+              anchor="mm", font=font_main)
+
+    # Middle title
+    draw.text((CENTER, CENTER + 60), f"{year} ∴ PHI SPIRAL {spiral}",
+              fill=(173, 216, 230), anchor="mm", font=font_main)
+
+    # Footer harmonic line
+    draw.text((CENTER, IMG_SIZE - 60),
+              f"{month.upper()} • BEAT {beat}/36 • STEP {step}/44 • {week}",
+              fill=(135, 206, 250), anchor="mm", font=font_main)
+
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+@router.get("/sigil/stamp", response_class=Response)
+async def generate_sigil_stamp(
+    request: Request,
+    override_time: Optional[str] = Query(None, description="ISO-8601 moment to render (default: now)."),
+    pulse: Optional[int] = Query(None, description="Eternal Kai pulse to render instead of a moment."),
+    image_format: str = Query("png", alias="format", pattern="^(png|svg)$",
+                              description="png (rendered in the sigil pool) or svg (vector, no rasterizing)."),
+):
+    try:
+        mu, fixed = requested_mu(override_time, pulse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    headers = sigil_headers("stamp", image_format, mu, fixed)
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    data = await fetch_kairos_data(override_time, pulse)
+    if data["kaiPulseEternal"] != mu // UPULSES_PER_PULSE:  # remote source across a pulse boundary
+        headers = sigil_headers("stamp", image_format, data["kaiPulseEternal"] * UPULSES_PER_PULSE, fixed)
+    headers["Content-Disposition"] = f"attachment; filename=eternal_stamp_{data['kaiPulseEternal']}.{image_format}"
+
+    if image_format == "svg":
+        try:
+            svg = render_stamp_svg(data)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error generating eternal stamp: {e}")
+        return Response(svg, media_type="image/svg+xml", headers=headers)
 
+    try:
+        png = await sigil_pool.render(render_stamp_png, data)
+    except SigilPoolFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": str(e.retry_after)})
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating eternal stamp: {e}")
+
+    # 📤 Send as file download
+    return Response(png, media_type="image/png", headers=headers)
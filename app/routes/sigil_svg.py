@@ -0,0 +1,116 @@
+# routes/sigil_svg.py
+
+import functools
+import math
+from xml.sax.saxutils import escape
+
+from .sigil_palette import IMG_SIZE, CENTER, chakra_color_map, chakra_background
+
+# Vector twins of render_sigil_png / render_stamp_png: the same geometry,
+# colors and text positions as templated SVG markup, built from strings only
+# (no Pillow). The static part of each canvas is cached like the PNG base
+# layers; a render fills in the text. Pillow outlines grow inward from the
+# ellipse box, so circle radii are box radius − stroke / 2.
+
+
+def _n(v: float) -> str:
+    return f"{v:.2f}".rstrip("0").rstrip(".")
+
+
+def _rgb(color: tuple) -> str:
+    return "#%02x%02x%02x" % color[:3]
+
+
+def _svg(body: str) -> str:
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{IMG_SIZE}" height="{IMG_SIZE}" '
+        f'viewBox="0 0 {IMG_SIZE} {IMG_SIZE}">{body}</svg>'
+    )
+
+
+def _text(x: float, y: float, text, fill: tuple, size: int) -> str:
+    return f'<text x="{_n(x)}" y="{_n(y)}" fill="{_rgb(fill)}" font-size="{size}">{escape(str(text))}</text>'
+
+
+@functools.lru_cache(maxsize=None)
+def sigil_svg_base() -> str:
+    circles = "".join(
+        f'<circle cx="{_n(CENTER + 180 * math.cos(math.radians(a)))}" '
+        f'cy="{_n(CENTER + 180 * math.sin(math.radians(a)))}" r="78"/>'
+        for a in (0, 120, 240)
+    )
+    return (
+        f'<rect width="{IMG_SIZE}" height="{IMG_SIZE}" fill="{_rgb((8, 12, 32))}"/>'
+        f'<g fill="none" stroke="{_rgb((255, 255, 0))}" stroke-width="4">{circles}</g>'
+    )
+
+
+def render_sigil_svg(data: dict) -> str:
+    """SVG markup of the eternal sigil for a /kai payload (layout of render_sigil_png)."""
+    pulse        = data["kaiPulseEternal"]
+    kairos       = data["chakraStepString"]
+    day_name     = data["harmonicDay"].upper()
+    month_name   = data["eternalMonth"].upper()
+    arc_name     = data["eternalChakraArc"].upper()
+    week_name    = data["weekName"].upper()
+    year_name    = data["eternalYearName"].upper()
+    beat_idx     = data["eternalChakraBeat"]["beatIndex"]
+    step_idx     = data["chakraStep"]["stepIndex"]
+
+    # Two 60 px lines centered on CENTER − 100 (Pillow pitch: 68 px)
+    texts = "".join((
+        _text(CENTER, CENTER - 134, "ETERNAL PULSE", (255, 255, 255), 60),
+        _text(CENTER, CENTER - 66, pulse, (255, 255, 255), 60),
+        _text(CENTER, CENTER + 110, f"{year_name} ∴ PHI SPIRAL {data['phiSpiralLevel']}", (173, 216, 230), 34),
+        _text(CENTER, 70, f"{day_name} • KAIROS {kairos} • ARC: {arc_name}", (135, 206, 250), 34),
+        _text(CENTER, IMG_SIZE - 70, f"{month_name} • BEAT {beat_idx}/36 • STEP {step_idx}/44 • {week_name}",
+              (135, 206, 250), 34),
+        _text(CENTER, IMG_SIZE - 30, data["eternalSeal"], (220, 220, 220), 34),
+    ))
+    return _svg(
+        sigil_svg_base()
+        + '<g font-family="DejaVu Sans, Verdana, sans-serif" font-weight="bold" '
+          f'text-anchor="middle" dominant-baseline="central">{texts}</g>'
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def stamp_svg_base(background: tuple, outline: tuple) -> str:
+    circles = "".join(
+        f'<circle cx="{_n(CENTER + math.cos(math.radians(i * 120)) * 160)}" '
+        f'cy="{_n(CENTER + math.sin(math.radians(i * 120)) * 160)}" r="98"/>'
+        for i in range(3)
+    )
+    ticks = "".join(
+        f'<line x1="{_n(CENTER + 190 * math.cos(rad))}" y1="{_n(CENTER + 190 * math.sin(rad))}" '
+        f'x2="{_n(CENTER + 190 * math.cos(rad))}" y2="{_n(CENTER + 210 * math.sin(rad))}"/>'
+        for rad in (math.radians((360 / 44) * i) for i in range(44))
+    )
+    return (
+        f'<rect width="{IMG_SIZE}" height="{IMG_SIZE}" fill="{_rgb(background)}"/>'
+        f'<g fill="none" stroke="{_rgb(outline)}" stroke-width="4">{circles}</g>'
+        f'<circle cx="{CENTER}" cy="{CENTER}" r="38.5" fill="none" stroke="#ffffff" stroke-width="3"/>'
+        f'<g stroke="{_rgb((180, 180, 180))}" stroke-width="2">{ticks}</g>'
+    )
+
+
+def render_stamp_svg(data: dict) -> str:
+    """SVG markup of the eternal stamp for a /kai payload (layout of render_stamp_png)."""
+    arc = data["eternalChakraArc"].upper()
+    month = data["eternalMonth"]
+    texts = "".join((
+        _text(CENTER, 60, f"{data['harmonicDay'].upper()} • KAIROS {data['chakraStepString']} • ARC: {arc}",
+              (135, 206, 250), 10),
+        _text(CENTER, CENTER - 20, "ETERNAL PULSE", (255, 255, 255), 10),
+        _text(CENTER, CENTER + 10, data["kaiPulseEternal"], (255, 255, 255), 10),
+        _text(CENTER, CENTER + 60, f"{data['eternalYearName']} ∴ PHI SPIRAL {data['phiSpiralLevel']}",
+              (173, 216, 230), 10),
+        _text(CENTER, IMG_SIZE - 60,
+              f"{month.upper()} • BEAT {data['eternalChakraBeat']['beatIndex']}/36 • "
+              f"STEP {data['chakraStep']['stepIndex']}/44 • {data['weekName'].upper()}",
+              (135, 206, 250), 10),
+    ))
+    return _svg(
+        stamp_svg_base(chakra_background(month), chakra_color_map(arc))
+        + f'<g font-family="sans-serif" text-anchor="middle" dominant-baseline="central">{texts}</g>'
+    )
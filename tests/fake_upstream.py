@@ -0,0 +1,58 @@
+# tests/fake_upstream.py
+#
+# Stand-in for the public Kai-Klok API, used by test_kai_upstream.py and for
+# exercising KAI_SIGIL_SOURCE=remote by hand (from the repository root):
+#
+#   PYTHONPATH=app uvicorn --app-dir tests fake_upstream:app --port 8001
+#   KAI_SIGIL_SOURCE=remote KAI_KLOCK_API=http://127.0.0.1:8001/kai uvicorn --app-dir app main:app
+#
+# GET /kai answers like the real endpoint (computed by the local engine) after
+# FAKE_UPSTREAM_DELAY_MS, and fails with 503 while the outage switch is on.
+
+import asyncio
+import os
+from datetime import datetime
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import Response
+
+from kai_klock_cache import kai_cache
+
+app = FastAPI(title="Fake Kai-Klok upstream")
+
+_state = {
+    "delayMs": int(os.getenv("FAKE_UPSTREAM_DELAY_MS", "0")),
+    "down": os.getenv("FAKE_UPSTREAM_DOWN", "0") == "1",
+    "hits": 0,
+}
+
+
+@app.get("/kai")
+async def fake_kai(override_time: Optional[str] = Query(None)):
+    _state["hits"] += 1
+    if _state["delayMs"]:
+        await asyncio.sleep(_state["delayMs"] / 1000)
+    if _state["down"]:
+        raise HTTPException(status_code=503, detail="Upstream is down")
+    try:
+        at = datetime.fromisoformat(override_time) if override_time else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Response(kai_cache.get_json(at), media_type="application/json")
+
+
+@app.get("/_fake")
+def fake_state() -> dict:
+    """Hit counter and current switches."""
+    return _state
+
+
+@app.post("/_fake")
+def set_fake_state(delay_ms: Optional[int] = None, down: Optional[bool] = None) -> dict:
+    """Change the delay / outage switch at runtime."""
+    if delay_ms is not None:
+        _state["delayMs"] = delay_ms
+    if down is not None:
+        _state["down"] = down
+    return _state
@@ -0,0 +1,92 @@
+# tests/importtime_budget.py
+#
+# Cold-start budget for the serverless entry point (vercel.json → main.py):
+#
+#   python tests/importtime_budget.py      # exit status 1 over budget
+#
+# Imports `main` in fresh interpreters under `python -X importtime` (best of
+# KAI_IMPORT_RUNS) and fails when
+#   • a module that must load on first use is imported (LAZY_MODULES),
+#   • `main` takes longer than KAI_IMPORT_BUDGET_MS in total, or
+#   • this app's own modules (self time, i.e. without FastAPI / pydantic)
+#     take longer than KAI_IMPORT_OWN_BUDGET_MS.
+# Kept out of app/ so it is not shipped in the function bundle. The test
+# suite (tests/test_importtime_budget.py) runs the lazy-module check and an
+# own-module budget with headroom for slow CI hosts; the strict budgets
+# above are checked here.
+
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app")
+
+KAI_IMPORT_RUNS = int(os.getenv("KAI_IMPORT_RUNS", "5"))
+KAI_IMPORT_BUDGET_MS = float(os.getenv("KAI_IMPORT_BUDGET_MS", "900"))
+KAI_IMPORT_OWN_BUDGET_MS = float(os.getenv("KAI_IMPORT_OWN_BUDGET_MS", "100"))
+
+# Loaded by the routes that need them, never by `import main`
+LAZY_MODULES = ("PIL", "httpx", "requests", "numpy", "routes")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def own_modules() -> set:
+    return {name[:-3] for name in os.listdir(APP_DIR) if name.endswith(".py")}
+
+
+def import_profile() -> List[Tuple[str, int, int]]:
+    """(module, self μs, cumulative μs) for every module `import main` loads."""
+    res = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=APP_DIR, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in res.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            rows.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return rows
+
+
+def measure(runs: int = KAI_IMPORT_RUNS) -> Dict[str, object]:
+    own = own_modules()
+    best = None
+    for _ in range(runs):
+        rows = import_profile()
+        total = next(cum for name, _, cum in rows if name == "main")
+        own_self = {name: self_us for name, self_us, _ in rows if name.split(".")[0] in own}
+        if best is None or total < best["totalMs"] * 1000:
+            best = {
+                "totalMs": total / 1000,
+                "ownMs": sum(own_self.values()) / 1000,
+                "own": sorted(own_self.items(), key=lambda item: -item[1]),
+                "lazyLoaded": sorted({name.split(".")[0] for name, _, _ in rows
+                                      if name.split(".")[0] in LAZY_MODULES}),
+            }
+    return best
+
+
+def main() -> int:
+    result = measure()
+    print(f"import main: {result['totalMs']:.1f} ms (budget {KAI_IMPORT_BUDGET_MS:.0f} ms)")
+    print(f"  own modules: {result['ownMs']:.1f} ms (budget {KAI_IMPORT_OWN_BUDGET_MS:.0f} ms)")
+    for name, self_us in result["own"]:
+        print(f"    {self_us / 1000:8.2f} ms  {name}")
+
+    failures = []
+    if result["lazyLoaded"]:
+        failures.append(f"imported at startup: {', '.join(result['lazyLoaded'])}")
+    if result["totalMs"] > KAI_IMPORT_BUDGET_MS:
+        failures.append(f"import main over budget by {result['totalMs'] - KAI_IMPORT_BUDGET_MS:.1f} ms")
+    if result["ownMs"] > KAI_IMPORT_OWN_BUDGET_MS:
+        failures.append(f"own modules over budget by {result['ownMs'] - KAI_IMPORT_OWN_BUDGET_MS:.1f} ms")
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
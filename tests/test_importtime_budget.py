@@ -0,0 +1,12 @@
+# tests/test_importtime_budget.py  •  `import main` stays cheap and leaves the heavy modules for first use
+import importtime_budget
+
+# Headroom over the strict budget (importtime_budget.py) for slow or shared CI hosts
+OWN_BUDGET_MS = 3 * importtime_budget.KAI_IMPORT_OWN_BUDGET_MS
+
+
+def test_import_main_is_within_budget():
+    result = importtime_budget.measure(runs=2)
+    assert result["lazyLoaded"] == []
+    assert result["totalMs"] > 0
+    assert result["ownMs"] < OWN_BUDGET_MS, result["own"]
@@ -0,0 +1,92 @@
+# Vector batch path (kai_klock_batch) against the scalar engine.
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from kai_klock import (
+    get_eternal_klock, mu_since_genesis, unix_at_mu,
+    MU_SUNRISE0, UPULSES_PER_DAY, UPULSES_PER_PULSE,
+)
+np = pytest.importorskip("numpy")  # requirements-dev.txt; the deployed API does not ship it
+
+from kai_klock_batch import kai_coordinates_batch, mu_since_genesis_batch
+
+GENESIS = datetime(2024, 5, 10, 6, 45, 41, 888000, tzinfo=timezone.utc)
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+YEAR_9999 = datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc)
+
+
+def _us(at: datetime) -> int:
+    return (at - UNIX_EPOCH) // timedelta(microseconds=1)
+
+
+def _at(us: int) -> datetime:
+    return UNIX_EPOCH + timedelta(microseconds=us)
+
+
+def _boundary_us() -> list:
+    """Genesis, negative, eternal/solar day turns (±1 μs) and year 9999."""
+    out = [_us(GENESIS) + d for d in (-1, 0, 1)]
+    out += [_us(GENESIS) - 10 ** k for k in range(1, 16)]
+    for day in (-400, -1, 0, 1, 2, 335, 336, 10_000):
+        for mu in (day * UPULSES_PER_DAY, MU_SUNRISE0 + day * UPULSES_PER_DAY):
+            first = unix_at_mu(mu, "us")
+            out += [first - 1, first, first + 1]
+    out += [_us(YEAR_9999) - d for d in (0, 1, 999_999, 86_400_000_000)]
+    out += [_us(datetime(1, 1, 1, tzinfo=timezone.utc))]
+    return out
+
+
+def _random_us(n: int = 400) -> list:
+    rng = random.Random(3)
+    lo, hi = _us(datetime(1900, 1, 1, tzinfo=timezone.utc)), _us(YEAR_9999)
+    return [rng.randrange(lo, hi) for _ in range(n)]
+
+
+def _scalar_row(at: datetime) -> dict:
+    k = get_eternal_klock(at)
+    return {
+        "mu": mu_since_genesis(at),
+        "kaiPulseEternal": k.kaiPulseEternal,
+        "eternalKaiPulseToday": k.eternalKaiPulseToday,
+        "kaiPulseToday": k.kaiPulseToday,
+        "eternalBeatIndex": k.eternalChakraBeat.beatIndex,
+        "eternalStepIndex": k.chakraStep.stepIndex,
+        "eternalPercentIntoStep": k.chakraStep.percentIntoStep,
+        "eternalPercentOfBeat": k.eternalChakraBeat.percentToNext,
+        "solarBeatIndex": k.chakraBeat.beatIndex,
+        "solarStepIndex": k.solarChakraStep.stepIndex,
+        "solarPercentIntoStep": k.solarChakraStep.percentIntoStep,
+        "weekDayIndex": k.harmonicWeekProgress.weekDayIndex,
+        "dayOfMonth": k.dayOfMonth,
+        "weekIndex": k.weekIndex,
+        "eternalMonthIndex": k.eternalMonthIndex,
+        "solarDayOfMonth": k.solarDayOfMonth,
+        "solarWeekIndex": k.solar_week_index,
+        "solarMonthIndex": k.solarMonthIndex,
+    }
+
+
+@pytest.mark.parametrize("name,samples", [("boundary", _boundary_us()), ("random", _random_us())])
+def test_batch_matches_scalar(name, samples):
+    rows = kai_coordinates_batch(np.array(samples, dtype=np.int64), unit="us")
+    for us, row in zip(samples, rows):
+        expected = _scalar_row(_at(us))
+        got = {field: row[field].item() for field in expected}
+        assert got == expected, _at(us)
+        assert row["kaiPulseEternal"] == row["mu"] // UPULSES_PER_PULSE
+
+
+def test_ms_and_us_units_agree_with_scalar():
+    samples = [us - us % 1000 for us in _boundary_us() + _random_us(100)]
+    by_ms = mu_since_genesis_batch(np.array([us // 1000 for us in samples], dtype=np.int64), unit="ms")
+    by_us = mu_since_genesis_batch(np.array(samples, dtype=np.int64), unit="us")
+    assert by_ms.tolist() == by_us.tolist() == [mu_since_genesis(_at(us)) for us in samples]
+
+
+def test_out_of_range_and_bad_unit():
+    with pytest.raises(ValueError):
+        mu_since_genesis_batch(np.array([(1 << 62) + (1 << 60)], dtype=np.int64), unit="us")
+    with pytest.raises(ValueError):
+        mu_since_genesis_batch([0], unit="s")
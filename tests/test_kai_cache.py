@@ -0,0 +1,159 @@
+# tests/test_kai_cache.py  •  cached /kai payloads equal the uncached engine at the exact instant
+import json
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from kai_klock import (
+    get_eternal_klock, resolve_kai_fields, mu_since_genesis_int, datetime_at_mu, UPULSES_PER_PULSE,
+)
+import kai_klock_cache
+from kai_klock_cache import KaiResponseCache
+
+# Instants that do not fall on a pulse boundary, including one moment inside
+# the pulse in which the eternal and solar day counters advance.
+_REPORTED = datetime(2025, 3, 1, 12, 34, 56, 789000, tzinfo=timezone.utc)
+
+
+def _instants(n: int = 40) -> list:
+    rng = random.Random(5)
+    out = [_REPORTED]
+    for _ in range(n):
+        mu = rng.randrange(-10**15, 10**16)
+        if mu % UPULSES_PER_PULSE == 0:
+            mu += 1
+        out.append(datetime_at_mu(mu) + timedelta(microseconds=rng.randrange(1, 5000)))
+    return out
+
+
+def _uncached(at: datetime) -> dict:
+    return get_eternal_klock(at).model_dump(mode="json")
+
+
+def test_cached_payload_is_exact_at_non_aligned_instants():
+    cache = KaiResponseCache(maxsize=64)
+    for at in _instants():
+        assert mu_since_genesis_int(at) % UPULSES_PER_PULSE != 0
+        expected = _uncached(at)
+        assert cache.get_data(at) == expected          # miss
+        assert cache.get_data(at) == expected          # hit
+        assert json.loads(cache.get_json(at)) == expected
+        assert cache.get(at).model_dump(mode="json") == expected
+
+
+def test_reported_moment_day_counters():
+    expected = _uncached(_REPORTED)
+    data = KaiResponseCache(maxsize=8).get_data(_REPORTED)
+    assert data["eternalKaiPulseToday"] == expected["eternalKaiPulseToday"] == 9203
+    assert data["kaiPulseToday"] == expected["kaiPulseToday"] == 11938
+
+
+def test_projection_is_exact_on_hit_and_miss():
+    fields = resolve_kai_fields(["eternalKaiPulseToday", "kaiPulseToday", "eternalSeal", "chakraStep"])
+    for at in _instants(10):
+        expected = {f: _uncached(at)[f] for f in fields}
+        cache = KaiResponseCache(maxsize=8)
+        assert cache.get_fields(fields, at) == expected    # computed directly
+        cache.get_data(at)
+        assert cache.get_fields(fields, at) == expected    # sliced from the cached payload
+
+
+def test_nearby_instants_do_not_share_an_entry():
+    cache = KaiResponseCache(maxsize=8)
+    first = _REPORTED
+    second = first + timedelta(milliseconds=1)
+    assert cache.get_data(first) == _uncached(first)
+    assert cache.get_data(second) == _uncached(second)
+    assert cache.stats()["misses"] == 2
+
+
+def test_concurrent_misses_coalesce():
+    cache = KaiResponseCache(maxsize=8)
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: cache.get_data(_REPORTED), range(32)))
+    assert all(r is results[0] for r in results)
+    assert results[0] == _uncached(_REPORTED)
+    stats = cache.stats()
+    assert stats["size"] == 1
+    assert stats["misses"] + stats["hits"] + stats["coalesced"] == 32
+
+
+def _frozen_now(monkeypatch, instants):
+    """Make the cache's "now" walk through `instants` (UTC, one per call)."""
+    pending = iter(instants)
+
+    class _Clock(datetime):
+        @classmethod
+        def utcnow(cls):
+            return next(pending).replace(tzinfo=None)
+
+    monkeypatch.setattr(kai_klock_cache, "datetime", _Clock)
+
+
+def test_now_hits_the_pulse_layer_within_a_pulse(monkeypatch):
+    start = mu_since_genesis_int(_REPORTED)
+    pulse_start = start - start % UPULSES_PER_PULSE
+    offsets = (1, 250_000, UPULSES_PER_PULSE - 1, UPULSES_PER_PULSE)   # three in one pulse, then the next
+    polls = [datetime_at_mu(pulse_start + off) for off in offsets]
+    _frozen_now(monkeypatch, polls)
+    cache = KaiResponseCache(maxsize=8)
+    for at in polls:
+        assert cache.get_data() == _uncached(at)
+    stats = cache.stats()
+    assert (stats["layerMisses"], stats["layerHits"]) == (2, 2)
+    assert stats["size"] == 0 and stats["uncached"] == 4
+
+
+def test_fixed_moments_in_one_pulse_share_a_layer():
+    cache = KaiResponseCache(maxsize=8)
+    first = _REPORTED
+    second = datetime_at_mu(mu_since_genesis_int(first) + 1)
+    assert cache.get_data(first) == _uncached(first)
+    assert cache.get_data(second) == _uncached(second)
+    stats = cache.stats()
+    assert (stats["misses"], stats["layerMisses"], stats["layerHits"]) == (2, 1, 1)
+
+
+def test_coarser_resolution_floors_and_keeps_now(monkeypatch):
+    mu = mu_since_genesis_int(_REPORTED)
+    floored = datetime_at_mu(mu - mu % UPULSES_PER_PULSE)
+    _frozen_now(monkeypatch, [_REPORTED, _REPORTED + timedelta(milliseconds=1)])
+    cache = KaiResponseCache(maxsize=8, resolution_mu=UPULSES_PER_PULSE)
+    assert cache.get_data() == _uncached(floored)
+    assert cache.get_data() == _uncached(floored)
+    assert cache.get_data(_REPORTED) == _uncached(floored)
+    stats = cache.stats()
+    assert (stats["misses"], stats["hits"], stats["resolutionMu"]) == (1, 2, UPULSES_PER_PULSE)
+
+
+def test_disabled_cache_computes_every_call():
+    cache = KaiResponseCache(maxsize=0)
+    assert cache.get_data(_REPORTED) == _uncached(_REPORTED)
+    assert cache.stats()["size"] == 0
+
+
+def test_kai_endpoint_reports_the_requested_instant():
+    from fastapi.testclient import TestClient
+    from main import app
+
+    client = TestClient(app)
+    params = {"override_time": "2025-03-01T12:34:56.789Z"}
+    expected = _uncached(_REPORTED)
+    assert client.get("/kai", params=params).json() == expected
+    assert client.get("/kai", params=params).json() == expected
+    projected = client.get("/kai", params={**params, "fields": "kaiPulseToday,eternalKaiPulseToday"})
+    assert projected.json() == {"eternalKaiPulseToday": 9203, "kaiPulseToday": 11938}
+    assert client.get("/kai", params={**params, "format": "%k|%t"}).text == "9203|11938"
+
+
+def test_payloads_do_not_share_engine_caches():
+    from kai_klock import get_eternal_klock_data
+
+    fields = resolve_kai_fields(["phiSpiralEpochs", "subdivisions"])
+    first = get_eternal_klock_data(_REPORTED)
+    first["phiSpiralEpochs"].clear()
+    first["subdivisions"].clear()
+    KaiResponseCache(maxsize=0).get_fields(fields, _REPORTED)["phiSpiralEpochs"].append({})
+    again = get_eternal_klock_data(_REPORTED)
+    assert again["phiSpiralEpochs"] and again["subdivisions"]
+    assert again == _uncached(_REPORTED)
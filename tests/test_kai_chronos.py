@@ -0,0 +1,109 @@
+# tests/test_kai_chronos.py  •  inverse API (Kai → Chronos) is floor-consistent with the forward μpulse count
+import random
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from kai_klock import (
+    ETERNAL_GENESIS_UNIX_US, HARMONIC_MONTH_DAYS, HARMONIC_YEAR_DAYS, MU_SUNRISE0, UNIX_EPOCH,
+    UPULSES_PER_DAY, UPULSES_PER_PULSE, datetime_at_mu, kai_day_index, kai_lite_at_mu, mu_at_grid,
+    mu_from_us_since_genesis, mu_since_genesis_int, unix_at_mu, us_since_genesis_at_mu,
+)
+from main import app
+
+client = TestClient(app)
+
+
+def _mus(n: int = 200, hi: int = 10**17) -> list:
+    rng = random.Random(4)
+    edges = [0, 1, -1, UPULSES_PER_PULSE, -UPULSES_PER_PULSE, UPULSES_PER_DAY, MU_SUNRISE0]
+    return edges + [rng.randrange(-10**16, hi) for _ in range(n)]
+
+
+@pytest.mark.parametrize("mu", _mus(), ids=str)
+def test_first_instant_round_trips(mu):
+    us = us_since_genesis_at_mu(mu)
+    assert mu_from_us_since_genesis(us) == mu
+    assert mu_from_us_since_genesis(us - 1) == mu - 1
+    assert unix_at_mu(mu, "us") == ETERNAL_GENESIS_UNIX_US + us
+
+
+@pytest.mark.parametrize("mu", _mus(40, hi=10**16), ids=str)   # within datetime's range
+def test_datetime_and_unix_ms_are_first_instants(mu):
+    at = datetime_at_mu(mu)
+    assert mu_since_genesis_int(at) == mu
+    assert mu_since_genesis_int(at - timedelta(microseconds=1)) == mu - 1
+    # ms resolution rounds up: the returned millisecond has reached `mu`, the one before has not
+    ms_at = UNIX_EPOCH + timedelta(milliseconds=unix_at_mu(mu, "ms"))
+    assert mu_since_genesis_int(ms_at) >= mu
+    assert mu_since_genesis_int(ms_at - timedelta(milliseconds=1)) < mu
+
+
+def test_unknown_unit_is_rejected():
+    with pytest.raises(ValueError):
+        unix_at_mu(0, "s")
+
+
+def test_kai_day_index():
+    assert kai_day_index(0, 1, 1) == 0
+    assert kai_day_index(0, 2, 3) == HARMONIC_MONTH_DAYS + 2
+    assert kai_day_index(1, 1, 1) == HARMONIC_YEAR_DAYS
+    assert kai_day_index(-1, 8, 42) == -1
+    for bad in ((0, 0, 1), (0, 9, 1), (0, 1, 0), (0, 1, HARMONIC_MONTH_DAYS + 1)):
+        with pytest.raises(ValueError):
+            kai_day_index(*bad)
+
+
+def _eternal(mu: int) -> tuple:
+    # The eternal calendar day turns on the first whole pulse of the φ-day
+    lite = kai_lite_at_mu(mu)
+    return (lite.p * UPULSES_PER_PULSE) // UPULSES_PER_DAY, lite.eb, lite.es
+
+
+def _solar(mu: int) -> tuple:
+    lite = kai_lite_at_mu(mu)
+    return (mu - MU_SUNRISE0) // UPULSES_PER_DAY, lite.sb, lite.ss
+
+
+_GRID = [(0, 0, 0), (0, 0, 1), (3, 35, 43), (400, 0, 0), (400, 17, 22), (-2, 5, 7), (123_456, 35, 0)]
+
+
+@pytest.mark.parametrize("frame,reported", [("eternal", _eternal), ("solar", _solar)])
+@pytest.mark.parametrize("day_index,beat,step", _GRID)
+def test_mu_at_grid_is_where_the_coordinate_is_first_reported(frame, reported, day_index, beat, step):
+    mu = mu_at_grid(day_index, beat, step, frame)
+    assert reported(mu) == (day_index, beat, step)
+    assert reported(mu - 1) != (day_index, beat, step)
+
+
+def test_mu_at_grid_rejects_out_of_range_coordinates():
+    for args in ((0, 36, 0), (0, 0, 44), (0, -1, 0), (0, 0, 0, "lunar")):
+        with pytest.raises(ValueError):
+            mu_at_grid(*args)
+
+
+def test_chronos_endpoint():
+    res = client.get("/kai/chronos", params={"year": 1, "month": 2, "day": 3, "beat": 4, "step": 5, "unit": "us"})
+    assert res.status_code == 200
+    (item,) = res.json()
+    day_index = kai_day_index(1, 2, 3)
+    mu = mu_at_grid(day_index, 4, 5)
+    assert item == {
+        "mu": mu,
+        "kaiPulseEternal": mu // UPULSES_PER_PULSE,
+        "unix": unix_at_mu(mu, "us"),
+        "unit": "us",
+        "utc": datetime_at_mu(mu).isoformat(timespec="microseconds").replace("+00:00", "Z"),
+    }
+    # /kai at that instant reports the coordinate
+    fields = "eternalChakraBeat,chakraStep,dayOfMonth,eternalMonthIndex,harmonicYearProgress"
+    kai = client.get("/kai", params={"override_time": item["utc"], "fields": fields}).json()
+    assert (kai["eternalChakraBeat"]["beatIndex"], kai["chakraStep"]["stepIndex"]) == (4, 5)
+    assert (kai["eternalMonthIndex"], kai["dayOfMonth"]) == (2, 3)
+    assert kai["harmonicYearProgress"]["daysElapsed"] == HARMONIC_MONTH_DAYS + 2   # into year 1
+
+    batch = client.get("/kai/chronos", params=[("mu", 5), ("mu", -5), ("pulse", 1234)]).json()
+    assert [b["mu"] for b in batch] == [5, -5, 1234 * UPULSES_PER_PULSE]
+    assert [b["unix"] for b in batch] == [unix_at_mu(m) for m in (5, -5, 1234 * UPULSES_PER_PULSE)]
+    assert client.get("/kai/chronos").status_code == 400
@@ -0,0 +1,44 @@
+# Decimal contexts are per-thread; the engine must not depend on the caller's.
+import decimal
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from kai_klock import get_eternal_klock
+
+GENESIS = datetime(2024, 5, 10, 6, 45, 41, 888000, tzinfo=timezone.utc)
+
+
+def _instants(n: int = 120) -> list:
+    rng = random.Random(2)
+    return [GENESIS + timedelta(seconds=rng.uniform(-3e8, 3e9)) for _ in range(n)]
+
+
+def _payload(at: datetime, engine: str) -> dict:
+    return get_eternal_klock(at, engine=engine).model_dump(mode="json")
+
+
+def _hostile_payload(args) -> dict:
+    # A caller thread with its own (very different) default context
+    at, engine, prec = args
+    ctx = decimal.getcontext()
+    ctx.prec = prec
+    ctx.rounding = decimal.ROUND_HALF_UP if prec % 2 else decimal.ROUND_CEILING
+    return _payload(at, engine)
+
+
+def test_threaded_output_equals_single_threaded():
+    instants = _instants()
+    for engine in ("decimal", "int"):
+        expected = [_payload(at, engine) for at in instants]
+        jobs = [(at, engine, 3 + i % 40) for i, at in enumerate(instants)] * 4
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            got = list(pool.map(_hostile_payload, jobs))
+        assert got == expected * 4
+
+
+def test_caller_context_is_untouched():
+    ctx = decimal.getcontext()
+    before = (ctx.prec, ctx.rounding)
+    get_eternal_klock(GENESIS + timedelta(days=3), engine="decimal")
+    assert (decimal.getcontext().prec, decimal.getcontext().rounding) == before
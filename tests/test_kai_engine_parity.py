@@ -0,0 +1,60 @@
+# tests/test_kai_engine_parity.py  •  the int μpulse engine equals the Decimal reference engine
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pydantic_core import to_json
+
+from kai_klock import (
+    ETERNAL_GENESIS_PULSE, KAI_RESPONSE_FIELDS, UPULSES_PER_DAY, UPULSES_PER_PULSE,
+    datetime_at_mu, get_eternal_klock_data, get_kai_fields_data, mu_at_grid,
+)
+from kai_klock_range import kai_lattice
+
+_US = timedelta(microseconds=1)
+
+
+def _random_instants(n: int = 40) -> list:
+    rng = random.Random(1)
+    lo = datetime(1, 1, 2, tzinfo=timezone.utc)
+    span = (datetime(9999, 12, 30, tzinfo=timezone.utc) - lo) // _US
+    wide = [lo + rng.randrange(span) * _US for _ in range(n // 2)]
+    near = [ETERNAL_GENESIS_PULSE + rng.randrange(-10**13, 10**14) * _US for _ in range(n - n // 2)]
+    return wide + near
+
+
+def _boundary_instants() -> list:
+    """First instant of a pulse / step / beat / day boundary, and the μs before it."""
+    marks = [
+        7 * UPULSES_PER_PULSE,                                          # pulse
+        next(kai_lattice(10**13, None, "step")),                        # eternal step
+        next(kai_lattice(10**13, None, "step", "solar")),               # solar step
+        next(kai_lattice(10**13 + UPULSES_PER_DAY // 3, None, "beat")), # eternal beat
+        mu_at_grid(400),                                                # eternal day (whole pulse)
+        400 * UPULSES_PER_DAY,                                          # grid rolls over mid-pulse
+        mu_at_grid(-3, 5, 7),                                           # before genesis
+    ]
+    out = []
+    for mu in marks:
+        at = datetime_at_mu(mu)
+        out += [at, at - _US]
+    return out
+
+
+_EDGES = [
+    ETERNAL_GENESIS_PULSE,
+    ETERNAL_GENESIS_PULSE - _US,
+    ETERNAL_GENESIS_PULSE - timedelta(days=3650),
+    datetime(1, 1, 1, tzinfo=timezone.utc),
+    datetime(1, 6, 15, 12, 0, 0, 123456, tzinfo=timezone.utc),
+    datetime(9999, 6, 15, 12, 0, 0, 654321, tzinfo=timezone.utc),
+    datetime(9999, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc),
+]
+
+
+@pytest.mark.parametrize("at", _random_instants() + _boundary_instants() + _EDGES, ids=str)
+def test_int_engine_equals_decimal_engine(at):
+    reference = get_eternal_klock_data(at, engine="decimal")
+    assert to_json(get_eternal_klock_data(at, engine="int")) == to_json(reference)
+    # The lazy per-field path of the int engine
+    assert get_kai_fields_data(KAI_RESPONSE_FIELDS, at, engine="int") == reference
@@ -0,0 +1,103 @@
+# tests/test_kai_fields.py  •  /kai?fields= / exclude= projections
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic_core import to_json
+
+from kai_klock import (
+    KAI_RESPONSE_FIELDS, KaiKlockResponse, datetime_at_mu, get_eternal_klock, get_eternal_klock_data,
+    get_kai_fields, get_kai_fields_data, kai_projection_model, resolve_kai_fields, _ensure_utc,
+)
+from main import app
+
+client = TestClient(app)
+AT = "2025-03-01T12:34:56.789Z"
+FULL = get_eternal_klock(_ensure_utc(datetime.fromisoformat(AT))).model_dump(mode="json")
+
+
+def _kai(**params):
+    return client.get("/kai", params={"override_time": AT, **params})
+
+
+def test_fields_returns_only_those_fields_in_response_order():
+    res = _kai(fields="kaiPulseToday,eternalSeal,kaiPulseEternal")
+    assert res.status_code == 200
+    asked = {"kaiPulseEternal", "kaiPulseToday", "eternalSeal"}
+    assert list(res.json()) == [f for f in KAI_RESPONSE_FIELDS if f in asked]
+    assert res.json() == {f: FULL[f] for f in res.json()}
+
+
+def test_repeated_and_comma_separated_fields_combine():
+    res = client.get(f"/kai?override_time={AT}&fields=chakraStep&fields=weekName,%20dayOfMonth")
+    assert res.json() == {f: FULL[f] for f in ("weekName", "dayOfMonth", "chakraStep")}
+
+
+def test_exclude_drops_fields_from_the_full_payload():
+    res = _kai(exclude="harmonicNarrative,subdivisions")
+    assert res.status_code == 200
+    assert res.json() == {f: v for f, v in FULL.items() if f not in ("harmonicNarrative", "subdivisions")}
+
+
+def test_fields_and_exclude_combine():
+    res = _kai(fields="weekName,dayOfMonth", exclude="weekName")
+    assert res.json() == {"dayOfMonth": FULL["dayOfMonth"]}
+
+
+@pytest.mark.parametrize("params", [{"fields": "kaiPulseToday,nope"}, {"exclude": "nope"}])
+def test_unknown_names_are_rejected(params):
+    res = _kai(**params)
+    assert res.status_code == 400
+    assert "nope" in res.json()["detail"]
+
+
+@pytest.mark.parametrize("params", [
+    {"fields": ""},
+    {"fields": " , "},
+    {"fields": "weekName", "exclude": "weekName"},
+    {"exclude": ",".join(KAI_RESPONSE_FIELDS)},
+])
+def test_empty_selection_is_rejected(params):
+    res = _kai(**params)
+    assert res.status_code == 400
+    assert "empty" in res.json()["detail"]
+
+
+def test_resolve_kai_fields_empty_selection():
+    with pytest.raises(ValueError):
+        resolve_kai_fields([])
+    assert resolve_kai_fields() == KAI_RESPONSE_FIELDS
+
+
+def _parity_instants(n: int = 60) -> list:
+    rng = random.Random(25)
+    out = [_ensure_utc(datetime.fromisoformat(AT)), datetime_at_mu(0), datetime_at_mu(-1)]
+    for _ in range(n):
+        out.append(datetime_at_mu(rng.randrange(-10**15, 10**16)) + timedelta(microseconds=rng.randrange(5000)))
+    return out
+
+
+@pytest.mark.parametrize("engine", ["int", "decimal"])
+def test_payload_bytes_match_response_model_serialization(engine):
+    # What FastAPI sends for a response_model route is the reference.
+    ref = FastAPI()
+    state = {}
+
+    @ref.get("/full", response_model=KaiKlockResponse)
+    def full():
+        return get_eternal_klock(state["at"], engine)
+
+    fields = resolve_kai_fields(["kaiPulseToday", "chakraStep", "eternalChakraBeat", "harmonicLevels",
+                                 "phiSpiralEpochs", "harmonicYearProgress", "eternalSeal"])
+
+    @ref.get("/fields", response_model=kai_projection_model(fields))
+    def projected():
+        return get_kai_fields(fields, state["at"], engine)
+
+    ref_client = TestClient(ref)
+    for at in _parity_instants():
+        state["at"] = at
+        assert to_json(get_eternal_klock_data(at, engine)) == ref_client.get("/full").content
+        assert to_json(get_kai_fields_data(fields, at, engine)) == ref_client.get("/fields").content
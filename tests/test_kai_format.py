@@ -0,0 +1,59 @@
+# tests/test_kai_format.py  •  format templates and the built-in seals
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from kai_klock import KAI_FORMATS, format_kai, get_eternal_klock
+from kai_klock_format import compile_kai_format
+from main import app
+
+AT = datetime(2025, 3, 1, 12, 34, 56, 789000, tzinfo=timezone.utc)
+
+
+def test_builtin_seals_render_the_response_fields():
+    data = get_eternal_klock(AT).model_dump()
+    for name in KAI_FORMATS:
+        assert format_kai(name, AT) == data[name]
+
+
+def test_widths_flags_and_literals():
+    data = get_eternal_klock(AT).model_dump()
+    beat = data["eternalChakraBeat"]["beatIndex"]
+    day = data["harmonicDay"]
+    assert format_kai("%05B|%5B|%-5B|", AT) == f"{beat:05}|{beat:>5}|{beat:<5}|"
+    assert format_kai("%12N|%-12N|", AT) == f"{day:>12}|{day:<12}|"
+    assert format_kai("100%% %K % %", AT) == f"100% {data['kaiPulseEternal']} % %"
+    assert format_kai("", AT) == ""
+
+
+@pytest.mark.parametrize("engine", ["int", "decimal"])
+def test_zero_flag_pads_percents_as_numbers(engine):
+    data = get_eternal_klock(AT, engine).model_dump()
+    step = data["chakraStep"]["percentIntoStep"]
+    rendered = format_kai("%010p|%012P|%011q", AT, engine).split("|")
+    assert [len(part) for part in rendered] == [10, 12, 11]
+    assert all(part.startswith("0") for part in rendered)
+    assert float(rendered[0]) == step
+    assert float(rendered[1]) == data["eternalChakraBeat"]["percentToNext"]
+    assert float(rendered[2]) == data["solarChakraStep"]["percentIntoStep"]
+    assert format_kai("%0p", AT, engine) == format_kai("%p", AT, engine)
+
+
+@pytest.mark.parametrize("template", ["%09N", "%0A", "x %02n"])
+def test_zero_flag_is_rejected_for_names(template):
+    with pytest.raises(ValueError, match="Zero padding"):
+        compile_kai_format(template)
+
+
+def test_unknown_directive_is_rejected():
+    with pytest.raises(ValueError, match="%Q"):
+        compile_kai_format("%B %Q")
+
+
+def test_format_endpoint_errors_are_400():
+    client = TestClient(app)
+    assert client.get("/kai", params={"format": "%09N"}).status_code == 400
+    res = client.get("/kai", params={"format": "%9N|%02B", "override_time": AT.isoformat()})
+    assert res.status_code == 200
+    assert res.text == format_kai("%9N|%02B", AT)
@@ -0,0 +1,139 @@
+# tests/test_kai_range.py  •  range timeline and boundary schedule walk the exact μpulse lattice
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from kai_klock import (
+    GRID_BEATS_PER_DAY, GRID_STEPS_PER_BEAT, MU_SUNRISE0, UPULSES_PER_DAY, UPULSES_PER_PULSE, UPULSES_PER_YEAR,
+    datetime_at_mu, get_kai_fields_data_at_mu, kai_lite_at_mu, mu_since_genesis_int, resolve_kai_fields,
+    unix_at_mu,
+)
+from kai_klock_range import kai_lattice, kai_range, mu_window, next_kai_boundaries
+from main import app
+
+client = TestClient(app)
+AT = datetime(2025, 3, 1, 12, 34, 56, 789000, tzinfo=timezone.utc)
+_US = timedelta(microseconds=1)
+
+
+def _iso(at: datetime) -> str:
+    return at.isoformat(timespec="microseconds").replace("+00:00", "Z")
+
+
+@pytest.mark.parametrize("start,end", [
+    (AT, AT + timedelta(seconds=30)),
+    (datetime_at_mu(10**13), datetime_at_mu(10**13 + 7)),
+    (datetime_at_mu(-123_456_789), AT),
+])
+def test_mu_window_holds_exactly_the_mus_that_begin_inside(start, end):
+    lo, hi = mu_window(start, end)
+    assert datetime_at_mu(lo) >= start > datetime_at_mu(lo - 1)
+    assert datetime_at_mu(hi - 1) < end <= datetime_at_mu(hi)
+
+
+def test_mu_window_clamps_at_its_limits():
+    m = 10**13 + 12_345
+    # A μpulse beginning exactly at `start` is in, one beginning exactly at `end` is out
+    assert mu_window(datetime_at_mu(m), datetime_at_mu(m + 3)) == (m, m + 3)
+    assert mu_window(datetime_at_mu(m) + _US, datetime_at_mu(m + 3) + _US) == (m + 1, m + 4)
+    lo, hi = mu_window(AT, AT)
+    assert lo == hi   # an empty range holds no μpulse
+
+
+def test_range_over_a_phi_day_yields_every_step_once():
+    day = 400
+    start, end = datetime_at_mu(day * UPULSES_PER_DAY), datetime_at_mu((day + 1) * UPULSES_PER_DAY)
+    samples = list(kai_range(start, end, "step"))
+    assert len(samples) == GRID_BEATS_PER_DAY * GRID_STEPS_PER_BEAT
+    assert [(s["eb"], s["es"]) for s in samples] == [
+        (b, s) for b in range(GRID_BEATS_PER_DAY) for s in range(GRID_STEPS_PER_BEAT)
+    ]
+    times = [s["unixMs"] for s in samples]
+    assert times == sorted(times)
+
+
+@pytest.mark.parametrize("every,frame", [
+    ("pulse", "eternal"), ("step", "solar"), ("beat", "eternal"), ("arc", "solar"),
+])
+def test_range_samples_are_first_mus_inside_the_window(every, frame):
+    start, end = AT, AT + timedelta(hours=6)
+    lo, hi = mu_window(start, end)
+    mus = list(kai_lattice(lo, hi, every, frame))
+    samples = list(kai_range(start, end, every, frame))
+    assert len(samples) == len(mus) > 0
+    assert mus == sorted(mus) and len(set(mus)) == len(mus)
+    for mu, sample in zip(mus, samples):
+        assert sample == {"unixMs": unix_at_mu(mu), **kai_lite_at_mu(mu).model_dump()}
+    if every == "pulse":
+        assert [m // UPULSES_PER_PULSE for m in mus] == list(range(mus[0] // UPULSES_PER_PULSE,
+                                                                   mus[-1] // UPULSES_PER_PULSE + 1))
+
+
+def test_range_with_fields_projects_each_sample():
+    fields = resolve_kai_fields(["kaiPulseEternal", "chakraStepString"])
+    lo, hi = mu_window(AT, AT + timedelta(minutes=5))
+    samples = list(kai_range(AT, AT + timedelta(minutes=5), "step", fields=fields))
+    assert samples == [
+        {"unixMs": unix_at_mu(mu), **get_kai_fields_data_at_mu(fields, mu)}
+        for mu in kai_lattice(lo, hi, "step")
+    ]
+
+
+@pytest.mark.parametrize("unit", ["step", "beat", "arc", "day", "month", "year", "spiral"])
+@pytest.mark.parametrize("frame", ["eternal", "solar"])
+def test_next_boundaries_are_ordered_and_turn_the_unit(unit, frame):
+    count = 2 if unit in ("year", "spiral") else 5
+    found = next_kai_boundaries(unit, count, AT, frame)
+    assert len(found) == count
+    mus = [b["mu"] for b in found]
+    assert mu_since_genesis_int(AT) < mus[0] and mus == sorted(set(mus))
+    assert all(b["unit"] == unit and b["frame"] == frame for b in found)
+    assert [b["unixMs"] for b in found] == [unix_at_mu(m) for m in mus]
+    assert [b["utc"] for b in found] == [_iso(datetime_at_mu(m)) for m in mus]
+    key = {
+        ("step", "eternal"): ("eb", "es"), ("step", "solar"): ("sb", "ss"),
+        ("beat", "eternal"): ("eb",), ("beat", "solar"): ("sb",),
+        ("arc", "eternal"): ("ea",), ("arc", "solar"): ("sa",),
+        ("day", "eternal"): ("d",), ("day", "solar"): ("sd",),
+        ("month", "eternal"): ("m",), ("month", "solar"): ("sm",),
+        ("year", "eternal"): ("y",), ("year", "solar"): ("solarYear",),
+        ("spiral", "eternal"): ("ps",), ("spiral", "solar"): ("ps",),
+    }[unit, frame]
+
+    def value(mu):
+        lite = kai_lite_at_mu(mu).model_dump()
+        lite["solarYear"] = (mu - MU_SUNRISE0) // UPULSES_PER_YEAR   # KaiLite has no solar year
+        return tuple(lite[k] for k in key)
+
+    for mu in mus:
+        assert value(mu) != value(mu - 1)
+    # Nothing turns between now and the first boundary
+    assert value(mu_since_genesis_int(AT)) == value(mus[0] - 1)
+
+
+def test_next_boundaries_bad_input():
+    assert next_kai_boundaries("step", 0, AT) == []
+    for args in (("fortnight", 1, AT), ("step", -1, AT), ("step", 1, AT, "lunar")):
+        with pytest.raises(ValueError):
+            next_kai_boundaries(*args)
+
+
+def test_range_route_streams_ndjson():
+    start, end = AT, AT + timedelta(minutes=2)
+    res = client.get("/kai/range", params={"start": _iso(start), "end": _iso(end), "every": "pulse"})
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in res.text.splitlines()]
+    assert lines == list(kai_range(start, end, "pulse"))
+    bad = client.get("/kai/range", params={"start": _iso(start), "end": _iso(end), "fields": "nope"})
+    assert bad.status_code == 400
+
+
+def test_boundaries_route():
+    res = client.get("/kai/boundaries", params=[("unit", "step"), ("unit", "day"), ("count", 3),
+                                               ("override_time", _iso(AT))])
+    assert res.status_code == 200
+    assert res.json() == next_kai_boundaries("step", 3, AT) + next_kai_boundaries("day", 3, AT)
+    assert client.get("/kai/boundaries", params={"unit": "fortnight"}).status_code == 400
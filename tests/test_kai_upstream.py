@@ -0,0 +1,114 @@
+# tests/test_kai_upstream.py  •  remote Kai source: single flight, stale window, failures
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import fake_upstream
+from kai_klock import get_eternal_klock_data
+from routes import kai_source, kai_upstream as upstream_module
+from routes.kai_upstream import KaiUpstream
+
+AT = "2025-03-01T12:34:56.789000+00:00"
+
+
+@pytest.fixture(autouse=True)
+def fake_state():
+    fake_upstream._state.update(delayMs=0, down=False, hits=0)
+    yield fake_upstream._state
+
+
+def _upstream(**kwargs) -> KaiUpstream:
+    return KaiUpstream(url="http://fake/kai", transport=httpx.ASGITransport(app=fake_upstream.app), **kwargs)
+
+
+def test_concurrent_callers_share_one_fetch(fake_state):
+    fake_state["delayMs"] = 50
+    upstream = _upstream()
+
+    async def run():
+        return await asyncio.gather(*(upstream.get(override_time=AT) for _ in range(10)))
+
+    results = asyncio.run(run())
+    assert fake_state["hits"] == 1
+    assert upstream.stats()["coalesced"] == 9
+    assert all(r is results[0] for r in results)
+    assert results[0] == get_eternal_klock_data(datetime.fromisoformat(AT))
+
+
+def test_fixed_moments_are_keyed_by_exact_mu(fake_state):
+    upstream = _upstream()
+    later = "2025-03-01T12:34:56.889000+00:00"   # same pulse, 100 ms on
+
+    async def run():
+        return await upstream.get(override_time=AT), await upstream.get(override_time=later)
+
+    first, second = asyncio.run(run())
+    assert first["kaiPulseEternal"] == second["kaiPulseEternal"]
+    assert first["eternalSeal"] != second["eternalSeal"]
+    assert fake_state["hits"] == 2
+
+
+def test_now_is_served_stale_within_the_bound_and_revalidated(fake_state):
+    upstream = _upstream(max_stale_pulses=12)
+
+    async def run():
+        fresh = await upstream.get()
+        pulse = fresh["kaiPulseEternal"]
+        upstream._cache["now"] = (pulse - 5, fresh)       # five pulses old
+        stale = await upstream.get()
+        await asyncio.gather(*upstream._inflight.values())  # background refresh
+        return fresh, stale, upstream._cache["now"][0], pulse
+
+    fresh, stale, refreshed_pulse, pulse = asyncio.run(run())
+    assert stale is fresh
+    assert refreshed_pulse >= pulse
+    assert upstream.stats()["stale"] == 1 and fake_state["hits"] == 2
+
+
+def test_outage_past_the_stale_bound_raises(fake_state):
+    upstream = _upstream(max_stale_pulses=3)
+
+    async def run():
+        fresh = await upstream.get()
+        fake_state["down"] = True
+        upstream._cache["now"] = (fresh["kaiPulseEternal"] - 2, fresh)
+        within = await upstream.get()                      # stale but allowed, refresh fails quietly
+        await asyncio.gather(*upstream._inflight.values(), return_exceptions=True)
+        upstream._cache["now"] = (fresh["kaiPulseEternal"] - 4, fresh)
+        with pytest.raises(RuntimeError, match="503"):
+            await upstream.get()
+        return fresh, within
+
+    fresh, within = asyncio.run(run())
+    assert within is fresh
+    assert upstream.stats()["errors"] == 2
+
+
+def test_payload_without_pulse_is_an_upstream_error():
+    def handler(request):
+        return httpx.Response(200, json={"detail": "not Kai"})
+
+    upstream = KaiUpstream(url="http://fake/kai", transport=httpx.MockTransport(handler))
+    with pytest.raises(RuntimeError, match="kaiPulseEternal"):
+        asyncio.run(upstream.get(override_time=AT))
+    assert upstream.stats()["errors"] == 1 and upstream.stats()["size"] == 0
+
+
+def test_sigil_endpoint_reports_upstream_outage(fake_state, monkeypatch):
+    from main import app
+
+    monkeypatch.setattr(kai_source, "KAI_SIGIL_SOURCE", "remote")
+    monkeypatch.setattr(upstream_module, "kai_upstream", _upstream())
+    client = TestClient(app)
+    pulse = 1234
+    ok = client.get("/sigil/stamp", params={"pulse": pulse, "format": "svg"})
+    assert ok.status_code == 200
+    assert ok.content == client.get("/sigil/stamp", params={"pulse": pulse, "format": "svg"}).content
+
+    fake_state["down"] = True
+    down = client.get("/sigil/stamp", params={"pulse": pulse + 1, "format": "svg"})
+    assert down.status_code == 502
+    assert "503" in down.json()["detail"]
@@ -0,0 +1,111 @@
+# tests/test_sigil_http.py  •  sigil validators follow the μpulse that is rendered; shared If-None-Match check
+import re
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+
+from kai_klock import UPULSES_PER_PULSE, datetime_at_mu
+from kai_klock_range import kai_lattice
+from kai_klock_static import etag_matches
+from main import app
+from routes.sigil_http import sigil_headers
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize("path,kind", [("/sigil", "sigil"), ("/sigil/stamp", "stamp")])
+def test_fixed_moments_get_strong_exact_etags(path, kind):
+    by_pulse = client.get(path, params={"pulse": 1234, "format": "svg"})
+    assert by_pulse.headers["etag"] == f'"{kind}-svg-v1-1234"'
+    assert "immutable" in by_pulse.headers["cache-control"]
+
+    # Two instants inside one pulse render different seals, so their tags differ
+    first = client.get(path, params={"override_time": "2025-03-01T12:34:56.789Z", "format": "svg"})
+    second = client.get(path, params={"override_time": "2025-03-01T12:34:57.789Z", "format": "svg"})
+    assert first.headers["etag"].startswith(f'"{kind}-svg-v1-')
+    assert first.headers["etag"] != second.headers["etag"]
+    assert first.content != second.content
+
+    again = client.get(path, params={"override_time": "2025-03-01T12:34:56.789Z", "format": "svg"},
+                       headers={"If-None-Match": first.headers["etag"]})
+    assert again.status_code == 304 and again.content == b""
+
+
+def test_now_gets_a_weak_beat_step_etag():
+    res = client.get("/sigil", params={"format": "svg"})
+    etag = res.headers["etag"]
+    assert re.fullmatch(r'W/"sigil-svg-v1-\d+-\d+\.\d+-\d+\.\d+"', etag)
+    revalidated = client.get("/sigil", params={"format": "svg"}, headers={"If-None-Match": etag})
+    assert revalidated.status_code in (200, 304)  # 200 only when the step or pulse turned in between
+
+
+def test_now_tag_and_max_age_follow_a_step_inside_the_pulse():
+    # First eternal step boundary that falls inside a pulse
+    boundary = next(mu for mu in kai_lattice(10**13, None, "step") if mu % UPULSES_PER_PULSE)
+    pulse_start = boundary - boundary % UPULSES_PER_PULSE
+    before = sigil_headers("sigil", "svg", boundary - 1, False)
+    after = sigil_headers("sigil", "svg", boundary, False)
+    assert before["ETag"] != after["ETag"]
+    assert sigil_headers("sigil", "svg", pulse_start, False)["ETag"] == before["ETag"]
+
+    def max_age(headers):
+        return int(headers["Cache-Control"].rsplit("=", 1)[1])
+
+    # Just before the step turns, the response must not outlive it
+    assert max_age(before) == 0
+    to_next_pulse = datetime_at_mu(pulse_start + UPULSES_PER_PULSE) - datetime_at_mu(boundary)
+    assert max_age(after) <= to_next_pulse.total_seconds()
+
+
+@pytest.fixture
+def fresh_fonts():
+    from routes.kairos_sigil import sigil_fonts
+
+    sigil_fonts.cache_clear()
+    yield sigil_fonts
+    sigil_fonts.cache_clear()
+
+
+def test_sigil_fonts_fall_back_when_the_font_file_is_missing(fresh_fonts, monkeypatch):
+    from routes import kairos_sigil
+
+    monkeypatch.setattr(kairos_sigil, "FONT_PATH", "/nonexistent/font.ttf")
+    large, small = fresh_fonts()
+    assert large is small and large.getbbox("Kai")
+
+
+def test_sigil_fonts_fall_back_without_freetype(fresh_fonts, monkeypatch):
+    from PIL import ImageFont
+
+    def truetype(*args, **kwargs):
+        raise ImportError("The _imagingft C module is not installed")
+
+    monkeypatch.setattr(ImageFont, "truetype", truetype)
+    large, small = fresh_fonts()
+    assert large is small and large.getbbox("Kai")
+
+
+def test_sigil_fonts_without_pillow_raise_import_error(fresh_fonts, monkeypatch):
+    monkeypatch.setitem(sys.modules, "PIL", None)
+    with pytest.raises(ImportError):
+        fresh_fonts()
+
+
+@pytest.mark.parametrize("header,etag,expected", [
+    (None, '"a"', False),
+    ('"a"', '"a"', True),
+    ('W/"a"', '"a"', True),
+    ('"b", W/"a"', 'W/"a"', True),
+    ('"b"', 'W/"a"', False),
+    ("*", '"a"', True),
+])
+def test_etag_matches_compares_weakly(header, etag, expected):
+    assert etag_matches(header, etag) is expected
+
+
+def test_static_documents_revalidate_with_the_shared_helper():
+    first = client.get("/openapi.json")
+    etag = first.headers["etag"]
+    again = client.get("/openapi.json", headers={"If-None-Match": f"W/{etag}"})
+    assert again.status_code == 304 and again.headers["etag"] == etag
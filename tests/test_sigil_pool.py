@@ -0,0 +1,142 @@
+# tests/test_sigil_pool.py  •  sigil render pool bookkeeping and recovery
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from routes import sigil_pool as pool_module
+from routes.sigil_pool import SigilPoolFull, SigilRenderPool
+
+
+class _Refusing:
+    """Executor whose submit raises `exc`."""
+    def __init__(self, exc):
+        self.exc = exc
+        self.shut_down = False
+
+    def submit(self, *args, **kwargs):
+        raise self.exc
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+class _BreaksOnResult(_Refusing):
+    """Executor whose renders fail as if the worker process died."""
+    def submit(self, *args, **kwargs):
+        fut = Future()
+        fut.set_exception(BrokenProcessPool("worker died"))
+        return fut
+
+
+def _slow_square(x):
+    time.sleep(0.01)
+    return x * x
+
+
+def test_submit_failure_releases_the_slot():
+    pool = SigilRenderPool(workers=0, queue=0)
+    pool._executor = _Refusing(RuntimeError("cannot submit"))
+    with pytest.raises(RuntimeError):
+        asyncio.run(pool.render(pow, 2, 3))
+    assert pool.pending == 0 and pool.failed == 1
+
+
+def test_broken_pool_at_submit_is_replaced():
+    pool = SigilRenderPool(workers=0, queue=0)
+    broken = pool._executor = _Refusing(BrokenProcessPool("gone"))
+    assert asyncio.run(pool.render(pow, 2, 10)) == 1024
+    assert broken.shut_down and isinstance(pool._executor, ThreadPoolExecutor)
+    assert pool.pending == 0
+
+
+def test_broken_pool_on_result_is_dropped():
+    pool = SigilRenderPool(workers=0, queue=0)
+    broken = pool._executor = _BreaksOnResult(None)
+    with pytest.raises(BrokenProcessPool):
+        asyncio.run(pool.render(pow, 2, 3))
+    assert pool._executor is None and broken.shut_down
+    assert pool.pending == 0
+    assert asyncio.run(pool.render(pow, 2, 3)) == 8
+
+
+def test_falls_back_to_a_thread_when_processes_cannot_start(monkeypatch):
+    def no_semaphores(*args, **kwargs):
+        raise OSError(38, "Function not implemented")
+
+    monkeypatch.setattr(pool_module, "ProcessPoolExecutor", no_semaphores)
+    pool = SigilRenderPool(workers=2, queue=2)
+    assert asyncio.run(pool.render(pow, 3, 2)) == 9
+    assert isinstance(pool._executor, ThreadPoolExecutor)
+    assert "OSError" in pool.stats()["fallback"]
+
+
+def test_falls_back_to_a_thread_when_workers_cannot_spawn(monkeypatch):
+    class NoSpawn(_Refusing):
+        def __init__(self, **kwargs):
+            super().__init__(OSError(28, "No space left on device"))
+
+    monkeypatch.setattr(pool_module, "ProcessPoolExecutor", NoSpawn)
+    pool = SigilRenderPool(workers=2, queue=2)
+    assert asyncio.run(pool.render(pow, 3, 3)) == 27
+    assert isinstance(pool._executor, ThreadPoolExecutor)
+    assert pool.fallback and pool.pending == 0
+
+
+def test_batch_window_respects_capacity():
+    pool = SigilRenderPool(workers=0, queue=1)   # capacity 2
+    seen = []
+
+    async def run():
+        out = []
+        async for value in pool.render_ordered(_slow_square, ((i,) for i in range(12)), window=8):
+            seen.append(pool.pending)
+            out.append(value)
+        return out
+
+    assert asyncio.run(run()) == [i * i for i in range(12)]
+    assert max(seen) <= pool.capacity and pool.pending == 0
+
+
+def test_batch_waits_for_room_and_single_renders_are_rejected():
+    pool = SigilRenderPool(workers=0, queue=0)   # capacity 1
+
+    async def run():
+        single = asyncio.create_task(pool.render(_slow_square, 7))
+        await asyncio.sleep(0)                   # the single render holds the only slot
+        with pytest.raises(SigilPoolFull):
+            pool.check_capacity()
+        batch = [value async for value in pool.render_ordered(_slow_square, ((i,) for i in range(3)))]
+        return await single, batch
+
+    assert asyncio.run(run()) == (49, [0, 1, 4])
+    assert pool.pending == 0 and pool.rejected == 1
+
+
+def test_batch_submit_failure_releases_every_slot():
+    pool = SigilRenderPool(workers=0, queue=4)
+
+    def args():
+        yield (1,)
+        yield (2,)
+        pool._executor = _Refusing(RuntimeError("cannot submit"))
+        yield (3,)
+
+    async def run():
+        return [value async for value in pool.render_ordered(_slow_square, args(), window=4)]
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(run())
+    assert pool.pending == 0
+
+
+def test_process_pool_renders():
+    pool = SigilRenderPool(workers=1, queue=1)
+    try:
+        assert asyncio.run(pool.render(pow, 2, 5)) == 32
+        assert pool.pending == 0
+    finally:
+        if pool._executor is not None:
+            pool._executor.shutdown()